@@ -10,12 +10,14 @@ Version: 1.0.0
 
 import os
 import sys
+import shutil
+import atexit
+import tempfile
 import logging
 import traceback
-from datetime import datetime
 from functools import lru_cache
-from werkzeug.utils import secure_filename
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from typing import Any, Dict, Tuple
+from flask import Flask, Request, render_template, request, jsonify, redirect, url_for
 
 # Configure logging
 logging.basicConfig(
@@ -25,21 +27,66 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import custom modules
+import config
 from utils.resume_parser import ResumeParser
-from utils.skill_extractor import SkillExtractor
+from utils.skill_extractor import IncrementalSkillExtractor, SkillExtractor, skill_cache, taxonomy_manager
 from utils.matcher import SkillMatcher
+from utils.ranking import resume_corpus, ranking_engine
+from utils.inverted_index import resume_index
+from utils.parse_cache import ParsedResume, content_digest, parse_cache
+from utils.metrics import performance_metrics
+from utils.job_queue import JobQueueClosed, JobQueueFull, analysis_queue, execution_to_dict
+from utils.database import create_database_manager
+from utils.exceptions import DatabaseError, MatchingError, ResumeAnalyzerException, ValidationException
 
 # Configuration constants
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
 MIN_JOB_DESC_LENGTH = 10
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 1000
 ALLOWED_EXTENSIONS = {'pdf'}
 UPLOAD_FOLDER = os.path.join(os.getcwd(), 'uploads')
 
+class SpooledUploadRequest(Request):
+    """
+    Request that keeps uploads in memory up to UPLOAD_SPOOL_THRESHOLD bytes
+    and spills larger ones to an anonymous temporary file
+    """
+    
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(
+            max_size=config.UPLOAD_SPOOL_THRESHOLD, mode='w+b'
+        )
+
+
 # Flask Application Setup
 app = Flask(__name__)
+app.request_class = SpooledUploadRequest
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# Compile the skill taxonomy at startup and hot-reload it when its file changes
+taxonomy_manager.current
+taxonomy_manager.start_watching()
+
+# Persist the resume search index on shutdown
+atexit.register(resume_index.close)
+atexit.register(analysis_queue.shutdown, wait=False)
+
+# Optional persistence of resume skill sets and analysis results
+database = create_database_manager() if config.DATABASE_ENABLED else None
+if database is not None:
+    atexit.register(database.disconnect)
+
+# Rebuild the in-memory ranking corpus and skill index from stored resumes
+# after a restart
+if database is not None:
+    resume_index.sync(database)
+    resume_corpus.sync(database, taxonomy_manager.current)
+else:
+    resume_corpus.add_named(resume_index.documents(), taxonomy_manager.current)
+
 
 def allowed_file(filename):
     """Check if file has allowed extension"""
@@ -99,48 +146,129 @@ def analyze():
                 'error': f'Job description must be at least {MIN_JOB_DESC_LENGTH} characters'
             }), 400
         
-        # Create uploads directory if it doesn't exist
-        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+        # Asynchronous mode: queue the work and return a job ID at once. The
+        # upload stream closes with the request, so it is copied to a
+        # temporary file that the job deletes when it is done
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            fd, resume_path = tempfile.mkstemp(suffix='.pdf')
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(resume_file.stream, f)
+            try:
+                job_id = analysis_queue.submit(run_analysis_job, resume_path, job_description)
+            except JobQueueFull as e:
+                os.remove(resume_path)
+                return jsonify({
+                    'success': False,
+                    'error': 'Analysis queue is full, please retry later'
+                }), 429, {'Retry-After': str(e.retry_after)}
+            except JobQueueClosed:
+                os.remove(resume_path)
+                return jsonify({
+                    'success': False,
+                    'error': 'Analysis queue is unavailable'
+                }), 503, {'Retry-After': str(analysis_queue.retry_after())}
+            
+            status_url = url_for('get_job', job_id=job_id)
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'status': 'pending',
+                'status_url': status_url
+            }), 202, {'Location': status_url}
+        
+        analysis_result, status = run_analysis(resume_file.stream, job_description)
+        return jsonify(analysis_result), status
+    
+    except Exception as e:
+        # Log error for debugging
+        logger.error(f"Error during analysis: {str(e)}", exc_info=True)
         
-        # Save uploaded file with timestamp
-        filename = secure_filename(resume_file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_')
-        filename = f"{timestamp}{filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        resume_file.save(file_path)
+        return jsonify({
+            'success': False,
+            'error': 'An unexpected error occurred during analysis'
+        }), 500
+
+
+def run_analysis(resume_source, job_description: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse, extract and match one resume against a job description
+    
+    Shared by the synchronous /analyze response and background jobs.
+    
+    Args:
+        resume_source: PDF as a seekable binary stream or bytes (parsed in place)
+        job_description (str): Validated job description
         
-        # Step 1: Parse resume
-        parse_result = ResumeParser.parse_resume(file_path)
+    Returns:
+        tuple: (response payload, HTTP status code)
+    """
+    try:
+        # Step 1: Parse the resume in place, skipping the PDF entirely for
+        # content seen before
+        resume_id = content_digest(resume_source)
         
-        if not parse_result['success']:
-            return jsonify({
-                'success': False,
-                'error': f"Failed to parse resume: {parse_result['error']}"
-            }), 400
+        # One taxonomy snapshot for the whole request so skill IDs stay
+        # consistent across a hot reload
+        taxonomy = SkillExtractor.get_taxonomy()
+        cached = parse_cache.get(resume_id)
         
-        resume_text = parse_result['cleaned_text']
+        if cached is None:
+            # Skills are extracted page by page while parsing, and parsing
+            # stops at the configured page/character budget
+            extractor = IncrementalSkillExtractor(taxonomy)
+            parse_result = ResumeParser.parse_resume_stream(
+                resume_source,
+                extractor=extractor,
+                max_pages=config.PDF_MAX_PAGES,
+                max_chars=config.PDF_MAX_CHARS
+            )
+            
+            if not parse_result['success']:
+                return {
+                    'success': False,
+                    'error': f"Failed to parse resume: {parse_result['error']}"
+                }, 400
+            
+            resume_text = parse_result['cleaned_text']
+            resume_skills = extractor.finish()
+        elif cached.taxonomy == taxonomy.fingerprint:
+            resume_text = cached.cleaned_text
+            resume_skills = cached.skill_ids
+        else:
+            # Step 2: Re-extract canonical skill IDs after a taxonomy change
+            resume_text = cached.cleaned_text
+            resume_skills = SkillExtractor.extract_skill_ids(resume_text, taxonomy)
         
-        # Step 2: Extract skills from resume
-        resume_skills = SkillExtractor.extract_from_resume(resume_text)
+        if cached is None or cached.taxonomy != taxonomy.fingerprint:
+            parse_cache.put(resume_id, ParsedResume(
+                cleaned_text=resume_text,
+                skill_ids=resume_skills,
+                taxonomy=taxonomy.fingerprint
+            ))
         
         # Step 3: Extract skills from job description
-        job_text = job_description.lower()
-        job_skills = SkillExtractor.extract_from_job_description(job_text)
+        job_text = ResumeParser.clean_text(job_description)
+        job_skills = SkillExtractor.extract_skill_ids(job_text, taxonomy)
         
         if not job_skills:
-            return jsonify({
+            return {
                 'success': False,
                 'error': 'No recognized skills found in job description'
-            }), 400
+            }, 400
         
         if not resume_skills:
-            return jsonify({
+            return {
                 'success': False,
                 'error': 'No recognized skills found in resume'
-            }), 400
+            }, 400
         
         # Step 4: Match resume with job
-        match_result = SkillMatcher.match_resume(resume_skills, job_skills)
+        match_result = SkillMatcher.match_skill_sets(resume_skills, job_skills, taxonomy)
+        
+        # Store the extracted skills for ranking (keyed by file content)
+        resume_corpus.add(resume_id, resume_skills, taxonomy)
+        resume_index.add(resume_id, taxonomy.to_names(resume_skills))
+        resume_index.maybe_save()
         
         # Step 5: Get match level
         match_level = SkillMatcher.get_match_level(match_result['match_percentage'])
@@ -148,6 +276,7 @@ def analyze():
         # Prepare response
         analysis_result = {
             'success': True,
+            'resume_id': resume_id,
             'match_percentage': match_result['match_percentage'],
             'match_level': match_level,
             'matched_skills': match_result['matched_skills'],
@@ -158,25 +287,221 @@ def analyze():
             'missing_count': match_result['missing_count']
         }
         
-        # Clean up uploaded file
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as cleanup_error:
-            logger.warning(f"Failed to remove temporary file {file_path}: {cleanup_error}")
+        if database is not None:
+            try:
+                database.save_resume(
+                    resume_id,
+                    taxonomy.to_names(resume_skills),
+                    taxonomy=taxonomy.fingerprint,
+                    text_length=len(resume_text)
+                )
+                database.save_analysis(resume_id, job_description, analysis_result)
+            except DatabaseError as e:
+                # Persistence is best effort; the analysis itself succeeded
+                logger.warning(f"Could not store analysis for {resume_id}: {str(e)}")
         
-        return jsonify(analysis_result)
+        return analysis_result, 200
     
     except Exception as e:
-        # Log error for debugging
         logger.error(f"Error during analysis: {str(e)}", exc_info=True)
         
-        return jsonify({
+        return {
             'success': False,
             'error': 'An unexpected error occurred during analysis'
+        }, 500
+
+
+def run_analysis_job(resume_path: str, job_description: str) -> Dict[str, Any]:
+    """
+    Background job body for /analyze?async=1
+    
+    Args:
+        resume_path: Temporary copy of the upload (deleted by the job)
+        job_description (str): Validated job description
+        
+    Returns:
+        dict: Analysis payload (the job result)
+        
+    Raises:
+        ResumeAnalyzerException: With the analysis error, failing the job
+    """
+    try:
+        with open(resume_path, 'rb') as resume_file:
+            analysis_result, _ = run_analysis(resume_file, job_description)
+    finally:
+        os.remove(resume_path)
+    if not analysis_result['success']:
+        raise ResumeAnalyzerException(analysis_result['error'])
+    return analysis_result
+
+
+@app.route('/api/v2/batch-analyze', methods=['POST'])
+def batch_analyze():
+    """
+    Rank stored resumes against a job description
+    
+    JSON body:
+        job_description (str): Job description text
+        top_k (int): Number of candidates to return (default 10)
+        method (str): Scoring method (default: config MATCHING_METHOD)
+        resumes (list): Optional resumes to add to the corpus first, each
+            {"id": str, "text": str} or {"id": str, "skills": [str, ...]}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        job_description = (data.get('job_description') or '').strip()
+        
+        if len(job_description) < MIN_JOB_DESC_LENGTH:
+            return jsonify({
+                'success': False,
+                'error': f'Job description must be at least {MIN_JOB_DESC_LENGTH} characters'
+            }), 400
+        
+        try:
+            top_k = int(data.get('top_k', DEFAULT_TOP_K))
+        except (TypeError, ValueError):
+            top_k = 0
+        if not 1 <= top_k <= MAX_TOP_K:
+            return jsonify({
+                'success': False,
+                'error': f'top_k must be between 1 and {MAX_TOP_K}'
+            }), 400
+        
+        resumes = data.get('resumes') or []
+        if not isinstance(resumes, list) or not all(
+            isinstance(r, dict) and r.get('id') for r in resumes
+        ):
+            return jsonify({
+                'success': False,
+                'error': 'resumes must be a list of objects with an id'
+            }), 400
+        
+        taxonomy = SkillExtractor.get_taxonomy()
+        if database is not None:
+            # Pick up resumes analysed by other workers
+            try:
+                resume_corpus.sync(database, taxonomy)
+            except DatabaseError as e:
+                logger.warning(f"Could not sync resume corpus: {str(e)}")
+        for resume in resumes:
+            if resume.get('skills') is not None:
+                skill_ids = SkillMatcher.to_skill_ids(resume['skills'], taxonomy)
+            else:
+                skill_ids = SkillExtractor.extract_skill_ids(
+                    ResumeParser.clean_text(resume.get('text') or ''), taxonomy
+                )
+            resume_corpus.add(str(resume['id']), skill_ids, taxonomy)
+        
+        job_skills = SkillExtractor.extract_skill_ids(ResumeParser.clean_text(job_description), taxonomy)
+        if not job_skills:
+            return jsonify({
+                'success': False,
+                'error': 'No recognized skills found in job description'
+            }), 400
+        
+        try:
+            candidates = ranking_engine.rank(job_skills, top_k, data.get('method'), taxonomy)
+        except MatchingError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'required_skills': SkillMatcher.to_skill_names(job_skills, taxonomy),
+            'corpus_size': len(resume_corpus),
+            'candidates': [
+                dict(candidate.to_dict(),
+                     match_level=SkillMatcher.get_match_level(candidate.score))
+                for candidate in candidates
+            ]
+        })
+    
+    except Exception as e:
+        logger.error(f"Error during batch analysis: {str(e)}", exc_info=True)
+        
+        return jsonify({
+            'success': False,
+            'error': 'An unexpected error occurred during batch analysis'
         }), 500
 
 
+@app.route('/api/v2/resumes/search')
+def search_resumes():
+    """
+    Find analysed resumes by a boolean skill query
+    
+    Query parameters:
+        q (str): e.g. "kafka AND spark AND NOT hadoop"
+        limit (int): Maximum number of resume IDs to return (default 100)
+    """
+    query = (request.args.get('q') or '').strip()
+    if not query:
+        return jsonify({
+            'success': False,
+            'error': 'No query provided'
+        }), 400
+    
+    limit = request.args.get('limit', 100, type=int)
+    
+    if database is not None:
+        # Pick up resumes analysed by other workers
+        try:
+            resume_index.sync(database)
+        except DatabaseError as e:
+            logger.warning(f"Could not sync resume index: {str(e)}")
+    
+    try:
+        resume_ids = resume_index.search(query, SkillExtractor.get_taxonomy())
+    except ValidationException as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid query: {str(e)}'
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'total': len(resume_ids),
+        'resume_ids': resume_ids[:max(limit, 0)]
+    })
+
+
+@app.route('/api/v2/jobs/<job_id>')
+def get_job(job_id):
+    """
+    Poll an asynchronous analysis job
+    
+    Returns the job status (pending, running, completed or failed); the
+    analysis payload is in "result" once completed.
+    """
+    job = analysis_queue.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found or expired'
+        }), 404
+    
+    return jsonify({'success': True, **execution_to_dict(job)})
+
+
+@app.route('/api/v2/stats')
+def stats():
+    """
+    API endpoint exposing performance timings and cache counters
+    """
+    return jsonify({
+        'success': True,
+        'performance': performance_metrics.get_summary(),
+        'counters': performance_metrics.get_counters(),
+        'parse_cache_size': len(parse_cache),
+        'skill_cache': skill_cache.stats(),
+        'resume_corpus_size': len(resume_corpus),
+        'resume_index_size': len(resume_index),
+        'analysis_jobs': analysis_queue.stats()
+    })
+
+
 @app.route('/api/sample-data')
 def sample_data():
     """
@@ -0,0 +1,97 @@
+"""
+Cache Benchmark
+Hit rate and memory use of SimpleCache under a byte budget with the 'lru'
+and 'gdsf' eviction policies, on a skewed workload of resume-like payloads
+from 1 KB to several MB, plus the accuracy of estimate_size against
+tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_cache [--budget-mb 16] [--requests 20000]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from utils.cache import EVICTION_POLICIES, SimpleCache, estimate_size
+
+
+def make_payload(rng: random.Random, size: int) -> Dict[str, Any]:
+    """Analysis-result-like value with roughly ``size`` bytes of text."""
+    return {
+        'cleaned_text': 'x' * size,
+        'skills': [f'skill-{rng.randrange(500)}' for _ in range(30)],
+        'match_percentage': rng.random() * 100,
+    }
+
+
+def payload_sizes(rng: random.Random, keys: int) -> List[int]:
+    """Mostly small payloads with a long tail of multi-MB ones."""
+    return [min(int(rng.lognormvariate(9.5, 1.6)), 8 * 1024 * 1024) + 1024 for _ in range(keys)]
+
+
+def measured_size(build: Callable[[], Any]) -> int:
+    """Bytes allocated while building a value (kept alive)."""
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def check_estimates(rng: random.Random) -> None:
+    """Compare estimate_size with tracemalloc for a few payload sizes."""
+    print(f"{'payload':>10} {'estimated':>10} {'measured':>10} {'ratio':>6}")
+    for size in (1024, 64 * 1024, 1024 * 1024):
+        value = make_payload(rng, size)
+        estimated = estimate_size(value)
+        measured = measured_size(lambda: make_payload(random.Random(0), size))
+        print(f"{size:>10} {estimated:>10} {measured:>10} {estimated / measured:>6.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--budget-mb', type=float, default=16)
+    parser.add_argument('--keys', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--zipf', type=float, default=1.1, help='popularity skew')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    check_estimates(rng)
+
+    sizes = payload_sizes(rng, args.keys)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.keys)]
+    # Popularity is independent of size
+    rng.shuffle(sizes)
+    requests = rng.choices(range(args.keys), weights=weights, k=args.requests)
+    budget = int(args.budget_mb * 1024 * 1024)
+    print(f"\n{args.keys} keys ({sum(sizes) / 2 ** 20:.0f} MB total), {args.requests} requests, "
+          f"budget {args.budget_mb:.0f} MB")
+    print(f"{'policy':>6} {'hit rate':>9} {'byte hit':>9} {'used MB':>8} {'evictions':>10} {'us/op':>7}")
+
+    for policy in EVICTION_POLICIES:
+        # Values stand in for payloads of the given size without allocating them
+        cache = SimpleCache(max_entries=None, max_bytes=budget, policy=policy, stripes=4,
+                            size_of=lambda value: value)
+        hit_bytes = 0
+        start = time.perf_counter()
+        for key in requests:
+            if cache.get(key) is not None:
+                hit_bytes += sizes[key]
+            else:
+                cache.set(key, sizes[key])
+        elapsed = time.perf_counter() - start
+
+        stats = cache.stats()
+        total_bytes = sum(sizes[key] for key in requests)
+        print(f"{policy:>6} {stats['hit_rate']:>8.1f}% {hit_bytes / total_bytes * 100:>8.1f}% "
+              f"{stats['bytes'] / 2 ** 20:>8.1f} {stats['evictions']:>10} "
+              f"{elapsed / args.requests * 1e6:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
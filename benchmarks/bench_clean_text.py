@@ -0,0 +1,63 @@
+"""
+Text Cleaning Benchmark
+Throughput in MB/s of the single-pass translate normaliser against the
+original three-regex clean_text. Their equivalence on random text is
+checked by tests/test_clean_text.py.
+
+Usage:
+    python -m benchmarks.bench_clean_text [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import timeit
+
+from utils.resume_parser import ResumeParser
+
+DOCUMENT_SIZES = (10_000, 100_000, 1_000_000)
+
+SAMPLE_WORDS = (
+    'Senior', 'Python/Django', 'engineer,', '(5+', 'yrs)', 'C#', '&', 'C++;',
+    'node.js', 'REST-API', '@', 'ACME', 'Inc.', '•', 'Kubernetes\n\n',
+)
+
+
+def legacy_clean_text(text: str) -> str:
+    """clean_text as it was before the translate table was introduced."""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s\.\-\+\#\@]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def build_document(size: int, seed: int = 42) -> str:
+    """Resume-like text of roughly ``size`` characters."""
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(SAMPLE_WORDS) for _ in range(size // 6))[:size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'chars':>9} {'legacy MB/s':>12} {'translate MB/s':>15} {'speedup':>8}")
+    for size in DOCUMENT_SIZES:
+        text = build_document(size)
+        assert ResumeParser.clean_text(text) == legacy_clean_text(text), 'result mismatch'
+
+        megabytes = len(text.encode('utf-8')) / 1e6
+        number = max(1, 1_000_000 // size)
+        legacy = min(timeit.repeat(lambda: legacy_clean_text(text),
+                                   number=number, repeat=args.repeat)) / number
+        single = min(timeit.repeat(lambda: ResumeParser.clean_text(text),
+                                   number=number, repeat=args.repeat)) / number
+        print(f"{size:>9} {megabytes / legacy:>12.1f} {megabytes / single:>15.1f} {legacy / single:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Connection Pool Benchmark
+Checkout latency and throughput of ConnectionPool under contention (64
+threads by default) compared with the previous sleep-polling pool, which
+re-checked for a free connection every 100 ms.
+
+Each thread repeatedly checks out a connection, runs a small query, holds
+the connection for --hold-ms and returns it.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [--threads 64] [--pool-size 8] [--max-overflow 0]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+from utils.database import ConnectionConfig, ConnectionPool
+
+
+class PollingPool(ConnectionPool):
+    """ConnectionPool checkout as it was before the condition variable."""
+
+    def get_connection(self, timeout=None):
+        timeout = timeout or self.config.pool_timeout
+        start_time = time.time()
+
+        while (time.time() - start_time) < timeout:
+            if self.available:
+                conn = self.available.pop()
+                self.in_use.add(conn)
+                return conn
+            time.sleep(0.1)
+
+        raise TimeoutError(f"Could not get connection within {timeout}s")
+
+    def return_connection(self, conn):
+        self.in_use.discard(conn)
+        self.available.append(conn)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(pool: ConnectionPool, threads: int, checkouts: int, hold: float) -> Dict[str, float]:
+    """Hammer a pool from many threads and collect checkout wait times."""
+    waits: List[float] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        local = []
+        barrier.wait()
+        for _ in range(checkouts):
+            start = time.perf_counter()
+            conn = pool.get_connection()
+            local.append(time.perf_counter() - start)
+            try:
+                conn.connection.execute('SELECT 1').fetchone()
+                time.sleep(hold)
+            finally:
+                pool.return_connection(conn)
+        with lock:
+            waits.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    cpu_start = time.process_time()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'checkouts_per_s': len(waits) / elapsed,
+        'p50_ms': percentile(waits, 0.50) * 1000,
+        'p99_ms': percentile(waits, 0.99) * 1000,
+        'max_ms': max(waits) * 1000,
+        'cpu_s': time.process_time() - cpu_start,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=64)
+    parser.add_argument('--checkouts', type=int, default=50, help='per thread')
+    parser.add_argument('--pool-size', type=int, default=8)
+    parser.add_argument('--max-overflow', type=int, default=0)
+    parser.add_argument('--hold-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.checkouts} checkouts, pool_size={args.pool_size}, "
+          f"max_overflow={args.max_overflow}, hold={args.hold_ms} ms")
+    print(f"{'pool':>10} {'checkouts/s':>12} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'CPU s':>6}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        connection_config = ConnectionConfig(
+            database=os.path.join(directory, 'bench.db'),
+            pool_size=args.pool_size,
+            max_overflow=args.max_overflow,
+            pool_timeout=120
+        )
+        for name, pool_class in (('polling', PollingPool), ('condition', ConnectionPool)):
+            pool = pool_class(connection_config)
+            pool.initialize()
+            try:
+                result = run(pool, args.threads, args.checkouts, args.hold_ms / 1000)
+            finally:
+                pool.close_all()
+            print(f"{name:>10} {result['checkouts_per_s']:>12.0f} {result['p50_ms']:>8.2f} "
+                  f"{result['p99_ms']:>8.2f} {result['max_ms']:>8.1f} {result['cpu_s']:>6.2f}")
+
+
+if __name__ == '__main__':
+    main()
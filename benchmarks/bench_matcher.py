@@ -0,0 +1,72 @@
+"""
+Skill Matcher Benchmark
+Per-call cost of the legacy three-pass match_resume versus the single-pass
+match_resume and the pre-normalised match_skill_sets API.
+
+Usage:
+    python -m benchmarks.bench_matcher
+"""
+
+import argparse
+import random
+import timeit
+from typing import Dict, List
+
+from utils.matcher import SkillMatcher
+from utils.skill_extractor import SkillExtractor
+
+
+def legacy_match_resume(resume_skills: List[str], job_skills: List[str]) -> Dict:
+    """Previous implementation: three helpers, six set builds per call."""
+    def _sets():
+        return ({s.lower() for s in resume_skills}, {s.lower() for s in job_skills})
+
+    resume_set, job_set = _sets()
+    matched = sorted(resume_set & job_set)
+    resume_set, job_set = _sets()
+    missing = sorted(job_set - resume_set)
+    resume_set, job_set = _sets()
+    percentage = round(len(resume_set & job_set) / len(job_set) * 100, 2)
+    return {
+        'match_percentage': percentage,
+        'matched_skills': matched,
+        'missing_skills': missing,
+        'resume_skills_count': len(resume_skills),
+        'required_skills_count': len(job_skills),
+        'matched_count': len(matched),
+        'missing_count': len(missing)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resume-skills', type=int, default=40)
+    parser.add_argument('--job-skills', type=int, default=15)
+    parser.add_argument('--number', type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    taxonomy = SkillExtractor.get_taxonomy()
+    vocabulary = list(taxonomy.names)
+    resume_skills = rng.sample(vocabulary, args.resume_skills)
+    job_skills = rng.sample(vocabulary, args.job_skills)
+    resume_ids = SkillMatcher.to_skill_ids(resume_skills, taxonomy)
+    job_ids = SkillMatcher.to_skill_ids(job_skills, taxonomy)
+
+    expected = legacy_match_resume(resume_skills, job_skills)
+    assert SkillMatcher.match_resume(resume_skills, job_skills) == expected
+    assert SkillMatcher.match_skill_sets(resume_ids, job_ids, taxonomy) == expected
+
+    cases = [
+        ('legacy match_resume', lambda: legacy_match_resume(resume_skills, job_skills)),
+        ('match_resume', lambda: SkillMatcher.match_resume(resume_skills, job_skills)),
+        ('match_skill_sets', lambda: SkillMatcher.match_skill_sets(resume_ids, job_ids, taxonomy)),
+    ]
+    print(f"{args.resume_skills} resume skills, {args.job_skills} job skills")
+    for name, func in cases:
+        per_call = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+        print(f"{name:<22} {per_call * 1e6:>8.2f} us/call")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+PDF Backend Benchmark
+Compares the installed PDF extraction backends for speed and text fidelity,
+used to choose config.PDF_EXTRACTION_METHOD for a deployment.
+
+Fidelity is the word-level F1 of each backend's cleaned page text against
+the known text of the synthetic fixtures, or against the reference backend
+for a directory of real PDFs, plus agreement of the extracted skill sets.
+
+Usage:
+    python -m benchmarks.bench_pdf_backends [--corpus DIR] [--reference pypdf2]
+"""
+
+import argparse
+import glob
+import os
+import time
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks.pdf_fixtures import build_pdf, resume_pages
+from utils.pdf_backends import PdfBackend, available_pdf_backends, get_pdf_backend
+from utils.resume_parser import ResumeParser
+from utils.skill_extractor import SkillExtractor
+
+FIXTURE_PAGE_COUNTS = (1, 2, 5, 20)
+
+
+def word_f1(actual: str, expected: str) -> float:
+    """Word-level F1 of two cleaned texts (bag of words)."""
+    actual_words = Counter(actual.split())
+    expected_words = Counter(expected.split())
+    overlap = sum((actual_words & expected_words).values())
+    if not overlap:
+        return 1.0 if not actual_words and not expected_words else 0.0
+    precision = overlap / sum(actual_words.values())
+    recall = overlap / sum(expected_words.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def skill_agreement(actual: str, expected: str) -> float:
+    """Jaccard similarity of the skills found in two cleaned texts."""
+    actual_skills = SkillExtractor.extract_skill_ids(actual)
+    expected_skills = SkillExtractor.extract_skill_ids(expected)
+    union = actual_skills | expected_skills
+    return len(actual_skills & expected_skills) / len(union) if union else 1.0
+
+
+def extract_pages(backend: PdfBackend, data: bytes) -> List[str]:
+    """Cleaned text of every page of a document."""
+    document = backend.open(data)
+    try:
+        return [
+            ResumeParser.clean_text(backend.page_text(document, i))
+            for i in range(backend.page_count(document))
+        ]
+    finally:
+        backend.close(document)
+
+
+def build_corpus(directory: str, reference: PdfBackend) -> List[Tuple[str, bytes, List[str]]]:
+    """
+    (name, PDF bytes, expected cleaned page texts) for every document
+
+    Synthetic fixtures carry their own text; real PDFs use the reference
+    backend's output as the expected text.
+    """
+    corpus = []
+    for page_count in FIXTURE_PAGE_COUNTS:
+        pages = resume_pages(page_count)
+        corpus.append((
+            f'fixture-{page_count}p',
+            build_pdf(pages),
+            [ResumeParser.clean_text(page) for page in pages]
+        ))
+
+    if directory:
+        for path in sorted(glob.glob(os.path.join(directory, '*.pdf'))):
+            with open(path, 'rb') as f:
+                data = f.read()
+            corpus.append((os.path.basename(path), data, extract_pages(reference, data)))
+    return corpus
+
+
+def measure(backend: PdfBackend, corpus: Sequence[Tuple[str, bytes, List[str]]],
+            repeat: int) -> Dict[str, float]:
+    """Time a backend over the corpus and score its output."""
+    pages = 0
+    seconds = 0.0
+    f1_scores = []
+    agreement = []
+    for _, data, expected in corpus:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            actual = extract_pages(backend, data)
+            best = min(best, time.perf_counter() - start)
+        seconds += best
+        pages += len(expected)
+
+        actual_text = ' '.join(actual)
+        expected_text = ' '.join(expected)
+        f1_scores.append(word_f1(actual_text, expected_text))
+        agreement.append(skill_agreement(actual_text, expected_text))
+
+    return {
+        'ms_per_page': seconds * 1000 / max(pages, 1),
+        'word_f1': sum(f1_scores) / len(f1_scores),
+        'skill_agreement': sum(agreement) / len(agreement),
+        'worst_skill_agreement': min(agreement),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--corpus', default=None,
+                        help='directory of real PDFs to add to the synthetic fixtures')
+    parser.add_argument('--reference', default='pypdf2',
+                        help='backend whose output is the expected text for real PDFs')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    backends = available_pdf_backends()
+    reference = get_pdf_backend(args.reference)
+    corpus = build_corpus(args.corpus, reference)
+    print(f"Backends: {', '.join(sorted(backends))}")
+    print(f"Corpus: {len(corpus)} documents, {sum(len(pages) for _, _, pages in corpus)} pages")
+
+    print(f"{'backend':>10} {'ms/page':>8} {'word F1':>8} {'skills':>7} {'worst':>6}")
+    results = {}
+    for name, backend in sorted(backends.items()):
+        results[name] = result = measure(backend, corpus, args.repeat)
+        print(f"{name:>10} {result['ms_per_page']:>8.2f} {result['word_f1']:>8.3f} "
+              f"{result['skill_agreement']:>7.3f} {result['worst_skill_agreement']:>6.3f}")
+
+    # Only backends that find the same skills are candidates
+    faithful = [name for name, result in results.items() if result['worst_skill_agreement'] >= 0.99]
+    if faithful:
+        fastest = min(faithful, key=lambda name: results[name]['ms_per_page'])
+        print(f"Suggested PDF_EXTRACTION_METHOD = '{fastest}'")
+    else:
+        print("No backend matched the expected skills on every document; keep 'pypdf2'")
+
+
+if __name__ == '__main__':
+    main()
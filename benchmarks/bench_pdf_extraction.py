@@ -0,0 +1,65 @@
+"""
+PDF Extraction Benchmark
+Sequential versus process-pool page extraction across page counts, used to
+tune config.PDF_PARALLEL_PAGE_THRESHOLD for a deployment.
+
+Usage:
+    python -m benchmarks.bench_pdf_extraction [--workers N]
+"""
+
+import argparse
+import time
+
+import config
+from benchmarks.pdf_fixtures import build_resume_pdf
+from utils.resume_parser import ResumeParser
+
+PAGE_COUNTS = (1, 2, 4, 8, 12, 16, 24, 32, 40, 64)
+
+
+def _time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: config / cpu count)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.workers:
+        config.PDF_PARALLEL_WORKERS = args.workers
+    workers = ResumeParser.parallel_workers()
+    print(f"Workers: {workers}")
+
+    # Start the pool outside the timed region
+    warmup = build_resume_pdf(2)
+    ResumeParser.extract_text(warmup, parallel=True)
+
+    print(f"{'pages':>6} {'sequential ms':>14} {'parallel ms':>12} {'speedup':>8}")
+    threshold = None
+    for pages in PAGE_COUNTS:
+        data = build_resume_pdf(pages)
+        assert ResumeParser.extract_text(data, parallel=False) == ResumeParser.extract_text(data, parallel=True)
+
+        sequential = _time(lambda: ResumeParser.extract_text(data, parallel=False), args.repeat)
+        parallel = _time(lambda: ResumeParser.extract_text(data, parallel=True), args.repeat)
+        speedup = sequential / parallel
+        if threshold is None and speedup > 1.1:
+            threshold = pages
+        print(f"{pages:>6} {sequential * 1000:>14.1f} {parallel * 1000:>12.1f} {speedup:>7.2f}x")
+
+    if threshold is None:
+        print("Parallel extraction never won; keep it disabled (PDF_PARALLEL_WORKERS = 1)")
+    else:
+        print(f"Suggested PDF_PARALLEL_PAGE_THRESHOLD = {threshold}")
+
+
+if __name__ == '__main__':
+    main()
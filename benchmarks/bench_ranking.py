@@ -0,0 +1,58 @@
+"""
+Ranking Benchmark
+Time to rank a synthetic resume corpus against one job with the inverted
+index versus one Python set intersection per resume.
+
+Usage:
+    python -m benchmarks.bench_ranking [--size 1000000] [--top-k 10]
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from utils.ranking import RankingEngine, ResumeCorpus
+from utils.skill_extractor import SkillExtractor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--job-skills', type=int, default=12)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    taxonomy = SkillExtractor.get_taxonomy()
+    vocabulary = range(len(taxonomy.names))
+
+    corpus = ResumeCorpus(taxonomy)
+    resumes = []
+    start = time.perf_counter()
+    for i in range(args.size):
+        skill_ids = frozenset(rng.sample(vocabulary, rng.randint(5, 40)))
+        resumes.append(skill_ids)
+        corpus.add(f'resume-{i}', skill_ids)
+    corpus.snapshot()
+    print(f"Built corpus of {args.size} resumes in {time.perf_counter() - start:.2f}s")
+
+    job_ids = frozenset(rng.sample(vocabulary, args.job_skills))
+    engine = RankingEngine(corpus)
+
+    for method in ('intersection', 'jaccard', 'cosine'):
+        engine.rank(job_ids, args.top_k, method)
+        start = time.perf_counter()
+        runs = 5
+        for _ in range(runs):
+            engine.rank(job_ids, args.top_k, method)
+        print(f"{method:<13} inverted index: {(time.perf_counter() - start) / runs * 1000:8.2f} ms")
+
+    start = time.perf_counter()
+    heapq.nlargest(args.top_k, range(len(resumes)),
+                   key=lambda i: len(resumes[i] & job_ids) / len(job_ids))
+    print(f"{'intersection':<13} python sets:    {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Skill Extraction Benchmark
+Compares the legacy per-skill substring scan with the compiled
+Aho-Corasick automaton on synthetic resumes.
+
+Usage:
+    python -m benchmarks.bench_skill_extraction [--dictionary-scale N]
+"""
+
+import argparse
+import random
+import timeit
+from typing import Iterable, Set
+
+from utils.aho_corasick import AhoCorasick
+from utils.skill_extractor import SkillExtractor
+
+RESUME_SIZES = (1_000, 10_000, 100_000)
+
+FILLER_WORDS = (
+    'experience', 'team', 'developed', 'managed', 'years', 'project',
+    'delivered', 'built', 'using', 'with', 'and', 'the', 'for', 'senior',
+    'engineer', 'led', 'designed', 'production', 'systems', 'scalable',
+)
+
+
+def legacy_extract(text: str, skills: Iterable[str]) -> Set[str]:
+    """Per-skill scan used before the automaton was introduced."""
+    text_lower = text.lower()
+    extracted = set()
+    for skill in skills:
+        if f' {skill} ' in f' {text_lower} ' or text_lower.startswith(f'{skill} ') or text_lower.endswith(f' {skill}'):
+            extracted.add(skill)
+    return extracted
+
+
+def build_dictionary(scale: int) -> Set[str]:
+    """Base skill set plus synthetic entries to simulate a larger taxonomy."""
+    skills = set(SkillExtractor.TECHNICAL_SKILLS)
+    base = sorted(skills)
+    for i in range(len(base) * (scale - 1)):
+        skills.add(f'{base[i % len(base)]}-ext{i}')
+    return skills
+
+
+def build_resume(size: int, skills: Set[str], seed: int = 42) -> str:
+    """Generate a cleaned resume of roughly ``size`` characters."""
+    rng = random.Random(seed)
+    vocabulary = sorted(skills)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(vocabulary) if rng.random() < 0.1 else rng.choice(FILLER_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--dictionary-scale', type=int, default=1,
+                        help='multiply the skill dictionary size (default: 1)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    skills = build_dictionary(args.dictionary_scale)
+    automaton = AhoCorasick((skill, skill) for skill in skills)
+    print(f"Dictionary: {len(skills)} skills")
+    print(f"{'chars':>8} {'legacy ms':>10} {'automaton ms':>13} {'speedup':>8}")
+
+    for size in RESUME_SIZES:
+        text = build_resume(size, skills)
+        assert legacy_extract(text, skills) == automaton.search(text), 'result mismatch'
+
+        number = max(1, 100_000 // size)
+        legacy = min(timeit.repeat(lambda: legacy_extract(text, skills),
+                                   number=number, repeat=args.repeat)) / number
+        compiled = min(timeit.repeat(lambda: automaton.search(text),
+                                     number=number, repeat=args.repeat)) / number
+        print(f"{size:>8} {legacy * 1000:>10.3f} {compiled * 1000:>13.3f} {legacy / compiled:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
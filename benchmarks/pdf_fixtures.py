@@ -0,0 +1,81 @@
+"""
+PDF Fixtures
+Builds synthetic multi-page text PDFs for benchmarks without extra
+dependencies
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+from utils.skill_extractor import SkillExtractor
+
+FILLER_WORDS = (
+    'experience', 'team', 'developed', 'managed', 'years', 'project',
+    'delivered', 'built', 'using', 'with', 'and', 'the', 'for', 'senior',
+    'engineer', 'led', 'designed', 'production', 'systems', 'scalable',
+)
+
+
+def _escape(line: str) -> str:
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def build_pdf(pages: Sequence[str]) -> bytes:
+    """
+    Build a PDF with one page per string (newlines start a new text line)
+
+    Args:
+        pages: Text of each page (Latin-1 characters only)
+
+    Returns:
+        bytes: PDF document
+    """
+    kids = ' '.join(f'{4 + 2 * i} 0 R' for i in range(len(pages)))
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>'.encode(),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, text in enumerate(pages):
+        lines = ' '.join(f"({_escape(line)}) '" for line in text.split('\n'))
+        stream = f'BT /F1 10 Tf 40 800 Td 12 TL {lines} ET'.encode('latin-1')
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>'.encode()
+        )
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n'.encode() + body + b'\nendobj\n'
+
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    for offset in offsets:
+        out += f'{offset:010d} 00000 n \n'.encode()
+    out += (f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+            f'startxref\n{xref}\n%%EOF\n').encode()
+    return bytes(out)
+
+
+def resume_pages(page_count: int, lines_per_page: int = 60,
+                 seed: Optional[int] = 42) -> List[str]:
+    """Generate resume-like page texts mixing skills and filler words."""
+    rng = random.Random(seed)
+    skills = sorted(SkillExtractor.TECHNICAL_SKILLS)
+    pages = []
+    for _ in range(page_count):
+        lines = []
+        for _ in range(lines_per_page):
+            words = [rng.choice(skills) if rng.random() < 0.15 else rng.choice(FILLER_WORDS)
+                     for _ in range(12)]
+            lines.append(' '.join(words))
+        pages.append('\n'.join(lines))
+    return pages
+
+
+def build_resume_pdf(page_count: int, lines_per_page: int = 60, seed: Optional[int] = 42) -> bytes:
+    """Synthetic resume PDF with the given number of pages."""
+    return build_pdf(resume_pages(page_count, lines_per_page, seed))
@@ -40,6 +40,10 @@ UPLOAD_FOLDER = os.path.join(os.getcwd(), 'uploads')
 # File cleanup (auto-delete after analysis)
 AUTO_DELETE_UPLOADS = True
 
+# Uploads up to this size are kept in memory; larger ones spill to an
+# anonymous temporary file (never written to UPLOAD_FOLDER)
+UPLOAD_SPOOL_THRESHOLD = 2 * 1024 * 1024
+
 # =====================================================
 # SKILL EXTRACTION CONFIGURATION
 # =====================================================
@@ -54,6 +58,22 @@ MAX_SKILLS_TO_RETURN = None  # None = no limit
 CASE_INSENSITIVE_MATCHING = True
 WORD_BOUNDARY_MATCHING = True
 
+# Skill taxonomy file (JSON, YAML or CSV) - None = built-in skills + CUSTOM_SKILLS
+SKILL_TAXONOMY_PATH = os.getenv('SKILL_TAXONOMY_PATH')
+
+# Seconds between checks for taxonomy file changes (hot reload)
+SKILL_TAXONOMY_RELOAD_INTERVAL = 5
+
+# Extracted skill sets cached by text digest (stats in /api/v2/stats)
+SKILL_CACHE_SIZE = 1024  # entries
+SKILL_CACHE_TTL = 3600  # seconds
+
+# Skill -> resume inverted index file (None = in-memory only)
+RESUME_INDEX_PATH = os.getenv('RESUME_INDEX_PATH')
+
+# Minimum seconds between automatic index saves
+RESUME_INDEX_AUTOSAVE_INTERVAL = 60
+
 # =====================================================
 # MATCHING CONFIGURATION
 # =====================================================
@@ -75,7 +95,19 @@ MATCH_LEVEL_THRESHOLDS = {
 # =====================================================
 
 # PDF parser settings
-PDF_EXTRACTION_METHOD = 'text'  # Options: 'text', 'ocr'
+# Text extraction backend: 'pypdf2' (default), 'pypdfium2', 'pdfminer', or
+# 'auto' for the fastest installed one ('text' is accepted for 'pypdf2').
+# Compare them with: python -m benchmarks.bench_pdf_backends
+PDF_EXTRACTION_METHOD = os.getenv('PDF_EXTRACTION_METHOD', 'pypdf2')
+
+# Parallel page extraction (tune with: python -m benchmarks.bench_pdf_extraction)
+PDF_PARALLEL_PAGE_THRESHOLD = 12  # min pages before using the process pool
+PDF_PARALLEL_WORKERS = None  # None = os.cpu_count()
+
+# Parsing budgets: extraction stops once either is reached, so oversized
+# uploads are never decoded in full (None = no limit)
+PDF_MAX_PAGES = 50
+PDF_MAX_CHARS = 200000  # cleaned characters
 PRESERVE_FORMATTING = False
 REMOVE_NUMBERS = False
 REMOVE_SPECIAL_CHARS = True
@@ -120,10 +152,11 @@ PRETTY_JSON = True
 # DATABASE CONFIGURATION (Optional)
 # =====================================================
 
-# Database settings (for future use)
+# Database settings (analysis results, resume skill sets and fingerprints)
 DATABASE_ENABLED = False
-DATABASE_TYPE = 'sqlite'  # Options: 'sqlite', 'postgresql', 'mysql'
-DATABASE_PATH = 'resume_analyzer.db'
+DATABASE_TYPE = 'sqlite'  # Options: 'sqlite' (postgresql/mysql drivers not bundled)
+DATABASE_PATH = os.getenv('DATABASE_PATH', 'resume_analyzer.db')
+DATABASE_POOL_SIZE = 5  # connections kept open
 
 # Connection settings
 DATABASE_CONFIG = {
@@ -177,6 +210,25 @@ NOTIFICATION_TYPE = 'toast'  # Options: 'toast', 'modal', 'banner'
 CACHING_ENABLED = False
 CACHE_TYPE = 'simple'
 CACHE_DEFAULT_TIMEOUT = 300
+CACHE_MAX_ENTRIES = 1024  # entries kept by utils.cache.global_cache (None = no limit)
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # memory budget of global_cache (half the 512MB heap target)
+CACHE_EVICTION_POLICY = 'lru'  # 'lru' or 'gdsf' (favours small, popular, expensive entries)
+
+# Cache tier shared by all worker processes on a host (SQLite file in this
+# local directory; None = per-process caches only)
+SHARED_CACHE_DIR = os.getenv('SHARED_CACHE_DIR')
+SHARED_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Parsed resume cache (keyed by SHA-256 of the uploaded file)
+PARSE_CACHE_SIZE = 256  # entries kept in memory
+PARSE_CACHE_DIR = os.getenv('PARSE_CACHE_DIR')  # optional on-disk tier
+PARSE_CACHE_DISK_MAX_BYTES = 512 * 1024 * 1024  # on-disk tier cap, oldest entries removed first
+
+# Background job queue for /analyze?async=1. Jobs are polled from any worker
+# process only when SHARED_CACHE_DIR is set; otherwise run a single process
+JOB_QUEUE_WORKERS = 2  # worker threads
+JOB_QUEUE_MAX_DEPTH = 50  # waiting jobs before new ones get 429 + Retry-After
+JOB_RESULT_TTL = 600  # seconds finished job results can be polled
 
 # Compression settings
 COMPRESSION_ENABLED = True
@@ -202,7 +254,8 @@ FEATURES = {
 # CUSTOM SKILL DATABASE
 # =====================================================
 
-# Add custom skills here (will be merged with default skills)
+# Add custom skills here (will be merged with default skills;
+# ignored when SKILL_TAXONOMY_PATH points to a taxonomy file)
 CUSTOM_SKILLS = {
     # Programming Languages
     'elixir', 'crystal', 'nim',
@@ -0,0 +1,79 @@
+"""
+Text Cleaning Tests
+Randomized equivalence of ResumeParser.clean_text with the original
+three-regex implementation, whole and streamed page by page
+"""
+
+import random
+import sys
+
+import pytest
+
+from benchmarks.bench_clean_text import legacy_clean_text
+from utils.resume_parser import ResumeParser
+
+
+CASES_PER_SEED = 20_000
+
+# Characters the regexes treat specially, mixed into the random cases
+EDGE_CHARACTERS = (
+    ' \t\n\r\x0b\x0c\x1c\x85\xa0\u2003\u3000'  # ASCII and Unicode whitespace
+    '_.-+#@,;:/()&!?\'"'                          # kept and dropped symbols
+    '\u03a3\u03c3\u0130\u1e9e\u01c5\u00b2\u0663'      # sigma, dotted I, digits
+)
+
+
+def random_text(rng: random.Random, max_length: int = 24) -> str:
+    """Random mix of arbitrary code points and regex edge cases."""
+    chars = []
+    for _ in range(rng.randint(0, max_length)):
+        if rng.random() < 0.5:
+            code_point = rng.randrange(sys.maxunicode + 1)
+            if 0xD800 <= code_point < 0xE000:  # lone surrogates
+                continue
+            chars.append(chr(code_point))
+        else:
+            chars.append(rng.choice(EDGE_CHARACTERS))
+    return ''.join(chars)
+
+
+def split_pages(rng: random.Random, text: str):
+    """Cut text into up to four consecutive pages at random positions."""
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 3)))
+    return [text[start:stop] for start, stop in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_clean_text_matches_legacy(seed):
+    rng = random.Random(seed)
+    for _ in range(CASES_PER_SEED):
+        text = random_text(rng)
+        expected = legacy_clean_text(text)
+        actual = ResumeParser.clean_text(text)
+        assert actual == expected, f'clean_text mismatch for {text!r}'
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_iter_clean_text_matches_legacy(seed):
+    rng = random.Random(seed)
+    for _ in range(CASES_PER_SEED):
+        text = random_text(rng)
+        # Final sigma depends on its neighbours, which a page split can hide
+        if '\u03a3' in text:
+            continue
+        pages = split_pages(rng, text)
+        streamed = ''.join(ResumeParser.iter_clean_text(pages))
+        assert streamed == legacy_clean_text(text), f'iter_clean_text mismatch for {pages!r}'
+
+
+@pytest.mark.parametrize('text', [
+    '',
+    '   ',
+    'Senior Python/Django engineer, (5+ yrs)',
+    'C# & C++; node.js REST-API @ ACME Inc.',
+    '• Kubernetes\n\n\tDocker AWS',
+    '\u03a3\u038a\u03a3\u03a5\u03a6\u039f\u03a3',
+])
+def test_clean_text_edge_cases(text):
+    assert ResumeParser.clean_text(text) == legacy_clean_text(text)
+    assert ''.join(ResumeParser.iter_clean_text([text])) == legacy_clean_text(text)
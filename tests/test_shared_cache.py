@@ -0,0 +1,52 @@
+"""
+Shared Cache Tests
+Cross-process hits through SharedCache and the tiered skill cache
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from utils.cache import SharedCache, SimpleCache, TieredCache
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_worker(code: str, shared_cache_dir: str) -> str:
+    """Run code in a fresh interpreter with SHARED_CACHE_DIR set; return its last output line."""
+    env = dict(os.environ, SHARED_CACHE_DIR=shared_cache_dir, PYTHONPATH=str(REPO_ROOT))
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=60, check=True
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_second_process_reads_shared_entry(tmp_path):
+    cache = TieredCache(SimpleCache(default_ttl=60), SharedCache(str(tmp_path), default_ttl=60))
+    cache.set('analysis:42', {'match_percentage': 87.5, 'skills': ['python', 'docker']})
+
+    output = run_worker(
+        "import os\n"
+        "from utils.cache import SharedCache\n"
+        "print(SharedCache(os.environ['SHARED_CACHE_DIR']).get('analysis:42'))\n",
+        str(tmp_path)
+    )
+
+    assert output == "{'match_percentage': 87.5, 'skills': ['python', 'docker']}"
+
+
+def test_skill_cache_hit_in_second_worker(tmp_path):
+    code = (
+        "from utils.skill_extractor import SkillExtractor, skill_cache\n"
+        "skills = SkillExtractor.extract_keywords('python docker and kubernetes on aws')\n"
+        "print(sorted(skills), skill_cache.stats()['shared']['hits'])\n"
+    )
+
+    first = run_worker(code, str(tmp_path))
+    second = run_worker(code, str(tmp_path))
+
+    assert first == "['aws', 'docker', 'kubernetes', 'python'] 0"
+    assert second == "['aws', 'docker', 'kubernetes', 'python'] 1"
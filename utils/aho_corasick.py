@@ -0,0 +1,128 @@
+"""
+Aho-Corasick Module
+Multi-pattern keyword matching in a single linear pass over the text
+"""
+
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+class AhoCorasick:
+    """
+    Word-level Aho-Corasick automaton.
+
+    Patterns are phrases of one or more space-separated words. Text is split
+    on single spaces, so a phrase only matches when it is delimited by spaces
+    or the start/end of the text - the same word-boundary rule as
+    ``f' {phrase} ' in f' {text} '``, but evaluated for every pattern at once.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        """
+        Compile the automaton
+
+        Args:
+            patterns: Iterable of (phrase, value) pairs; the value is reported
+                whenever the phrase is found
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[Any, ...]] = [()]
+        self._alphabet: Set[str] = set()
+        self.pattern_count = 0
+
+        for phrase, value in patterns:
+            self._add(phrase, value)
+
+        self._build_failure_links()
+
+    def _add(self, phrase: str, value: Any) -> None:
+        """Insert a phrase into the trie."""
+        words = phrase.split(' ')
+        if not phrase or '' in words:
+            return
+
+        state = 0
+        for word in words:
+            next_state = self._goto[state].get(word)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][word] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+
+        if value not in self._output[state]:
+            self._output[state] += (value,)
+        self._alphabet.update(words)
+        self.pattern_count += 1
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first construction of failure links and merged outputs."""
+        queue = list(self._goto[0].values())
+
+        for state in queue:
+            for word, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                # Inherit matches that end at the failure state (suffix phrases)
+                inherited = self._output[self._fail[next_state]]
+                if inherited:
+                    self._output[next_state] += tuple(
+                        v for v in inherited if v not in self._output[next_state]
+                    )
+
+    def search(self, text: str) -> Set[Any]:
+        """
+        Find the values of all patterns occurring in the text
+
+        Args:
+            text: Text to scan (matched case-sensitively)
+
+        Returns:
+            Set of values for every phrase found
+        """
+        found: Set[Any] = set()
+        self.scan(text.split(' '), found)
+        return found
+
+    def scan(self, words: Iterable[str], found: Set[Any], state: int = 0) -> int:
+        """
+        Feed words through the automaton, resuming from a previous state
+
+        Scanning a text in consecutive word runs while passing the returned
+        state back in finds exactly what ``search`` finds on the whole text,
+        so callers can stream text through without joining it.
+
+        Args:
+            words: Consecutive words of the text
+            found: Set the values of matched phrases are added to
+            state: State returned by the previous call (0 = start of text)
+
+        Returns:
+            int: State to resume from with the next words
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        for word in words:
+            if word not in alphabet:
+                state = 0
+                continue
+
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+
+            if output[state]:
+                found.update(output[state])
+
+        return state
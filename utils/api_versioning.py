@@ -34,6 +34,8 @@ class VersionManager:
                 'GET /api/v2/health',
                 'GET /api/v2/stats',
                 'POST /api/v2/batch-analyze',
+                'GET /api/v2/resumes/search',
+                'GET /api/v2/jobs/<job_id>',
                 'POST /api/v2/skills/recommendations',
                 'POST /api/v2/export'
             ]
@@ -5,10 +5,32 @@ Provides utilities for processing large amounts of data in batches
 with progress tracking, error handling, and retry logic.
 """
 
-from typing import List, Callable, Any, Optional, Dict
-from dataclasses import dataclass
+import glob
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from collections import deque
+from itertools import islice
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import List, Callable, Any, Optional, Dict, Iterable, Iterator, Set, Tuple, Type
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import logging
+import multiprocessing
+
+logger = logging.getLogger(__name__)
+
+
+# Execution backends for BatchProcessor
+EXECUTORS = ('serial', 'thread', 'process')
+
+# Most recent chunk timings kept for reporting
+MAX_CHUNK_TIMINGS = 1000
 
 
 class BatchStatus(Enum):
@@ -32,6 +54,9 @@ class BatchResult:
     errors: List[str]
     started_at: datetime
     completed_at: Optional[datetime] = None
+    chunk_timings: List[float] = field(default_factory=list)
+    retries: int = 0
+    dead_letters: List['DeadLetter'] = field(default_factory=list)
     
     def success_rate(self) -> float:
         """Calculate success rate as percentage."""
@@ -40,6 +65,315 @@ class BatchResult:
         return (self.processed / self.total_items) * 100
 
 
+@dataclass
+class ChunkResult:
+    """Outcome of one chunk of items."""
+    chunk_index: int
+    start: int
+    size: int
+    results: List[Any]
+    errors: List[str]
+    duration_seconds: float
+    # First failure when skip_on_error is off (the chunk stops there)
+    exception: Optional[BaseException] = None
+    dead_letters: List['DeadLetter'] = field(default_factory=list)
+    retries: int = 0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how often a failing item is retried
+    
+    Only exceptions in ``retry_on`` (and not in ``give_up_on``) are treated
+    as transient; anything else fails the item on the first attempt. Waits
+    grow exponentially from ``base_delay`` up to ``max_delay``, with full
+    jitter so workers retrying the same dependency do not stay in lockstep.
+    Instances are picklable and are shipped to process-pool workers.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_on: Tuple[Type[BaseException], ...] = (OSError,)
+    give_up_on: Tuple[Type[BaseException], ...] = ()
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether an exception is worth another attempt."""
+        return isinstance(error, self.retry_on) and not isinstance(error, self.give_up_on)
+        
+    def delay(self, retry: int, rng: Optional[random.Random] = None) -> float:
+        """
+        Seconds to wait before a retry
+        
+        Args:
+            retry: 1 for the first retry, 2 for the second, ...
+            rng: Random source for the jitter
+            
+        Returns:
+            float: Delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        if self.jitter:
+            delay = (rng or random).uniform(0, delay)
+        return delay
+
+
+# Policy used when BatchProcessor is given only max_retries
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+@dataclass
+class DeadLetter:
+    """An item that failed permanently and was not retried further."""
+    index: int
+    item: Any
+    error: str
+    error_type: str
+    attempts: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'index': self.index,
+            'item': self.item,
+            'error': self.error,
+            'error_type': self.error_type,
+            'attempts': self.attempts,
+        }
+
+
+def _call_with_retry(
+    item: Any,
+    processor_func: Callable,
+    policy: RetryPolicy,
+    retry_budget: Optional[int] = None,
+    rng: Optional[random.Random] = None
+) -> Tuple[Any, Optional[Exception], int]:
+    """
+    Call processor_func on one item according to a retry policy
+    
+    Returns:
+        tuple: (result, final exception or None, attempts made)
+    """
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            return processor_func(item), None, attempts
+        except Exception as e:
+            retries = attempts - 1
+            if (attempts >= policy.max_attempts or not policy.is_retryable(e)
+                    or (retry_budget is not None and retries >= retry_budget)):
+                return None, e, attempts
+            time.sleep(policy.delay(attempts, rng))
+
+
+def _process_item_with_retry(item: Any, processor_func: Callable, policy: RetryPolicy) -> Any:
+    """Call processor_func on one item, retrying transient failures."""
+    result, error, _ = _call_with_retry(item, processor_func, policy)
+    if error is not None:
+        raise error
+    return result
+
+
+def _process_chunk(
+    chunk_index: int,
+    start: int,
+    items: List[Any],
+    processor_func: Callable,
+    policy: RetryPolicy,
+    skip_on_error: bool,
+    retry_budget: Optional[int] = None
+) -> ChunkResult:
+    """
+    Process one chunk; module-level so process pools can pickle it
+    
+    ``retry_budget`` caps the retries the whole chunk may spend (None for
+    no cap); once it is used up, failures are final on the first attempt.
+    """
+    started = time.perf_counter()
+    rng = random.Random()
+    results = []
+    errors = []
+    dead_letters = []
+    retries = 0
+    exception = None
+    
+    for offset, item in enumerate(items):
+        remaining = None if retry_budget is None else retry_budget - retries
+        result, error, attempts = _call_with_retry(item, processor_func, policy, remaining, rng)
+        retries += attempts - 1
+        if error is None:
+            results.append(result)
+            continue
+            
+        errors.append(f"Failed to process item {start + offset}: {str(error)}")
+        dead_letters.append(DeadLetter(
+            index=start + offset,
+            item=item,
+            error=str(error),
+            error_type=type(error).__name__,
+            attempts=attempts
+        ))
+        if not skip_on_error:
+            exception = error
+            break
+            
+    return ChunkResult(
+        chunk_index=chunk_index,
+        start=start,
+        size=len(items),
+        results=results,
+        errors=errors,
+        duration_seconds=time.perf_counter() - started,
+        exception=exception,
+        dead_letters=dead_letters,
+        retries=retries
+    )
+
+
+@dataclass
+class BatchCheckpoint:
+    """Durable progress of a batch: everything before ``offset`` is done."""
+    batch_id: str
+    status: BatchStatus
+    offset: int
+    processed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    retries: int = 0
+    errors: List[str] = field(default_factory=list)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary."""
+        return {
+            'batch_id': self.batch_id,
+            'status': self.status.value,
+            'offset': self.offset,
+            'processed': self.processed,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'error_count': self.error_count,
+            'retries': self.retries,
+            'errors': self.errors,
+            'updated_at': self.updated_at.isoformat(),
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BatchCheckpoint':
+        """Create from a dictionary produced by to_dict."""
+        return cls(
+            batch_id=data['batch_id'],
+            status=BatchStatus(data['status']),
+            offset=data['offset'],
+            processed=data.get('processed', 0),
+            failed=data.get('failed', 0),
+            skipped=data.get('skipped', 0),
+            error_count=data.get('error_count', 0),
+            retries=data.get('retries', 0),
+            errors=list(data.get('errors', [])),
+            updated_at=datetime.fromisoformat(data['updated_at']),
+        )
+
+
+class CheckpointStore:
+    """Where batch checkpoints are persisted."""
+    
+    def load(self, batch_id: str) -> Optional[BatchCheckpoint]:
+        """Get the checkpoint of a batch, or None."""
+        raise NotImplementedError
+        
+    def save(self, checkpoint: BatchCheckpoint) -> None:
+        """Write (replace) a batch checkpoint."""
+        raise NotImplementedError
+        
+    def delete(self, batch_id: str) -> None:
+        """Forget a batch checkpoint."""
+        raise NotImplementedError
+
+
+class JsonCheckpointStore(CheckpointStore):
+    """One JSON file per batch in a directory, replaced atomically."""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        
+    def _path(self, batch_id: str) -> str:
+        return os.path.join(self.directory, f'{batch_id}.json')
+        
+    def load(self, batch_id: str) -> Optional[BatchCheckpoint]:
+        try:
+            with open(self._path(batch_id), 'r', encoding='utf-8') as f:
+                return BatchCheckpoint.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+            
+    def save(self, checkpoint: BatchCheckpoint) -> None:
+        path = self._path(checkpoint.batch_id)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint.to_dict(), f)
+        os.replace(tmp_path, path)
+        
+    def delete(self, batch_id: str) -> None:
+        try:
+            os.remove(self._path(batch_id))
+        except FileNotFoundError:
+            pass
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """Checkpoints of many batches in one SQLite table."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS batch_checkpoints ('
+                'batch_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at TEXT NOT NULL)'
+            )
+            
+    def load(self, batch_id: str) -> Optional[BatchCheckpoint]:
+        with closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute(
+                'SELECT data FROM batch_checkpoints WHERE batch_id = ?', (batch_id,)
+            ).fetchone()
+        return BatchCheckpoint.from_dict(json.loads(row[0])) if row else None
+        
+    def save(self, checkpoint: BatchCheckpoint) -> None:
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO batch_checkpoints (batch_id, data, updated_at) VALUES (?, ?, ?)',
+                (checkpoint.batch_id, json.dumps(checkpoint.to_dict()),
+                 checkpoint.updated_at.isoformat())
+            )
+            
+    def delete(self, batch_id: str) -> None:
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.execute('DELETE FROM batch_checkpoints WHERE batch_id = ?', (batch_id,))
+
+
+def open_checkpoint_store(path: str) -> CheckpointStore:
+    """
+    Open a checkpoint store by path
+    
+    Args:
+        path: ``*.db``/``*.sqlite``/``*.sqlite3`` for SQLite, otherwise a
+            directory of JSON files
+            
+    Returns:
+        CheckpointStore instance
+    """
+    if os.path.splitext(path)[1].lower() in ('.db', '.sqlite', '.sqlite3'):
+        return SqliteCheckpointStore(path)
+    return JsonCheckpointStore(path)
+
+
 class BatchProcessor:
     """Process items in batches with progress tracking."""
     
@@ -47,13 +381,69 @@ class BatchProcessor:
         self,
         batch_size: int = 100,
         max_retries: int = 3,
-        batch_id: Optional[str] = None
+        batch_id: Optional[str] = None,
+        executor: str = 'serial',
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        max_errors: int = 1000,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_every: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[int] = None
     ):
+        """
+        Args:
+            batch_size: Items per chunk (the unit handed to a worker)
+            max_retries: Attempts per item (ignored if retry_policy is given)
+            batch_id: Identifier for reporting (generated if omitted)
+            executor: 'serial', 'thread' or 'process'. With 'process' the
+                processor function and items must be picklable, and workers
+                are started by a fork server (or spawned), not forked.
+            max_workers: Pool size (default: os.cpu_count())
+            ordered: Deliver chunk results in input order; if False they
+                are delivered as soon as each chunk completes
+            max_errors: Most recent error messages kept (all are counted)
+            checkpoint_store: Persist progress here so an interrupted or
+                paused batch with the same batch_id resumes where it stopped
+            checkpoint_every: Chunks between checkpoint writes
+            retry_policy: Backoff and retryable exceptions (default: retry
+                OSError up to max_retries attempts with jittered backoff)
+            retry_budget: Maximum retries for the whole batch (None for no
+                limit). Each chunk may spend what was left when it started,
+                so concurrent chunks can overshoot by their in-flight share.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Options: {', '.join(EXECUTORS)}")
         self.batch_size = batch_size
         self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries)
+        self.retry_budget = retry_budget
         self.batch_id = batch_id or self._generate_batch_id()
+        self.executor = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.ordered = ordered
         self.results: List[Any] = []
-        self.errors: List[str] = []
+        self.errors: deque = deque(maxlen=max_errors)
+        self.chunk_timings: deque = deque(maxlen=MAX_CHUNK_TIMINGS)
+        # Permanently failed items (most recent max_errors)
+        self.dead_letters: deque = deque(maxlen=max_errors)
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_every = checkpoint_every
+        self.status = BatchStatus.PENDING
+        self.offset = 0
+        self.last_checkpoint: Optional[BatchCheckpoint] = None
+        self._pause_requested = threading.Event()
+        self._reset_counters()
+        
+    def _reset_counters(self) -> None:
+        """Zero the progress counters at the start of a run."""
+        self.items_read = 0
+        self.processed_count = 0
+        self.failed_count = 0
+        self.skipped_count = 0
+        self.error_count = 0
+        self.retry_count = 0
+        self.chunks_done = 0
         
     def _generate_batch_id(self) -> str:
         """Generate unique batch ID."""
@@ -61,70 +451,346 @@ class BatchProcessor:
         
     def process(
         self,
-        items: List[Any],
+        items: Iterable[Any],
         processor_func: Callable,
-        skip_on_error: bool = True
+        skip_on_error: bool = True,
+        sink: Optional[Callable[[Any], None]] = None
     ) -> BatchResult:
-        """Process items in batches."""
-        start_time = datetime.utcnow()
-        total = len(items)
-        processed = 0
-        failed = 0
-        skipped = 0
+        """
+        Process items in batches
         
-        for i in range(0, total, self.batch_size):
-            batch = items[i:i + self.batch_size]
+        Results are appended to ``self.results`` unless a sink is given, in
+        which case each result is passed to it and nothing is retained; with
+        a generator as input the run then uses constant memory.
+        
+        Args:
+            items: Any iterable (list, generator, iter_jsonl(), ...)
+            processor_func: Called once per item (with retries)
+            skip_on_error: Record failures and continue, or raise the first
+            sink: Optional callback receiving each result
             
-            for item in batch:
-                try:
-                    result = self._process_item_with_retry(item, processor_func)
-                    self.results.append(result)
-                    processed += 1
-                except Exception as e:
-                    error_msg = f"Failed to process item {i}: {str(e)}"
-                    self.errors.append(error_msg)
-                    
-                    if skip_on_error:
-                        skipped += 1
-                    else:
-                        failed += 1
-                        raise
-                        
+        Returns:
+            BatchResult: Counters for this run
+        """
+        start_time = datetime.utcnow()
+        
+        for result in self.iter_results(items, processor_func, skip_on_error):
+            if sink is not None:
+                sink(result)
+            else:
+                self.results.append(result)
+                
         return BatchResult(
             batch_id=self.batch_id,
-            status=BatchStatus.COMPLETED if not failed else BatchStatus.FAILED,
-            total_items=total,
-            processed=processed,
-            failed=failed,
-            skipped=skipped,
-            errors=self.errors,
+            status=self.status,
+            total_items=self.items_read,
+            processed=self.processed_count,
+            failed=self.failed_count,
+            skipped=self.skipped_count,
+            errors=list(self.errors),
             started_at=start_time,
-            completed_at=datetime.utcnow()
+            completed_at=datetime.utcnow(),
+            chunk_timings=list(self.chunk_timings),
+            retries=self.retry_count,
+            dead_letters=list(self.dead_letters)
         )
         
+    def iter_results(
+        self,
+        items: Iterable[Any],
+        processor_func: Callable,
+        skip_on_error: bool = True
+    ) -> Iterator[Any]:
+        """
+        Process items and yield each result as its chunk completes
+        
+        Progress counters are updated as results are delivered; only the
+        most recent ``max_errors`` messages are kept. An unfinished
+        checkpoint for this batch_id (from the checkpoint store, or from a
+        paused run of this processor) is resumed by skipping the first
+        ``offset`` items, so the input must yield items in the same order.
+        Items are committed after their results have been consumed, so a
+        crash may repeat at most the chunks since the last checkpoint.
+        
+        Args:
+            items: Any iterable of items
+            processor_func: Called once per item (with retries)
+            skip_on_error: Record failures and continue, or raise the first
+            
+        Yields:
+            Processor results (input order if ``ordered``)
+        """
+        self._start_run()
+        chunks = self.process_chunks(items, processor_func, skip_on_error)
+        # Chunks delivered past the committed offset (out of order), start -> end
+        delivered: Dict[int, int] = {}
+        try:
+            for chunk in chunks:
+                self.chunks_done += 1
+                self.chunk_timings.append(chunk.duration_seconds)
+                self.errors.extend(chunk.errors)
+                self.error_count += len(chunk.errors)
+                self.retry_count += chunk.retries
+                self.dead_letters.extend(chunk.dead_letters)
+                self.processed_count += len(chunk.results)
+                
+                if chunk.exception is not None:
+                    self.failed_count += 1
+                    yield from chunk.results
+                    # The failing item is retried when the batch is resumed
+                    self._commit(delivered, chunk.start, chunk.start + len(chunk.results))
+                    self.status = BatchStatus.FAILED
+                    self._save_checkpoint()
+                    raise chunk.exception
+                    
+                self.skipped_count += len(chunk.errors)
+                yield from chunk.results
+                self._commit(delivered, chunk.start, chunk.start + chunk.size)
+                if self.chunks_done % self.checkpoint_every == 0:
+                    self._save_checkpoint()
+                    
+            self.status = BatchStatus.PAUSED if self._pause_requested.is_set() else BatchStatus.COMPLETED
+            self._save_checkpoint()
+        finally:
+            chunks.close()
+            
+    def pause(self) -> None:
+        """
+        Pause a running batch
+        
+        No new chunks are started; chunks already running finish and are
+        delivered, a checkpoint is written and the run ends with status
+        PAUSED. Continue it with resume() (or process() with the same
+        batch_id, e.g. from another process when a checkpoint store is set).
+        """
+        self._pause_requested.set()
+        
+    def resume(
+        self,
+        items: Iterable[Any],
+        processor_func: Callable,
+        skip_on_error: bool = True,
+        sink: Optional[Callable[[Any], None]] = None
+    ) -> BatchResult:
+        """
+        Continue a paused, failed or interrupted batch from its checkpoint
+        
+        Args:
+            items: The same input as the original run (same order)
+            processor_func: Called once per item (with retries)
+            skip_on_error: Record failures and continue, or raise the first
+            sink: Optional callback receiving each result
+            
+        Returns:
+            BatchResult: Counters for the whole batch
+        """
+        return self.process(items, processor_func, skip_on_error, sink)
+        
+    def _start_run(self) -> None:
+        """Reset state, or restore it from an unfinished checkpoint."""
+        self._reset_counters()
+        self._pause_requested.clear()
+        self.offset = 0
+        
+        checkpoint = self.last_checkpoint
+        if self.checkpoint_store is not None:
+            checkpoint = self.checkpoint_store.load(self.batch_id)
+        if checkpoint is not None and checkpoint.status != BatchStatus.COMPLETED:
+            logger.info(f"Resuming batch {self.batch_id} at item {checkpoint.offset}")
+            self.offset = self.items_read = checkpoint.offset
+            self.processed_count = checkpoint.processed
+            self.failed_count = checkpoint.failed
+            self.skipped_count = checkpoint.skipped
+            self.error_count = checkpoint.error_count
+            self.retry_count = checkpoint.retries
+            self.errors.clear()
+            self.errors.extend(checkpoint.errors)
+        self.status = BatchStatus.RUNNING
+        
+    def _commit(self, delivered: Dict[int, int], start: int, end: int) -> None:
+        """Mark [start, end) done and advance the offset over contiguous ranges."""
+        delivered[start] = end
+        while self.offset in delivered:
+            self.offset = delivered.pop(self.offset)
+            
+    def _save_checkpoint(self) -> None:
+        """Record progress in memory and in the checkpoint store."""
+        self.last_checkpoint = BatchCheckpoint(
+            batch_id=self.batch_id,
+            status=self.status,
+            offset=self.offset,
+            processed=self.processed_count,
+            failed=self.failed_count,
+            skipped=self.skipped_count,
+            error_count=self.error_count,
+            retries=self.retry_count,
+            errors=list(self.errors)
+        )
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.save(self.last_checkpoint)
+            
+    def process_chunks(
+        self,
+        items: Iterable[Any],
+        processor_func: Callable,
+        skip_on_error: bool = True
+    ) -> Iterator[ChunkResult]:
+        """
+        Process items chunk by chunk, yielding each chunk's results
+        
+        Chunks of ``batch_size`` items run on the configured executor. At
+        most two chunks per worker are in flight, and results stream back
+        while later chunks are still running. Items are read lazily, so
+        only the in-flight chunks are held in memory.
+        
+        Args:
+            items: Any iterable of items
+            processor_func: Called once per item (with retries)
+            skip_on_error: Record failures and continue; if False the chunk
+                stops at the first failure and carries it in ``exception``
+                
+        Yields:
+            ChunkResult: In input order, or completion order if not ``ordered``
+        """
+        chunks = self._read_chunks(items)
+        
+        if self.executor == 'serial':
+            while not self._pause_requested.is_set():
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                index, start, chunk_items = chunk
+                yield _process_chunk(index, start, chunk_items, processor_func,
+                                     self.retry_policy, skip_on_error,
+                                     self._remaining_retry_budget())
+            return
+            
+        # Chunks submitted or waiting to be delivered in order
+        window = self.max_workers * 2
+        
+        with self._create_pool() as pool:
+            in_flight: Set[Future] = set()
+            completed: Dict[int, ChunkResult] = {}
+            next_index = 0
+            exhausted = False
+            try:
+                while True:
+                    while not exhausted and len(in_flight) + len(completed) < window:
+                        chunk = None if self._pause_requested.is_set() else next(chunks, None)
+                        if chunk is None:
+                            exhausted = True
+                        else:
+                            index, start, chunk_items = chunk
+                            in_flight.add(pool.submit(
+                                _process_chunk, index, start, chunk_items, processor_func,
+                                self.retry_policy, skip_on_error,
+                                self._remaining_retry_budget()
+                            ))
+                    if not in_flight:
+                        break
+                        
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        if self.ordered:
+                            completed[result.chunk_index] = result
+                        else:
+                            yield result
+                            
+                    while next_index in completed:
+                        yield completed.pop(next_index)
+                        next_index += 1
+            finally:
+                for future in in_flight:
+                    future.cancel()
+                    
+    def _create_pool(self):
+        """
+        Thread or process pool for the configured executor
+        
+        Process workers come from a fork server (or are spawned where that
+        is not available) rather than forked from the app, which may hold
+        locks, open connections and running threads that a fork would copy.
+        """
+        if self.executor == 'thread':
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(start_method)
+        )
+        
+    def _read_chunks(self, items: Iterable[Any]) -> Iterator[tuple]:
+        """Lazily split items after the committed offset into (index, start, items) tuples."""
+        iterator = islice(iter(items), self.offset, None) if self.offset else iter(items)
+        index = 0
+        start = self.offset
+        while True:
+            chunk_items = list(islice(iterator, self.batch_size))
+            if not chunk_items:
+                return
+            self.items_read += len(chunk_items)
+            yield index, start, chunk_items
+            index += 1
+            start += len(chunk_items)
+            
     def _process_item_with_retry(
         self,
         item: Any,
         processor_func: Callable
     ) -> Any:
         """Process item with retry logic."""
-        last_exception = None
+        return _process_item_with_retry(item, processor_func, self.retry_policy)
         
-        for attempt in range(self.max_retries):
-            try:
-                return processor_func(item)
-            except Exception as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    continue
-                    
-        raise last_exception or Exception("Processing failed")
+    def _remaining_retry_budget(self) -> Optional[int]:
+        """Retries the batch may still spend (None if unlimited)."""
+        if self.retry_budget is None:
+            return None
+        return max(0, self.retry_budget - self.retry_count)
         
     def get_progress(self) -> Dict[str, Any]:
         """Get current processing progress."""
         return {
             'batch_id': self.batch_id,
-            'processed': len(self.results),
-            'errors': len(self.errors),
+            'status': self.status.value,
+            'offset': self.offset,
+            'items_read': self.items_read,
+            'processed': self.processed_count,
+            'errors': self.error_count,
+            'retries': self.retry_count,
+            'dead_letters': len(self.dead_letters),
             'total_results': len(self.results),
+            'chunks': self.chunks_done,
         }
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a JSON Lines file, one per line
+    
+    Args:
+        path: File path
+        
+    Yields:
+        dict: Parsed record (blank lines are skipped)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_files(directory: str, pattern: str = '*.pdf', recursive: bool = True) -> Iterator[str]:
+    """
+    Stream file paths under a directory without listing it up front
+    
+    Args:
+        directory: Root directory
+        pattern: Glob pattern for file names
+        recursive: Include subdirectories
+        
+    Yields:
+        str: Matching file path
+    """
+    search = os.path.join(directory, '**', pattern) if recursive else os.path.join(directory, pattern)
+    yield from glob.iglob(search, recursive=recursive)
@@ -3,25 +3,291 @@ Cache Module
 Caching utilities for performance optimization
 """
 
-from typing import Callable, Any, Dict, Optional
-from datetime import datetime, timedelta
+import hashlib
+import heapq
+import inspect
+import itertools
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from typing import Callable, Any, Dict, List, Optional, Tuple, Union
 from functools import wraps
 
+import config
+
+logger = logging.getLogger(__name__)
+
+
+# Eviction policies for SimpleCache
+EVICTION_POLICIES = ('lru', 'gdsf')
+
+# Containers larger than this are sized from a sample of their items
+_SIZE_SAMPLE = 100
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Approximate memory footprint of a value in bytes
+    
+    Adds up sys.getsizeof over strings, bytes, numbers and (up to a few
+    levels deep) the items of containers and object attributes. Large
+    containers are extrapolated from a sample. Objects shared with other
+    structures are counted in full, so this tends to overestimate.
+    
+    Args:
+        value: Value to measure
+    
+    Returns:
+        int: Estimated size in bytes
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 6 or isinstance(value, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    
+    if isinstance(value, dict):
+        items = value.items()
+        measure = lambda item: estimate_size(item[0], _depth + 1) + estimate_size(item[1], _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        items = value
+        measure = lambda item: estimate_size(item, _depth + 1)
+    elif hasattr(value, '__dict__'):
+        return size + estimate_size(vars(value), _depth + 1)
+    else:
+        return size
+    
+    count = len(items)
+    if count <= _SIZE_SAMPLE:
+        return size + sum(measure(item) for item in items)
+    sample = sum(measure(item) for item in itertools.islice(items, _SIZE_SAMPLE))
+    return size + sample * count // _SIZE_SAMPLE
+
+
+class _CacheEntry:
+    """A cached value with its expiry, size and eviction priority."""
+    
+    __slots__ = ('value', 'expires_at', 'size', 'cost', 'hits', 'priority', 'sequence', 'token')
+    
+    def __init__(self, value: Any, expires_at: float, size: int, cost: float, sequence: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.cost = cost
+        self.hits = 1
+        self.priority = 0.0
+        # Identifies this entry's items on the expiry and priority heaps
+        self.sequence = sequence
+        self.token = sequence
+
+
+class _CacheShard:
+    """
+    One lock stripe of a SimpleCache
+    
+    Entries are kept in LRU order in an OrderedDict (move_to_end on hit,
+    popitem(last=False) to evict). Expiry times are also pushed onto a heap
+    so expired entries can be dropped in O(log n) each without scanning;
+    heap items left behind by overwritten or deleted keys are skipped when
+    popped and the heaps are rebuilt if they pile up.
+    
+    With the 'gdsf' policy (Greedy-Dual-Size-Frequency) the entry with the
+    lowest priority ``L + hits * cost / size`` is evicted instead, where L
+    is the priority of the last evicted entry. Small, often used and
+    expensive entries stay; large one-off entries go first, and the rising
+    L ages out entries that were popular long ago.
+    """
+    
+    def __init__(self, max_entries: Optional[int], max_bytes: Optional[int], policy: str):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.entries: 'OrderedDict[Any, _CacheEntry]' = OrderedDict()
+        self.expiry_heap: List[Tuple[float, int, Any]] = []
+        self.priority_heap: List[Tuple[float, int, Any]] = []
+        self.inflation = 0.0
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self._sequence = itertools.count()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+    
+    def get(self, key: Any, now: float, default: Any) -> Any:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry.expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            if self.policy == 'gdsf':
+                entry.hits += 1
+                self._prioritise(key, entry)
+            self.hits += 1
+            return entry.value
+    
+    def set(self, key: Any, value: Any, expires_at: float, now: float, size: int, cost: float) -> bool:
+        with self.lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Caching it would evict everything else
+                self._remove(key)
+                self.rejected += 1
+                return False
+            
+            self._remove(key)
+            entry = _CacheEntry(value, expires_at, size, cost, next(self._sequence))
+            self.entries[key] = entry
+            self.bytes += size
+            heapq.heappush(self.expiry_heap, (expires_at, entry.sequence, key))
+            if self.policy == 'gdsf':
+                self._prioritise(key, entry)
+            
+            self.expire(now)
+            while self._over_budget():
+                self._evict()
+            if len(self.expiry_heap) + len(self.priority_heap) > 4 * len(self.entries) + 128:
+                self._rebuild_heaps()
+            return True
+    
+    def delete(self, key: Any) -> bool:
+        with self.lock:
+            return self._remove(key) is not None
+    
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.expiry_heap.clear()
+            self.priority_heap.clear()
+            self.bytes = 0
+    
+    def expire(self, now: float) -> int:
+        """Drop entries whose expiry time has passed (lock held)."""
+        removed = 0
+        heap = self.expiry_heap
+        while heap and heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            # Skip heap items of keys that were since overwritten or removed
+            if entry is not None and entry.sequence == sequence:
+                self._remove(key)
+                removed += 1
+        self.expirations += removed
+        return removed
+    
+    def _over_budget(self) -> bool:
+        if self.max_entries is not None and len(self.entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+    
+    def _evict(self) -> None:
+        if self.policy == 'lru':
+            key = next(iter(self.entries))
+        else:
+            while True:
+                priority, token, key = heapq.heappop(self.priority_heap)
+                entry = self.entries.get(key)
+                if entry is not None and entry.token == token:
+                    break
+            self.inflation = priority
+        self._remove(key)
+        self.evictions += 1
+    
+    def _remove(self, key: Any) -> Optional[_CacheEntry]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+    
+    def _prioritise(self, key: Any, entry: _CacheEntry) -> None:
+        entry.priority = self.inflation + entry.hits * entry.cost / max(entry.size, 1)
+        entry.token = next(self._sequence)
+        heapq.heappush(self.priority_heap, (entry.priority, entry.token, key))
+    
+    def _rebuild_heaps(self) -> None:
+        self.expiry_heap = [(e.expires_at, e.sequence, k) for k, e in self.entries.items()]
+        heapq.heapify(self.expiry_heap)
+        if self.policy == 'gdsf':
+            self.priority_heap = [(e.priority, e.token, k) for k, e in self.entries.items()]
+            heapq.heapify(self.priority_heap)
+
 
 class SimpleCache:
-    """Simple in-memory cache implementation"""
+    """
+    Bounded, thread-safe in-memory cache with LRU or GDSF eviction and TTLs
+    
+    Keys are spread over ``stripes`` independently locked shards so threads
+    touching different keys rarely contend. Each shard holds an equal share
+    of ``max_entries`` and ``max_bytes`` and evicts when either is exceeded,
+    so eviction order is per shard (approximately global). Entry sizes are
+    estimated with ``size_of`` (estimate_size by default) on insert; a
+    value larger than a shard's byte share is not cached. Expiry uses
+    ``time.monotonic`` and is unaffected by wall-clock changes.
+    """
     
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self,
+                 default_ttl: int = 300,
+                 max_entries: Optional[int] = 1024,
+                 stripes: int = 16,
+                 max_bytes: Optional[int] = None,
+                 policy: str = 'lru',
+                 size_of: Callable[[Any], int] = estimate_size):
         """
         Initialize cache
         
         Args:
             default_ttl: Default time-to-live in seconds (5 minutes)
+            max_entries: Maximum number of entries kept (None = no limit)
+            stripes: Number of lock stripes (capped at max_entries)
+            max_bytes: Memory budget in bytes (None = no limit)
+            policy: 'lru', or 'gdsf' to weigh size, hit count and cost
+            size_of: Estimates the size of a value in bytes
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{policy}'. Options: {', '.join(EVICTION_POLICIES)}")
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.size_of = size_of
+        if max_entries is not None:
+            stripes = min(stripes, max_entries)
+        stripes = max(1, stripes)
+        self._shards = [
+            _CacheShard(self._share(max_entries, stripes, i), self._share(max_bytes, stripes, i), policy)
+            for i in range(stripes)
+        ]
+    
+    @staticmethod
+    def _share(limit: Optional[int], stripes: int, index: int) -> Optional[int]:
+        """Split a limit evenly over the stripes."""
+        if limit is None:
+            return None
+        base, extra = divmod(limit, stripes)
+        return base + (1 if index < extra else 0)
+    
+    def _shard(self, key: Any) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+    
+    @property
+    def current_bytes(self) -> int:
+        """Estimated bytes held by cached values"""
+        return sum(shard.bytes for shard in self._shards)
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, cost: float = 1.0) -> bool:
         """
         Set cache value with optional TTL
         
@@ -29,34 +295,29 @@ class SimpleCache:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
+            cost: Relative cost of recomputing the value (used by 'gdsf'),
+                e.g. the seconds it took
+        
+        Returns:
+            bool: False if the value is too large to cache
         """
         ttl = ttl or self.default_ttl
-        self.cache[key] = {
-            'value': value,
-            'expires_at': datetime.now() + timedelta(seconds=ttl)
-        }
+        size = self.size_of(value) + sys.getsizeof(key)
+        now = time.monotonic()
+        return self._shard(key).set(key, value, now + ttl, now, size, cost)
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
         """
         Get value from cache if not expired
         
         Args:
             key: Cache key
-            
+            default: Returned on a miss (lets callers cache None)
+        
         Returns:
-            Cached value or None if expired/not found
+            Cached value or default if expired/not found
         """
-        if key not in self.cache:
-            return None
-        
-        entry = self.cache[key]
-        
-        # Check if expired
-        if datetime.now() > entry['expires_at']:
-            del self.cache[key]
-            return None
-        
-        return entry['value']
+        return self._shard(key).get(key, time.monotonic(), default)
     
     def delete(self, key: str) -> bool:
         """
@@ -64,68 +325,621 @@ class SimpleCache:
         
         Args:
             key: Cache key
-            
+        
         Returns:
             True if deleted, False if key didn't exist
         """
-        if key in self.cache:
-            del self.cache[key]
-            return True
-        return False
+        return self._shard(key).delete(key)
     
     def clear(self) -> None:
         """Clear all cache entries"""
-        self.cache.clear()
+        for shard in self._shards:
+            shard.clear()
     
     def cleanup_expired(self) -> int:
         """
         Remove expired entries
         
+        Expired entries are also dropped as new ones are set, so calling
+        this is only needed to release memory of an idle cache.
+        
         Returns:
             Number of entries removed
         """
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if datetime.now() > entry['expires_at']
-        ]
+        now = time.monotonic()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.expire(now)
+        return removed
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            dict: Entry count and limits, estimated bytes used, hits,
+            misses, evictions, expirations, rejected (too large) entries
+            and hit rate (percent)
+        """
+        totals = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'rejected': 0}
+        entries = 0
+        used = 0
+        for shard in self._shards:
+            with shard.lock:
+                entries += len(shard.entries)
+                used += shard.bytes
+                for name in totals:
+                    totals[name] += getattr(shard, name)
+        lookups = totals['hits'] + totals['misses']
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'bytes': used,
+            'max_bytes': self.max_bytes,
+            'policy': self.policy,
+            **totals,
+            'hit_rate': round(totals['hits'] / lookups * 100, 2) if lookups else 0.0,
+        }
+
+
+# Values at least this large are zlib-compressed in the shared tier
+SHARED_COMPRESS_THRESHOLD = 1024
+
+# Serialised value header: how the payload is encoded
+_RAW = b'\x00'
+_ZLIB = b'\x01'
+
+# Marker for misses, so cached None values are distinguishable
+_MISSING = object()
+
+
+def dump_value(value: Any) -> bytes:
+    """
+    Serialise a value to compact bytes for the shared cache tier
+    
+    Pickle (highest protocol), zlib-compressed when that saves space,
+    behind a one-byte header saying which.
+    
+    Args:
+        value: Picklable value
+    
+    Returns:
+        bytes: Encoded value
+    """
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(payload) >= SHARED_COMPRESS_THRESHOLD:
+        compressed = zlib.compress(payload, 1)
+        if len(compressed) < len(payload):
+            return _ZLIB + compressed
+    return _RAW + payload
+
+
+def load_value(data: bytes) -> Any:
+    """
+    Decode bytes produced by dump_value
+    
+    Args:
+        data: Encoded value
+    
+    Returns:
+        The original value
+    """
+    payload = data[1:]
+    if data[:1] == _ZLIB:
+        payload = zlib.decompress(payload)
+    return pickle.loads(payload)
+
+
+class SharedCache:
+    """
+    Cache tier shared by all worker processes on a host
+    
+    Entries live in one SQLite file in WAL mode, so any number of processes
+    read concurrently while writers take turns (each write is a single
+    autocommitted statement; a busy database is waited on for
+    ``busy_timeout`` seconds). Keys are stored as 16-byte BLAKE2b digests
+    and values as dump_value() bytes. Expiry uses wall-clock time, since
+    monotonic clocks are not comparable across processes.
+    
+    Every ``trim_every`` writes, expired rows are deleted and the least
+    recently used rows are dropped until the file holds at most
+    ``max_bytes`` of values. Access times are refreshed at most once per
+    ``touch_interval`` seconds so reads rarely write.
+    
+    The cache is best effort: database errors are counted and treated as
+    misses. Values are unpickled, so the directory must only be writable by
+    the application's own user.
+    """
+    
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key BLOB PRIMARY KEY,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries(accessed_at);
+    CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires_at);
+    """
+    
+    def __init__(self,
+                 directory: str,
+                 default_ttl: int = 300,
+                 max_bytes: Optional[int] = 1024 * 1024 * 1024,
+                 busy_timeout: float = 1.0,
+                 trim_every: int = 100,
+                 touch_interval: float = 60.0):
+        """
+        Initialize shared cache
+        
+        Args:
+            directory: Local directory holding the cache file
+            default_ttl: Default time-to-live in seconds
+            max_bytes: Budget for stored (encoded) values (None = no limit)
+            busy_timeout: Seconds to wait for another process's write
+            trim_every: Writes between expiry and size trims
+            touch_interval: Minimum seconds between access-time updates
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, 'shared_cache.db')
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self.trim_every = trim_every
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._counter_lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.trims = 0
+    
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (reopened after a fork)."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(self._SCHEMA)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+    
+    @staticmethod
+    def _key(key: Any) -> bytes:
+        return hashlib.blake2b(str(key).encode('utf-8'), digest_size=16).digest()
+    
+    def _count(self, name: str) -> None:
+        with self._counter_lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def lookup(self, key: Any) -> Tuple[Any, float]:
+        """
+        Look up a value and its remaining time-to-live
+        
+        Returns:
+            tuple: (value or _MISSING, seconds until it expires)
+        """
+        now = time.time()
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                'SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?',
+                (self._key(key),)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self._count('misses')
+                return _MISSING, 0.0
+            value = load_value(row[0])
+            if now - row[2] > self.touch_interval:
+                connection.execute('UPDATE cache_entries SET accessed_at = ? WHERE key = ?',
+                                   (now, self._key(key)))
+        except (sqlite3.Error, pickle.UnpicklingError, zlib.error, EOFError) as e:
+            logger.debug(f"Shared cache read failed: {e}")
+            self._count('errors')
+            self._count('misses')
+            return _MISSING, 0.0
+        self._count('hits')
+        return value, row[1] - now
+    
+    def get(self, key: Any, default: Any = None) -> Optional[Any]:
+        """
+        Get value from cache if not expired
+        
+        Args:
+            key: Cache key
+            default: Returned on a miss
+        
+        Returns:
+            Cached value or default if expired/not found
+        """
+        value, _ = self.lookup(key)
+        return default if value is _MISSING else value
+    
+    def set(self, key: Any, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Store a value for all processes
+        
+        Args:
+            key: Cache key
+            value: Picklable value
+            ttl: Time-to-live in seconds (uses default if None)
         
-        for key in expired_keys:
-            del self.cache[key]
+        Returns:
+            bool: False if the value could not be stored
+        """
+        ttl = ttl or self.default_ttl
+        now = time.time()
+        try:
+            data = dump_value(value)
+            connection = self._connection()
+            connection.execute(
+                'INSERT OR REPLACE INTO cache_entries (key, value, size, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (self._key(key), data, len(data), now + ttl, now)
+            )
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f"Shared cache write failed: {e}")
+            self._count('errors')
+            return False
         
-        return len(expired_keys)
+        with self._counter_lock:
+            self._writes += 1
+            trim = self._writes % self.trim_every == 0
+        if trim:
+            self.trim()
+        return True
+    
+    def delete(self, key: Any) -> bool:
+        """
+        Delete cache entry
+        
+        Returns:
+            True if deleted, False if key didn't exist
+        """
+        try:
+            cursor = self._connection().execute('DELETE FROM cache_entries WHERE key = ?', (self._key(key),))
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.debug(f"Shared cache delete failed: {e}")
+            self._count('errors')
+            return False
+    
+    def clear(self) -> None:
+        """Clear all cache entries (for every process)"""
+        try:
+            self._connection().execute('DELETE FROM cache_entries')
+        except sqlite3.Error as e:
+            logger.debug(f"Shared cache clear failed: {e}")
+            self._count('errors')
+    
+    def trim(self) -> int:
+        """
+        Delete expired rows, then least recently used rows over max_bytes
+        
+        Returns:
+            Number of rows removed
+        """
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                removed = connection.execute(
+                    'DELETE FROM cache_entries WHERE expires_at <= ?', (time.time(),)
+                ).rowcount
+                if self.max_bytes is not None:
+                    used = connection.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entries').fetchone()[0]
+                    excess = used - self.max_bytes
+                    rows = connection.execute(
+                        'SELECT key, size FROM cache_entries ORDER BY accessed_at'
+                    ) if excess > 0 else ()
+                    doomed = []
+                    for key, size in rows:
+                        if excess <= 0:
+                            break
+                        doomed.append((key,))
+                        excess -= size
+                    connection.executemany('DELETE FROM cache_entries WHERE key = ?', doomed)
+                    removed += len(doomed)
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            logger.debug(f"Shared cache trim failed: {e}")
+            self._count('errors')
+            return 0
+        self._count('trims')
+        return removed
+    
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired entries (and trim to max_bytes)
+        
+        Returns:
+            Number of entries removed
+        """
+        return self.trim()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            dict: Entry count, stored bytes and budget, hits, misses,
+            errors, trims and hit rate (percent) of this process
+        """
+        try:
+            entries, used = self._connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries'
+            ).fetchone()
+        except sqlite3.Error:
+            entries, used = None, None
+        lookups = self.hits + self.misses
+        return {
+            'path': self.path,
+            'entries': entries,
+            'bytes': used,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'errors': self.errors,
+            'trims': self.trims,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
 
 
-def cache_result(ttl: int = 300) -> Callable:
+class TieredCache:
+    """
+    In-process SimpleCache in front of a SharedCache
+    
+    Lookups try the local tier first and fall back to the shared tier; a
+    shared hit is copied into the local tier for the rest of its lifetime.
+    Writes go to both tiers, so one worker's result warms every worker.
+    """
+    
+    def __init__(self, local: SimpleCache, shared: SharedCache):
+        """
+        Initialize tiered cache
+        
+        Args:
+            local: Per-process tier (consulted first)
+            shared: Cross-process tier
+        """
+        self.local = local
+        self.shared = shared
+        self.default_ttl = local.default_ttl
+    
+    def __len__(self) -> int:
+        return len(self.local)
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, cost: float = 1.0) -> bool:
+        """
+        Set cache value in both tiers
+        
+        Args:
+            key: Cache key
+            value: Value to cache (only picklable values reach the shared tier)
+            ttl: Time-to-live in seconds (uses default if None)
+            cost: Relative cost of recomputing the value (local 'gdsf' policy)
+        
+        Returns:
+            bool: True if either tier stored the value
+        """
+        stored = self.local.set(key, value, ttl, cost)
+        return self.shared.set(key, value, ttl or self.default_ttl) or stored
+    
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        """
+        Get value from the local tier, else the shared tier
+        
+        Args:
+            key: Cache key
+            default: Returned on a miss
+        
+        Returns:
+            Cached value or default if expired/not found
+        """
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value, remaining = self.shared.lookup(key)
+        if value is _MISSING:
+            return default
+        self.local.set(key, value, max(remaining, 0.001))
+        return value
+    
+    def delete(self, key: str) -> bool:
+        """Delete cache entry from both tiers"""
+        local = self.local.delete(key)
+        return self.shared.delete(key) or local
+    
+    def clear(self) -> None:
+        """Clear both tiers"""
+        self.local.clear()
+        self.shared.clear()
+    
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from both tiers"""
+        return self.local.cleanup_expired() + self.shared.cleanup_expired()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Statistics of both tiers"""
+        return {'local': self.local.stats(), 'shared': self.shared.stats()}
+
+
+def _feed(hasher: Any, value: Any) -> None:
+    """Write a canonical, type-tagged encoding of value into a hasher."""
+    if value is None:
+        hasher.update(b'N')
+    elif value is True or value is False:
+        hasher.update(b'T' if value else b'F')
+    elif isinstance(value, str):
+        data = value.encode('utf-8', 'surrogatepass')
+        hasher.update(b's%d:' % len(data))
+        hasher.update(data)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        hasher.update(b'b%d:' % len(value))
+        hasher.update(value)
+    elif isinstance(value, int):
+        hasher.update(b'i%d;' % value)
+    elif isinstance(value, float):
+        hasher.update(b'f' + value.hex().encode('ascii') + b';')
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'%s%d:' % (b'l' if isinstance(value, list) else b't', len(value)))
+        for item in value:
+            _feed(hasher, item)
+    elif isinstance(value, dict):
+        # Order-independent: items sorted by the digest of their key
+        items = sorted((_digest(key), item) for key, item in value.items())
+        hasher.update(b'd%d:' % len(items))
+        for key_digest, item in items:
+            hasher.update(key_digest)
+            _feed(hasher, item)
+    elif isinstance(value, (set, frozenset)):
+        digests = sorted(_digest(item) for item in value)
+        hasher.update(b'S%d:' % len(digests))
+        hasher.update(b''.join(digests))
+    else:
+        kind = type(value)
+        _feed(hasher, f'{kind.__module__}.{kind.__qualname__}:{value!r}')
+
+
+def _digest(value: Any) -> bytes:
+    hasher = hashlib.blake2b(digest_size=16)
+    _feed(hasher, value)
+    return hasher.digest()
+
+
+def make_cache_key(func: Callable, args: tuple, kwargs: Dict[str, Any],
+                   signature: Optional[inspect.Signature] = None) -> str:
+    """
+    Stable cache key for a call
+    
+    Arguments are bound to the function's signature (so f(1, b=2), f(1, 2)
+    and f(b=2, a=1) agree and defaults are filled in) and digested with
+    BLAKE2b over a canonical, type-tagged encoding, so keys stay short for
+    multi-megabyte arguments and do not depend on keyword order. Objects
+    of other types are encoded by their type and repr.
+    
+    Args:
+        func: Cached function
+        args: Positional arguments
+        kwargs: Keyword arguments
+        signature: func's signature, if already computed
+    
+    Returns:
+        str: '<module>.<qualname>:<32 hex digits>'
+    """
+    try:
+        bound = (signature or inspect.signature(func)).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+    except (TypeError, ValueError):
+        arguments = {'*args': args, '**kwargs': kwargs}
+    hasher = hashlib.blake2b(digest_size=16)
+    _feed(hasher, list(arguments.items()))
+    return f"{func.__module__}.{func.__qualname__}:{hasher.hexdigest()}"
+
+
+class _Flight:
+    """A computation in progress that concurrent callers wait on."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def cache_result(ttl: int = 300, max_entries: int = 1024,
+                 cache: Optional[Union[SimpleCache, TieredCache]] = None) -> Callable:
     """
     Decorator to cache function results
     
+    Keys come from make_cache_key. Concurrent calls with the same key while
+    the result is being computed wait for that one computation (single
+    flight) instead of each running the function; if it raises, they all
+    get the exception and nothing is cached. None results are cached too.
+    
     Args:
         ttl: Time-to-live in seconds
-        
+        max_entries: Maximum number of cached results (own cache only)
+        cache: Cache to store results in (e.g. global_cache, to share them
+            between processes); by default each function gets its own
+    
     Returns:
         Decorator function
     """
-    _cache = SimpleCache(default_ttl=ttl)
+    _cache = cache if cache is not None else SimpleCache(default_ttl=ttl, max_entries=max_entries)
     
     def decorator(func: Callable) -> Callable:
+        try:
+            signature: Optional[inspect.Signature] = inspect.signature(func)
+        except (TypeError, ValueError):
+            signature = None
+        flights: Dict[str, _Flight] = {}
+        flights_lock = threading.Lock()
+        
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Create cache key from function name and arguments
-            cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
+            cache_key = make_cache_key(func, args, kwargs, signature)
             
             # Try to get from cache
-            cached = _cache.get(cache_key)
-            if cached is not None:
+            cached = _cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
                 return cached
             
+            with flights_lock:
+                flight = flights.get(cache_key)
+                leader = flight is None
+                if leader:
+                    flight = flights[cache_key] = _Flight()
+            
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+            
             # Execute function and cache result
-            result = func(*args, **kwargs)
-            _cache.set(cache_key, result, ttl)
-            return result
+            try:
+                # A previous flight may have stored the result between our
+                # miss and taking the lead
+                cached = _cache.get(cache_key, _MISSING)
+                if cached is not _MISSING:
+                    flight.result = cached
+                    return cached
+                flight.result = func(*args, **kwargs)
+                _cache.set(cache_key, flight.result, ttl)
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with flights_lock:
+                    del flights[cache_key]
+                flight.done.set()
         
+        wrapper.cache = _cache
+        wrapper.cache_key = lambda *args, **kwargs: make_cache_key(func, args, kwargs, signature)
         return wrapper
     return decorator
 
 
-# Global cache instance
-global_cache = SimpleCache()
+# Global cache instance (shared between workers when SHARED_CACHE_DIR is set)
+global_cache: Union[SimpleCache, TieredCache] = SimpleCache(
+    default_ttl=config.CACHE_DEFAULT_TIMEOUT,
+    max_entries=config.CACHE_MAX_ENTRIES,
+    max_bytes=config.CACHE_MAX_BYTES,
+    policy=config.CACHE_EVICTION_POLICY
+)
+if config.SHARED_CACHE_DIR:
+    global_cache = TieredCache(global_cache, SharedCache(
+        config.SHARED_CACHE_DIR,
+        default_ttl=config.CACHE_DEFAULT_TIMEOUT,
+        max_bytes=config.SHARED_CACHE_MAX_BYTES
+    ))
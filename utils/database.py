@@ -3,82 +3,424 @@ Database Connection Pool Manager
 
 Manages database connections with connection pooling, health checks,
 and automatic reconnection capabilities.
+
+SQLite is the supported backend (config.DATABASE_TYPE = 'sqlite'). It stores
+resume fingerprints with their extracted skill sets and the results of each
+analysis, indexed for lookup by resume hash and by skill.
 """
 
-from typing import Optional, List
+import hashlib
+import json
+import sqlite3
+import itertools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, List, Any, Dict, Iterable, Iterator, Sequence, Set
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import time
+import logging
+
+import config
+from utils.exceptions import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+
+# Backends with a working driver
+SUPPORTED_DATABASE_TYPES = ('sqlite',)
+
+# Statements cached per connection (sqlite3 prepares each distinct SQL once)
+STATEMENT_CACHE_SIZE = 256
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    resume_hash TEXT PRIMARY KEY,
+    taxonomy TEXT NOT NULL DEFAULT '',
+    text_length INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    -- Increases with every committed write (see save_resumes)
+    change_seq INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- Incremental loads of recently stored resumes (ResumeCorpus.sync)
+CREATE INDEX IF NOT EXISTS idx_resumes_change_seq ON resumes(change_seq);
+
+CREATE TABLE IF NOT EXISTS skills (
+    skill_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS resume_skills (
+    resume_hash TEXT NOT NULL REFERENCES resumes(resume_hash) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills(skill_id),
+    PRIMARY KEY (resume_hash, skill_id)
+) WITHOUT ROWID;
+
+-- Skill -> resumes lookups (the primary key serves resume -> skills)
+CREATE INDEX IF NOT EXISTS idx_resume_skills_skill ON resume_skills(skill_id, resume_hash);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    analysis_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_hash TEXT NOT NULL REFERENCES resumes(resume_hash) ON DELETE CASCADE,
+    job_hash TEXT NOT NULL,
+    match_percentage REAL NOT NULL,
+    match_level TEXT NOT NULL DEFAULT '',
+    result TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_analyses_resume ON analyses(resume_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_job ON analyses(job_hash, match_percentage);
+"""
+
+# Statements are module constants so every call reuses the prepared statement
+_UPSERT_RESUME = """
+INSERT INTO resumes (resume_hash, taxonomy, text_length, created_at, updated_at, change_seq)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(resume_hash) DO UPDATE SET
+    taxonomy = excluded.taxonomy,
+    text_length = excluded.text_length,
+    updated_at = excluded.updated_at,
+    change_seq = excluded.change_seq
+"""
+_NEXT_CHANGE_SEQ = "SELECT COALESCE(MAX(change_seq), 0) + 1 FROM resumes"
+_INSERT_SKILL = "INSERT OR IGNORE INTO skills (name) VALUES (?)"
+_SELECT_SKILL_IDS = "SELECT skill_id, name FROM skills WHERE name IN ({})"
+_DELETE_RESUME_SKILLS = "DELETE FROM resume_skills WHERE resume_hash = ?"
+_INSERT_RESUME_SKILL = "INSERT OR IGNORE INTO resume_skills (resume_hash, skill_id) VALUES (?, ?)"
+_INSERT_ANALYSIS = """
+INSERT INTO analyses (resume_hash, job_hash, match_percentage, match_level, result, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SELECT_RESUME = "SELECT resume_hash, taxonomy, text_length, created_at, updated_at FROM resumes WHERE resume_hash = ?"
+_SELECT_RESUME_SKILLS = """
+SELECT s.name FROM resume_skills rs JOIN skills s ON s.skill_id = rs.skill_id
+WHERE rs.resume_hash = ? ORDER BY s.name
+"""
+_SELECT_RESUMES_BY_SKILL = """
+SELECT rs.resume_hash FROM resume_skills rs JOIN skills s ON s.skill_id = rs.skill_id
+WHERE s.name = ? ORDER BY rs.resume_hash LIMIT ?
+"""
+_SELECT_RESUME_SKILLS_SINCE = """
+SELECT r.resume_hash, r.change_seq, s.name FROM resumes r
+LEFT JOIN resume_skills rs ON rs.resume_hash = r.resume_hash
+LEFT JOIN skills s ON s.skill_id = rs.skill_id
+WHERE r.change_seq > ? ORDER BY r.change_seq, r.resume_hash
+"""
+_SELECT_ANALYSES = """
+SELECT analysis_id, resume_hash, job_hash, match_percentage, match_level, result, created_at
+FROM analyses WHERE resume_hash = ? ORDER BY created_at DESC, analysis_id DESC LIMIT ?
+"""
+
+# SQLite's default limit on host parameters per statement
+_MAX_VARIABLES = 999
+
+_memory_database_ids = itertools.count()
 
 
 @dataclass
 class ConnectionConfig:
     """Database connection configuration."""
-    host: str
-    port: int
-    database: str
-    user: str
-    password: str
+    host: str = 'localhost'
+    port: int = 0
+    database: str = 'resume_analyzer.db'
+    user: str = ''
+    password: str = ''
     pool_size: int = 10
     max_overflow: int = 20
     pool_timeout: int = 30
     pool_recycle: int = 3600
+    database_type: str = 'sqlite'
+    
+    @classmethod
+    def from_settings(cls) -> 'ConnectionConfig':
+        """Build from config.DATABASE_TYPE / DATABASE_CONFIG / DATABASE_PATH."""
+        database_type = config.DATABASE_TYPE
+        settings = dict(config.DATABASE_CONFIG.get(database_type, {}))
+        if database_type == 'sqlite':
+            settings['database'] = config.DATABASE_PATH
+        return cls(
+            pool_size=config.DATABASE_POOL_SIZE,
+            database_type=database_type,
+            **settings
+        )
+
+
+class PooledConnection:
+    """A driver connection with the bookkeeping the pool needs."""
+    
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.created = time.monotonic()
+        self.last_used = datetime.utcnow()
+        
+    def age(self) -> float:
+        """Seconds since the connection was opened."""
+        return time.monotonic() - self.created
+        
+    def close(self) -> None:
+        """Close the underlying connection."""
+        try:
+            self.connection.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Error closing database connection: {e}")
+
+
+class _Waiter:
+    """A thread blocked in get_connection, served in arrival order."""
+    
+    def __init__(self, lock: threading.Lock):
+        self.ready = threading.Condition(lock)
+        # Set by return_connection: a connection, True for a free slot, or
+        # False when the pool was closed
+        self.handoff: Any = None
 
 
 class ConnectionPool:
-    """Manages database connection pool."""
+    """
+    Manages database connection pool
+    
+    Idle connections are kept on a LIFO stack (the most recently used, and
+    so warmest, connection is handed out first). When all ``pool_size``
+    connections are checked out, up to ``max_overflow`` extra connections
+    are opened and closed again when returned; beyond that, callers wait on
+    a condition variable until a connection is returned or ``pool_timeout``
+    expires. Returned connections are handed directly to the longest
+    waiting caller, so waits are FIFO and a busy thread cannot starve others
+    by re-acquiring the connection it just returned. Connections older than
+    ``pool_recycle`` seconds (<= 0 to disable) are replaced at checkout and
+    closed at return.
+    """
     
     def __init__(self, config: ConnectionConfig):
         self.config = config
-        self.connections: List = []
-        self.available: List = []
-        self.in_use: List = []
+        self.available: deque = deque()
+        self.in_use: Set[PooledConnection] = set()
         self.initialized = False
         self.last_health_check = None
+        self._target = self._sqlite_target(config.database)
+        # Open connections plus connections being opened
+        self._size = 0
+        self._waiters: deque = deque()
+        self._counters = {'checkouts': 0, 'waits': 0, 'timeouts': 0, 'recycled': 0, 'overflow_opened': 0}
+        self._lock = threading.Lock()
+        
+    @staticmethod
+    def _sqlite_target(database: str) -> str:
+        """
+        SQLite database to open
+        
+        ':memory:' would give every pooled connection its own empty
+        database, so it maps to a named shared-cache in-memory database.
+        """
+        if database == ':memory:':
+            return f'file:resume_analyzer_{next(_memory_database_ids)}?mode=memory&cache=shared'
+        return database
+        
+    @property
+    def max_size(self) -> int:
+        """Most connections open at once (pool_size + max_overflow)"""
+        return self.config.pool_size + max(self.config.max_overflow, 0)
         
     def initialize(self) -> bool:
-        """Initialize connection pool."""
+        """
+        Initialize connection pool
+        
+        Opens ``pool_size`` connections; if any of them fails, the ones
+        already opened are closed again and the pool stays uninitialized.
+        
+        Returns:
+            bool: True once the pool is ready
+            
+        Raises:
+            DatabaseError: If a connection cannot be opened
+        """
+        connections: List[PooledConnection] = []
         try:
             for _ in range(self.config.pool_size):
-                conn = self._create_connection()
-                if conn:
-                    self.available.append(conn)
-            self.initialized = True
-            return True
-        except Exception as e:
-            print(f"Failed to initialize connection pool: {e}")
-            return False
+                connections.append(self._create_connection())
+        except (DatabaseError, sqlite3.Error) as e:
+            logger.error(f"Failed to initialize connection pool: {str(e)}")
+            for conn in connections:
+                conn.close()
+            if isinstance(e, DatabaseError):
+                raise
+            raise DatabaseError(f"Failed to initialize connection pool: {str(e)}") from e
             
-    def _create_connection(self):
+        with self._lock:
+            self.available.extend(connections)
+            self._size += len(connections)
+            self.initialized = True
+        return True
+        
+    def _create_connection(self) -> PooledConnection:
         """Create a new database connection."""
-        # Placeholder for actual database connection
-        return {
-            'id': id(self),
-            'created': datetime.utcnow(),
-            'last_used': datetime.utcnow(),
-        }
+        if self.config.database_type not in SUPPORTED_DATABASE_TYPES:
+            raise DatabaseError(
+                f"Unsupported database type '{self.config.database_type}'. "
+                f"Options: {', '.join(SUPPORTED_DATABASE_TYPES)}"
+            )
+            
+        # Autocommit mode: transactions are opened explicitly (BEGIN IMMEDIATE)
+        connection = sqlite3.connect(
+            self._target,
+            timeout=self.config.pool_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            uri=self._target.startswith('file:')
+        )
+        connection.row_factory = sqlite3.Row
+        try:
+            # WAL lets readers proceed while a writer commits; NORMAL sync is
+            # durable across application crashes in WAL mode
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA foreign_keys=ON')
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return PooledConnection(connection)
         
-    def get_connection(self, timeout: Optional[int] = None):
-        """Get a connection from the pool."""
-        timeout = timeout or self.config.pool_timeout
-        start_time = time.time()
+    def _expired(self, conn: PooledConnection) -> bool:
+        return 0 < self.config.pool_recycle < conn.age()
         
-        while (time.time() - start_time) < timeout:
-            if self.available:
-                conn = self.available.pop()
-                self.in_use.append(conn)
-                return conn
-            time.sleep(0.1)
+    def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Check out a connection
+        
+        Prefer ``with pool.connection() as conn:``, which always returns it.
+        
+        Args:
+            timeout: Seconds to wait for a free connection (default: pool_timeout)
+            
+        Returns:
+            PooledConnection
             
-        raise TimeoutError(f"Could not get connection within {timeout}s")
+        Raises:
+            TimeoutError: If no connection frees up within the timeout
+            DatabaseError: If the pool is closed while waiting
+        """
+        timeout = self.config.pool_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        stale = None
         
-    def return_connection(self, conn) -> None:
+        with self._lock:
+            if self.available and not self._waiters:
+                conn = self.available.pop()
+                if not self._expired(conn):
+                    self.in_use.add(conn)
+                    self._counters['checkouts'] += 1
+                    return conn
+                # Replace the stale connection, keeping its slot
+                stale = conn
+                self._counters['recycled'] += 1
+            elif self._size < self.max_size and not self._waiters:
+                if self._size >= self.config.pool_size:
+                    self._counters['overflow_opened'] += 1
+                self._size += 1
+            else:
+                handoff = self._wait_for_handoff(deadline, timeout)
+                if isinstance(handoff, PooledConnection):
+                    if not self._expired(handoff):
+                        self.in_use.add(handoff)
+                        self._counters['checkouts'] += 1
+                        return handoff
+                    stale = handoff
+                    self._counters['recycled'] += 1
+                    
+        # Connect outside the lock; the slot is already reserved
+        if stale is not None:
+            stale.close()
+        try:
+            conn = self._create_connection()
+        except Exception:
+            with self._lock:
+                self._release_slot()
+            raise
+        with self._lock:
+            self.in_use.add(conn)
+            self._counters['checkouts'] += 1
+        return conn
+        
+    def _wait_for_handoff(self, deadline: float, timeout: float) -> Any:
+        """Queue behind earlier waiters until handed a connection or slot (lock held)."""
+        waiter = _Waiter(self._lock)
+        self._waiters.append(waiter)
+        self._counters['waits'] += 1
+        while waiter.handoff is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._waiters.remove(waiter)
+                self._counters['timeouts'] += 1
+                raise TimeoutError(f"Could not get connection within {timeout}s")
+            waiter.ready.wait(remaining)
+        if waiter.handoff is False:
+            raise DatabaseError("Connection pool was closed")
+        return waiter.handoff
+        
+    def _release_slot(self) -> None:
+        """Give a freed slot to the next waiter, or shrink the pool (lock held)."""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.handoff = True
+            waiter.ready.notify()
+        else:
+            self._size -= 1
+            
+    def return_connection(self, conn: PooledConnection) -> None:
         """Return a connection to the pool."""
-        if conn in self.in_use:
-            self.in_use.remove(conn)
-        conn['last_used'] = datetime.utcnow()
-        self.available.append(conn)
+        if conn.connection.in_transaction:
+            conn.connection.rollback()
+        conn.last_used = datetime.utcnow()
+        
+        with self._lock:
+            if conn not in self.in_use:
+                return
+            self.in_use.discard(conn)
+            discard = False
+            if self._expired(conn):
+                discard = True
+                self._release_slot()
+            elif self._waiters:
+                # Waiters are handed connections whether or not initialize()
+                # has run; close_all() clears them, so a closed pool has none
+                waiter = self._waiters.popleft()
+                waiter.handoff = conn
+                waiter.ready.notify()
+            elif not self.initialized or self._size > self.config.pool_size:
+                # Closed or never initialized pool, or an overflow connection
+                # nobody is waiting for
+                discard = True
+                self._size -= 1
+            else:
+                self.available.append(conn)
+                
+        if discard:
+            conn.close()
+            
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[PooledConnection]:
+        """
+        Check out a connection for the duration of a with block
         
+        Args:
+            timeout: Seconds to wait for a free connection (default: pool_timeout)
+            
+        Yields:
+            PooledConnection (returned to the pool when the block exits)
+        """
+        conn = self.get_connection(timeout)
+        try:
+            yield conn
+        finally:
+            self.return_connection(conn)
+            
     def health_check(self) -> bool:
         """Check pool health status."""
         self.last_health_check = datetime.utcnow()
@@ -93,19 +435,30 @@ class ConnectionPool:
         
     def get_stats(self) -> dict:
         """Get pool statistics."""
-        return {
-            'available': len(self.available),
-            'in_use': len(self.in_use),
-            'total': len(self.available) + len(self.in_use),
-            'initialized': self.initialized,
-            'last_health_check': self.last_health_check,
-        }
-        
+        with self._lock:
+            return {
+                'available': len(self.available),
+                'in_use': len(self.in_use),
+                'total': self._size,
+                'overflow': max(self._size - self.config.pool_size, 0),
+                'waiting': len(self._waiters),
+                **self._counters,
+                'initialized': self.initialized,
+                'last_health_check': self.last_health_check,
+            }
+            
     def close_all(self) -> None:
-        """Close all connections in the pool."""
-        self.available.clear()
-        self.in_use.clear()
-        self.initialized = False
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._lock:
+            idle, self.available = list(self.available), deque()
+            self._size -= len(idle)
+            self.initialized = False
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.handoff = False
+                waiter.ready.notify()
+        for conn in idle:
+            conn.close()
 
 
 class DatabaseManager:
@@ -116,25 +469,269 @@ class DatabaseManager:
         self.pool = ConnectionPool(config)
         
     def connect(self) -> bool:
-        """Connect to database."""
-        return self.pool.initialize()
+        """
+        Connect to database and create the schema if needed
+        
+        Raises:
+            DatabaseError: If the database cannot be opened
+        """
+        self.pool.initialize()
+        try:
+            self.initialize_schema()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to create database schema: {str(e)}")
+            self.pool.close_all()
+            raise DatabaseError(f"Failed to create database schema: {str(e)}") from e
+        return True
         
     def disconnect(self) -> None:
         """Disconnect from database."""
         self.pool.close_all()
         
+    def initialize_schema(self) -> None:
+        """Create tables and indexes, upgrading older databases (idempotent)."""
+        with self.pool.connection() as conn:
+            columns = {row['name'] for row in conn.connection.execute('PRAGMA table_info(resumes)')}
+            if columns and 'change_seq' not in columns:
+                # Schema version 1; existing rows get sequence 0
+                conn.connection.execute(
+                    'ALTER TABLE resumes ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0'
+                )
+            conn.connection.executescript(SCHEMA)
+            conn.connection.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+            
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run statements in one write transaction
+        
+        Commits when the block exits normally and rolls back on an
+        exception. BEGIN IMMEDIATE takes the write lock up front so two
+        writers wait on busy_timeout instead of failing mid-transaction.
+        
+        Yields:
+            sqlite3.Connection to execute statements on
+        """
+        with self.pool.connection() as conn:
+            try:
+                conn.connection.execute('BEGIN IMMEDIATE')
+                try:
+                    yield conn.connection
+                    conn.connection.execute('COMMIT')
+                except BaseException:
+                    conn.connection.execute('ROLLBACK')
+                    raise
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Database transaction failed: {e}") from e
+                
     def execute(self, query: str, params: Optional[tuple] = None) -> List[dict]:
-        """Execute a database query."""
-        conn = self.pool.get_connection()
-        try:
-            # Placeholder for actual query execution
-            return [{'result': 'success'}]
-        finally:
-            self.pool.return_connection(conn)
+        """
+        Execute a database query
+        
+        Args:
+            query: SQL with ? placeholders
+            params: Values for the placeholders
+            
+        Returns:
+            list: Result rows as dictionaries (empty for statements
+            without results)
+        """
+        with self.pool.connection() as conn:
+            try:
+                cursor = conn.connection.execute(query, params or ())
+                return [dict(row) for row in cursor.fetchall()]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Query failed: {e}") from e
+                
+    def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Execute one statement for many parameter rows in a single transaction
+        
+        Args:
+            query: SQL with ? placeholders
+            rows: Parameter tuples (consumed lazily)
             
+        Returns:
+            int: Number of rows affected
+        """
+        with self.transaction() as connection:
+            return connection.executemany(query, rows).rowcount
+            
+    def save_resume(self, resume_hash: str, skills: Iterable[str],
+                    taxonomy: str = '', text_length: int = 0) -> None:
+        """
+        Store a resume fingerprint and replace its skill set
+        
+        Args:
+            resume_hash: SHA-256 of the uploaded file (see content_digest)
+            skills: Canonical skill names
+            taxonomy: Fingerprint of the taxonomy the skills came from
+            text_length: Length of the cleaned resume text
+        """
+        self.save_resumes([{
+            'resume_hash': resume_hash,
+            'skills': skills,
+            'taxonomy': taxonomy,
+            'text_length': text_length,
+        }])
+        
+    def save_resumes(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store many resumes in one transaction with batched inserts
+        
+        Args:
+            records: Dictionaries with resume_hash, skills and optionally
+                taxonomy and text_length
+                
+        Returns:
+            int: Number of resumes stored
+        """
+        records = [dict(record, skills=sorted(set(record['skills']))) for record in records]
+        if not records:
+            return 0
+        now = datetime.utcnow().isoformat()
+        names = sorted({name for record in records for name in record['skills']})
+        
+        with self.transaction() as connection:
+            # Taken under the write lock, so sequence numbers increase in
+            # commit order (unlike timestamps taken before waiting for it)
+            (change_seq,) = connection.execute(_NEXT_CHANGE_SEQ).fetchone()
+            connection.executemany(_UPSERT_RESUME, (
+                (record['resume_hash'], record.get('taxonomy', ''),
+                 record.get('text_length', 0), now, now, change_seq)
+                for record in records
+            ))
+            connection.executemany(_INSERT_SKILL, ((name,) for name in names))
+            skill_ids = self._skill_ids(connection, names)
+            connection.executemany(_DELETE_RESUME_SKILLS, (
+                (record['resume_hash'],) for record in records
+            ))
+            connection.executemany(_INSERT_RESUME_SKILL, (
+                (record['resume_hash'], skill_ids[name])
+                for record in records
+                for name in record['skills']
+            ))
+        return len(records)
+        
+    @staticmethod
+    def _skill_ids(connection: sqlite3.Connection, names: List[str]) -> Dict[str, int]:
+        """Map skill names to their row IDs, querying in parameter-limit batches."""
+        skill_ids = {}
+        for start in range(0, len(names), _MAX_VARIABLES):
+            batch = names[start:start + _MAX_VARIABLES]
+            query = _SELECT_SKILL_IDS.format(', '.join('?' * len(batch)))
+            skill_ids.update((row['name'], row['skill_id']) for row in connection.execute(query, batch))
+        return skill_ids
+        
+    def save_analysis(self, resume_hash: str, job_description: str,
+                      result: Dict[str, Any]) -> int:
+        """
+        Store the result of an analysis
+        
+        The resume row must exist (save_resume first).
+        
+        Args:
+            resume_hash: SHA-256 of the uploaded file
+            job_description: Job description the resume was matched against
+            result: Analysis payload (stored as JSON)
+            
+        Returns:
+            int: ID of the stored analysis
+        """
+        job_hash = hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+        with self.transaction() as connection:
+            cursor = connection.execute(_INSERT_ANALYSIS, (
+                resume_hash,
+                job_hash,
+                result.get('match_percentage', 0.0),
+                result.get('match_level', ''),
+                json.dumps(result, separators=(',', ':')),
+                datetime.utcnow().isoformat()
+            ))
+            return cursor.lastrowid
+            
+    def get_resume(self, resume_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored resume with its skills
+        
+        Returns:
+            dict or None if the resume is unknown
+        """
+        rows = self.execute(_SELECT_RESUME, (resume_hash,))
+        if not rows:
+            return None
+        resume = rows[0]
+        resume['skills'] = [row['name'] for row in self.execute(_SELECT_RESUME_SKILLS, (resume_hash,))]
+        return resume
+        
+    def find_resumes_by_skill(self, skill: str, limit: int = 100) -> List[str]:
+        """
+        Resume hashes that have a skill
+        
+        Args:
+            skill: Canonical skill name
+            limit: Maximum number of hashes
+            
+        Returns:
+            list: Resume hashes, sorted
+        """
+        return [row['resume_hash'] for row in self.execute(_SELECT_RESUMES_BY_SKILL, (skill, limit))]
+        
+    def get_resume_skills(self, after_seq: int = -1) -> List[tuple]:
+        """
+        Skill sets of resumes stored or updated after a change sequence number
+        
+        Every save_resumes() transaction stamps its resumes with a sequence
+        number greater than any committed before it, so passing the largest
+        number seen so far returns exactly the later writes.
+        
+        Args:
+            after_seq: Sequence number already seen (-1 = all resumes)
+                
+        Returns:
+            list: (resume_hash, change_seq, skill names) tuples, oldest first
+        """
+        rows = self.execute(_SELECT_RESUME_SKILLS_SINCE, (after_seq,))
+        return [
+            (resume_hash, change_seq, [row['name'] for row in group if row['name'] is not None])
+            for (resume_hash, change_seq), group in itertools.groupby(
+                rows, key=lambda row: (row['resume_hash'], row['change_seq'])
+            )
+        ]
+        
+    def get_analyses(self, resume_hash: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Most recent analyses of a resume
+        
+        Returns:
+            list: Analyses, newest first, with the stored result decoded
+        """
+        analyses = self.execute(_SELECT_ANALYSES, (resume_hash, limit))
+        for analysis in analyses:
+            analysis['result'] = json.loads(analysis['result'])
+        return analyses
+        
     def health_status(self) -> dict:
         """Get database health status."""
         return {
             'healthy': self.pool.health_check(),
             'pool_stats': self.pool.get_stats(),
         }
+
+
+def create_database_manager(connection_config: Optional[ConnectionConfig] = None) -> DatabaseManager:
+    """
+    Create and connect a DatabaseManager
+    
+    Args:
+        connection_config: Defaults to ConnectionConfig.from_settings()
+        
+    Returns:
+        Connected DatabaseManager
+        
+    Raises:
+        DatabaseError: If the database cannot be opened
+    """
+    manager = DatabaseManager(connection_config or ConnectionConfig.from_settings())
+    manager.connect()
+    return manager
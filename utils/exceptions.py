@@ -32,3 +32,8 @@ class FileHandlingError(ResumeAnalyzerException):
 class MatchingError(ResumeAnalyzerException):
     """Exception raised when skill matching fails"""
     pass
+
+
+class DatabaseError(ResumeAnalyzerException):
+    """Exception raised when a database operation fails"""
+    pass
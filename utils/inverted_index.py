@@ -0,0 +1,530 @@
+"""
+Inverted Index Module
+Persistent skill -> resume posting lists with boolean query evaluation
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import time
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+import config
+from utils.exceptions import ValidationException
+from utils.skill_taxonomy import SkillTaxonomy
+
+logger = logging.getLogger(__name__)
+
+# File layout: MAGIC, u32 header length, JSON header, padding to 4 bytes,
+# then every posting list as consecutive native uint32 values
+INDEX_MAGIC = b'RAIX0001'
+_HEADER_LENGTH = struct.Struct('<I')
+
+# Deleted documents leave a tombstone in the document table; renumber once
+# they outnumber the live documents (and at least this many exist)
+COMPACT_MIN_TOMBSTONES = 64
+
+Postings = Union[array, memoryview]
+
+
+class QuerySyntaxError(ValidationException):
+    """Raised when a boolean skill query cannot be parsed"""
+    pass
+
+
+_QUERY_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+def parse_query(query: str) -> Tuple:
+    """
+    Parse a boolean skill query into an expression tree
+
+    Grammar (operators are case-insensitive)::
+
+        expr   := term (OR term)*
+        term   := factor (AND factor)*
+        factor := NOT factor | '(' expr ')' | skill
+
+    A skill is a quoted phrase or consecutive bare words, so
+    ``machine learning AND NOT hadoop`` needs no quotes.
+
+    Args:
+        query: Query text, e.g. ``kafka AND spark AND NOT hadoop``
+
+    Returns:
+        Nested tuples: ('skill', name), ('not', x), ('and', [...]), ('or', [...])
+
+    Raises:
+        QuerySyntaxError: If the query is malformed
+    """
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _QUERY_TOKEN.match(query, position)
+        if not match or match.end() == position:
+            raise QuerySyntaxError(f"Unexpected character at position {position}")
+        position = match.end()
+        open_paren, close_paren, quoted, word = match.groups()
+        if open_paren or close_paren:
+            tokens.append(('paren', open_paren or close_paren))
+        elif quoted is not None:
+            tokens.append(('skill', quoted))
+        elif word.upper() in _OPERATORS:
+            tokens.append(('op', word.upper()))
+        elif tokens and tokens[-1][0] == 'word':
+            tokens[-1] = ('word', f'{tokens[-1][1]} {word}')
+        else:
+            tokens.append(('word', word))
+
+    tokens = [('skill', value) if kind == 'word' else (kind, value) for kind, value in tokens]
+    if not tokens:
+        raise QuerySyntaxError("Query is empty")
+
+    index = 0
+
+    def peek() -> Optional[Tuple[str, str]]:
+        return tokens[index] if index < len(tokens) else None
+
+    def advance() -> Tuple[str, str]:
+        nonlocal index
+        token = tokens[index]
+        index += 1
+        return token
+
+    def parse_expr() -> Tuple:
+        terms = [parse_term()]
+        while peek() == ('op', 'OR'):
+            advance()
+            terms.append(parse_term())
+        return terms[0] if len(terms) == 1 else ('or', terms)
+
+    def parse_term() -> Tuple:
+        factors = [parse_factor()]
+        while peek() == ('op', 'AND'):
+            advance()
+            factors.append(parse_factor())
+        return factors[0] if len(factors) == 1 else ('and', factors)
+
+    def parse_factor() -> Tuple:
+        token = peek()
+        if token is None:
+            raise QuerySyntaxError("Unexpected end of query")
+        if token == ('op', 'NOT'):
+            advance()
+            return ('not', parse_factor())
+        if token == ('paren', '('):
+            advance()
+            node = parse_expr()
+            if peek() != ('paren', ')'):
+                raise QuerySyntaxError("Missing closing parenthesis")
+            advance()
+            return node
+        if token[0] == 'skill':
+            advance()
+            return ('skill', token[1])
+        raise QuerySyntaxError(f"Unexpected '{token[1]}'")
+
+    tree = parse_expr()
+    if index != len(tokens):
+        raise QuerySyntaxError(f"Unexpected '{tokens[index][1]}'")
+    return tree
+
+
+class InvertedIndex:
+    """
+    Skill -> resume inverted index with incremental updates
+
+    Resumes get dense internal document numbers in insertion order, so every
+    posting list is a sorted ``array('I')`` (4 bytes per entry) that mostly
+    grows at the end. Re-indexing a resume keeps its document number and
+    only touches the posting lists of its old and new skills; deletions
+    leave tombstones that are compacted away once they pile up and on save.
+    Lists are keyed by canonical skill name, which - unlike integer skill
+    IDs - stays stable across taxonomy reloads and restarts. A saved index
+    is memory-mapped on load; posting lists are read straight from the
+    mapping and copied only when modified.
+
+    Each process holds its own copy. With a database, ``sync`` pulls in
+    resumes stored by other workers, and the saved file records how far it
+    was synced, so whichever worker saved last, the file is a consistent
+    snapshot that later syncs complete. Without one, a worker only sees
+    the resumes it indexed itself (plus the file as it was at startup).
+    """
+
+    def __init__(self, path: Optional[str] = None, autosave_interval: float = 60.0):
+        """
+        Initialize index, loading it from ``path`` if the file exists
+
+        Args:
+            path: Index file for persistence (None = memory only)
+            autosave_interval: Minimum seconds between automatic saves
+        """
+        self.path = path
+        self.autosave_interval = autosave_interval
+        self._docs: List[Optional[str]] = []
+        self._doc_numbers: Dict[str, int] = {}
+        self._live = array('I')
+        self._postings: Dict[str, Postings] = {}
+        # doc number -> skills, built lazily after load()
+        self._doc_skills: Optional[Dict[int, Tuple[str, ...]]] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._lock = threading.RLock()
+        # Highest database change_seq already indexed (-1 = never synced)
+        self._synced_seq = -1
+        self._sync_lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._doc_numbers
+
+    def _writable(self, skill: str) -> array:
+        """Get a mutable posting list, copying it out of the mapping if needed."""
+        postings = self._postings.get(skill)
+        if postings is None:
+            postings = self._postings[skill] = array('I')
+        elif not isinstance(postings, array):
+            postings = self._postings[skill] = array('I', postings)
+        return postings
+
+    def add(self, resume_id: str, skills: Iterable[str]) -> None:
+        """
+        Index a resume, replacing any previous entry with the same ID
+
+        Args:
+            resume_id: Resume identifier (e.g. content hash)
+            skills: Canonical skill names found in the resume
+        """
+        skills = tuple(set(skills))
+        with self._lock:
+            doc_skills = self._skills_by_doc()
+            doc = self._doc_numbers.get(resume_id)
+            if doc is None:
+                doc = len(self._docs)
+                self._docs.append(resume_id)
+                self._doc_numbers[resume_id] = doc
+                self._live.append(doc)
+                for skill in skills:
+                    self._writable(skill).append(doc)
+            else:
+                # Same document number: only the changed posting lists move
+                previous = set(doc_skills[doc])
+                for skill in previous.difference(skills):
+                    self._remove_posting(skill, doc)
+                for skill in set(skills).difference(previous):
+                    postings = self._writable(skill)
+                    postings.insert(bisect_left(postings, doc), doc)
+            doc_skills[doc] = skills
+            self._dirty = True
+
+    def sync(self, database: Any) -> int:
+        """
+        Index resumes stored in the database since the previous sync
+
+        Args:
+            database: DatabaseManager holding analysed resumes
+
+        Returns:
+            int: Number of resumes added or refreshed
+        """
+        with self._sync_lock:
+            changed = database.get_resume_skills(after_seq=self._synced_seq)
+            with self._lock:
+                for resume_id, change_seq, names in changed:
+                    self.add(resume_id, names)
+                    self._synced_seq = max(self._synced_seq, change_seq)
+            return len(changed)
+
+    def delete(self, resume_id: str) -> bool:
+        """
+        Remove a resume from the index
+
+        Args:
+            resume_id: Resume identifier
+
+        Returns:
+            True if removed, False if it was not indexed
+        """
+        with self._lock:
+            if resume_id not in self._doc_numbers:
+                return False
+            self._delete(resume_id)
+            self._dirty = True
+            return True
+
+    def _delete(self, resume_id: str) -> None:
+        doc_skills = self._skills_by_doc()
+        doc = self._doc_numbers.pop(resume_id)
+        self._docs[doc] = None
+        del self._live[bisect_left(self._live, doc)]
+        for skill in doc_skills.pop(doc):
+            self._remove_posting(skill, doc)
+
+        tombstones = len(self._docs) - len(self._live)
+        if tombstones >= COMPACT_MIN_TOMBSTONES and tombstones > len(self._live):
+            self._compact()
+
+    def _remove_posting(self, skill: str, doc: int) -> None:
+        postings = self._writable(skill)
+        position = bisect_left(postings, doc)
+        if position < len(postings) and postings[position] == doc:
+            del postings[position]
+            if not postings:
+                del self._postings[skill]
+
+    def _skills_by_doc(self) -> Dict[int, Tuple[str, ...]]:
+        """Get the doc number -> skills map, inverting the posting lists if needed."""
+        if self._doc_skills is None:
+            collected: Dict[int, List[str]] = {doc: [] for doc in self._live}
+            for skill, postings in self._postings.items():
+                for doc in postings:
+                    collected[doc].append(skill)
+            self._doc_skills = {doc: tuple(skills) for doc, skills in collected.items()}
+        return self._doc_skills
+
+    def _compact(self) -> None:
+        """Renumber live documents densely, dropping tombstones."""
+        if len(self._live) == len(self._docs):
+            return
+        renumber = np.full(len(self._docs), -1, dtype=np.int64)
+        live = self._as_array(self._live)
+        renumber[live] = np.arange(len(live))
+
+        # Renumbering preserves order, so posting lists stay sorted
+        self._postings = {
+            skill: array('I', renumber[self._as_array(postings)].astype(np.uint32).tobytes())
+            for skill, postings in self._postings.items()
+        }
+        if self._doc_skills is not None:
+            self._doc_skills = {int(renumber[doc]): skills for doc, skills in self._doc_skills.items()}
+        self._docs = [self._docs[doc] for doc in live.tolist()]
+        self._doc_numbers = {doc_id: n for n, doc_id in enumerate(self._docs)}
+        self._live = array('I', range(len(self._docs)))
+
+    def documents(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """Get every indexed resume ID with its skills, in insertion order"""
+        with self._lock:
+            doc_skills = self._skills_by_doc()
+            return [(self._docs[doc], doc_skills[doc]) for doc in self._live]
+
+    def skills(self) -> List[str]:
+        """Get all indexed skill names"""
+        return sorted(self._postings)
+
+    def document_frequency(self, skill: str) -> int:
+        """Number of resumes that have a skill"""
+        postings = self._postings.get(skill)
+        return len(postings) if postings is not None else 0
+
+    def search(self, query: str, taxonomy: Optional[SkillTaxonomy] = None) -> List[str]:
+        """
+        Evaluate a boolean skill query
+
+        Args:
+            query: e.g. ``kafka AND spark AND NOT hadoop``
+            taxonomy: Taxonomy used to resolve aliases in the query
+
+        Returns:
+            List[str]: Matching resume IDs in insertion order
+
+        Raises:
+            QuerySyntaxError: If the query is malformed
+        """
+        tree = parse_query(query)
+        with self._lock:
+            docs = self._evaluate(tree, taxonomy)
+            return [self._docs[doc] for doc in docs.tolist()]
+
+    def _as_array(self, postings: Optional[Postings]) -> np.ndarray:
+        if postings is None or not len(postings):
+            return np.empty(0, dtype=np.uint32)
+        return np.frombuffer(postings, dtype=np.uint32)
+
+    def _evaluate(self, node: Tuple, taxonomy: Optional[SkillTaxonomy]) -> np.ndarray:
+        kind, value = node
+        if kind == 'skill':
+            skill = taxonomy.canonical_name(value) if taxonomy else ' '.join(value.lower().split())
+            return self._as_array(self._postings.get(skill))
+        if kind == 'not':
+            return np.setdiff1d(self._as_array(self._live), self._evaluate(value, taxonomy),
+                                assume_unique=True)
+        if kind == 'or':
+            result = self._evaluate(value[0], taxonomy)
+            for child in value[1:]:
+                result = np.union1d(result, self._evaluate(child, taxonomy))
+            return result
+
+        # AND: intersect positive terms smallest-first, then subtract negated ones
+        positives = [self._evaluate(child, taxonomy) for child in value if child[0] != 'not']
+        negatives = [child[1] for child in value if child[0] == 'not']
+        if positives:
+            positives.sort(key=len)
+            result = positives[0]
+            for other in positives[1:]:
+                if not len(result):
+                    break
+                result = np.intersect1d(result, other, assume_unique=True)
+        else:
+            result = self._as_array(self._live)
+        for child in negatives:
+            if not len(result):
+                break
+            result = np.setdiff1d(result, self._evaluate(child, taxonomy), assume_unique=True)
+        return result
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the index to disk atomically
+
+        Args:
+            path: Target file (default: the index path)
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("No index path configured")
+
+        with self._lock:
+            self._compact()
+            skills = {}
+            offset = 0
+            for skill, postings in self._postings.items():
+                skills[skill] = [offset, len(postings)]
+                offset += len(postings)
+
+            header = json.dumps({
+                'byteorder': sys.byteorder,
+                'docs': self._docs,
+                'skills': skills,
+                'synced_seq': self._synced_seq,
+            }).encode('utf-8')
+            prefix_length = len(INDEX_MAGIC) + _HEADER_LENGTH.size + len(header)
+            padding = b'\0' * (-prefix_length % 4)
+
+            # Unique temp file in the target directory, so concurrent savers
+            # never interleave writes and os.replace stays atomic
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                            prefix=os.path.basename(path) + '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(INDEX_MAGIC)
+                    f.write(_HEADER_LENGTH.pack(len(header) + len(padding)))
+                    f.write(header)
+                    f.write(padding)
+                    for postings in self._postings.values():
+                        f.write(postings if isinstance(postings, array) else postings.tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+    def load(self, path: Optional[str] = None) -> None:
+        """
+        Memory-map a saved index
+
+        Args:
+            path: Index file (default: the index path)
+        """
+        path = path or self.path
+        with self._lock:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if mapped[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+                mapped.close()
+                raise ValueError(f"Not a resume index file: {path}")
+
+            start = len(INDEX_MAGIC) + _HEADER_LENGTH.size
+            (header_length,) = _HEADER_LENGTH.unpack_from(mapped, len(INDEX_MAGIC))
+            header = json.loads(mapped[start:start + header_length].rstrip(b'\0'))
+            data = memoryview(mapped)[start + header_length:].cast('I')
+            swap = header.get('byteorder', sys.byteorder) != sys.byteorder
+
+            postings: Dict[str, Postings] = {}
+            for skill, (offset, count) in header['skills'].items():
+                view = data[offset:offset + count]
+                if swap:
+                    view = array('I', view)
+                    view.byteswap()
+                postings[skill] = view
+
+            previous = self._mmap
+            self._mmap = mapped
+            self._docs = header['docs']
+            self._doc_numbers = {doc_id: n for n, doc_id in enumerate(self._docs) if doc_id is not None}
+            self._live = array('I', sorted(self._doc_numbers.values()))
+            self._postings = postings
+            self._doc_skills = None
+            self._synced_seq = header.get('synced_seq', -1)
+            self._dirty = False
+            self._release_mapping(previous)
+
+    @staticmethod
+    def _release_mapping(mapped: Optional[mmap.mmap]) -> None:
+        """Close a mapping once no posting list references it."""
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # Views are still alive elsewhere; the mapping is freed when
+                # they are garbage collected
+                pass
+
+    def maybe_save(self) -> bool:
+        """
+        Save if there are unsaved changes and the autosave interval has passed
+
+        Returns:
+            True if the index was saved
+        """
+        if not self.path or not self._dirty:
+            return False
+        if time.monotonic() - self._last_save < self.autosave_interval:
+            return False
+        try:
+            self.save()
+        except OSError as e:
+            logger.error(f"Failed to save resume index to {self.path}: {str(e)}")
+            return False
+        return True
+
+    def close(self) -> None:
+        """Flush unsaved changes and release the memory mapping"""
+        with self._lock:
+            if self.path and self._dirty:
+                self.save()
+            if self._mmap is not None:
+                for skill in list(self._postings):
+                    self._writable(skill)
+                self._release_mapping(self._mmap)
+                self._mmap = None
+
+
+# Global skill -> resume index, fed by /analyze and synced from the database
+resume_index = InvertedIndex(
+    path=config.RESUME_INDEX_PATH,
+    autosave_interval=config.RESUME_INDEX_AUTOSAVE_INTERVAL
+)
@@ -0,0 +1,291 @@
+"""
+Job Queue Module
+Bounded background worker pool for long-running requests (e.g. /analyze?async=1)
+"""
+
+import math
+import queue
+import threading
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import config
+from utils.cache import SharedCache
+from utils.exceptions import ResumeAnalyzerException
+from utils.metrics import performance_metrics
+from utils.scheduler import TaskExecution, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(ResumeAnalyzerException):
+    """Raised when a job is submitted while the queue is at its depth limit"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class JobQueueClosed(ResumeAnalyzerException):
+    """Raised when a job is submitted after the queue was shut down"""
+    pass
+
+
+class JobQueue:
+    """
+    Fixed pool of worker threads fed from a bounded FIFO queue
+
+    Each job is tracked as a scheduler ``TaskExecution`` (job ID =
+    ``execution_id``), moving from PENDING to RUNNING to COMPLETED or FAILED.
+    Finished jobs are kept for ``result_ttl`` seconds so clients can poll for
+    them. Submitting while ``max_depth`` jobs are waiting raises
+    JobQueueFull with a Retry-After estimate instead of queueing unboundedly.
+
+    Jobs run in the process that accepted them. With a ``store`` every
+    status change is also published there, so a poll that lands on another
+    worker process still finds the job; without one, the app must run as a
+    single process.
+    """
+
+    # Seconds an idle worker waits before re-checking for shutdown
+    POLL_INTERVAL = 0.5
+
+    def __init__(self,
+                 name: str = 'jobs',
+                 max_workers: int = 2,
+                 max_depth: int = 50,
+                 result_ttl: float = 600.0,
+                 max_retained: int = 10000,
+                 store: Optional[SharedCache] = None):
+        """
+        Initialize job queue
+
+        Args:
+            name: Queue name, used for thread names and metric counters
+            max_workers: Number of worker threads
+            max_depth: Maximum number of jobs waiting to start
+            result_ttl: Seconds finished jobs remain available
+            max_retained: Maximum number of jobs tracked at once
+            store: Cross-process store for job records (None = this process only)
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.result_ttl = result_ttl
+        self.max_retained = max_retained
+        self.store = store
+        self._pending: queue.Queue = queue.Queue(maxsize=max_depth)
+        self._jobs: 'OrderedDict[str, TaskExecution]' = OrderedDict()
+        self._finished_at: Dict[str, float] = {}
+        self._average_seconds = 1.0
+        self._workers = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._pending.qsize()
+
+    def retry_after(self) -> int:
+        """Estimated seconds until a queue slot frees up"""
+        waves = (self.depth + 1) / max(self.max_workers, 1)
+        return max(1, math.ceil(self._average_seconds * waves))
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> str:
+        """
+        Queue a job for a background worker
+
+        Args:
+            func: Callable run by the worker; its return value is the result
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            str: Job ID for get()
+
+        Raises:
+            JobQueueFull: If max_depth jobs are already waiting
+            JobQueueClosed: If the queue has been shut down
+        """
+        if self._closed:
+            raise JobQueueClosed(f"Job queue '{self.name}' is shut down")
+
+        self._start_workers()
+        execution = TaskExecution(task_id=self.name)
+        with self._lock:
+            self._purge()
+            self._jobs[execution.execution_id] = execution
+        self._publish(execution)
+
+        try:
+            self._pending.put_nowait((execution, func, args, kwargs))
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(execution.execution_id, None)
+            if self.store is not None:
+                self.store.delete(self._store_key(execution.execution_id))
+            performance_metrics.increment(f'{self.name}.rejected')
+            raise JobQueueFull(
+                f"Job queue '{self.name}' is full ({self.max_depth} waiting)",
+                retry_after=self.retry_after()
+            )
+
+        performance_metrics.increment(f'{self.name}.submitted')
+        return execution.execution_id
+
+    def get(self, job_id: str) -> Optional[TaskExecution]:
+        """
+        Look up a job
+
+        Args:
+            job_id: ID returned by submit()
+
+        Returns:
+            TaskExecution (a copy if another process runs the job), or None
+            if unknown or expired
+        """
+        with self._lock:
+            self._purge()
+            execution = self._jobs.get(job_id)
+        if execution is None and self.store is not None:
+            execution = self.store.get(self._store_key(job_id))
+        return execution
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, worker count and tracked jobs by status"""
+        with self._lock:
+            statuses = [job.status.value for job in self._jobs.values()]
+        return {
+            'workers': self.max_workers,
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'jobs': {status.value: statuses.count(status.value) for status in TaskStatus},
+            'average_seconds': round(self._average_seconds, 3),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting jobs and stop the workers once the queue drains
+
+        Workers finish the jobs already queued and then exit; this never
+        blocks on a full queue.
+
+        Args:
+            wait: Block until running and queued jobs have finished
+        """
+        self._closed = True
+        workers, self._workers = self._workers, []
+        # Wake idle workers at once; busy ones notice the flag when the queue is empty
+        for _ in workers:
+            try:
+                self._pending.put_nowait((None, None, (), {}))
+            except queue.Full:
+                break
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _start_workers(self) -> None:
+        if self._workers:
+            return
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f'{self.name}-worker-{len(self._workers)}',
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            try:
+                execution, func, args, kwargs = self._pending.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                if self._closed:
+                    return
+                continue
+            if execution is None:
+                return
+
+            execution.status = TaskStatus.RUNNING
+            execution.started_at = datetime.utcnow()
+            self._publish(execution)
+            start = time.perf_counter()
+            try:
+                execution.result = func(*args, **kwargs)
+                execution.status = TaskStatus.COMPLETED
+            except Exception as e:
+                logger.error(f"Job {execution.execution_id} failed: {str(e)}", exc_info=True)
+                execution.error = str(e)
+                execution.status = TaskStatus.FAILED
+            execution.completed_at = datetime.utcnow()
+
+            elapsed = time.perf_counter() - start
+            # Moving average of job time for Retry-After estimates
+            self._average_seconds += (elapsed - self._average_seconds) * 0.2
+            performance_metrics.increment(f'{self.name}.{execution.status.value}')
+            with self._lock:
+                self._finished_at[execution.execution_id] = time.monotonic()
+            self._publish(execution)
+
+    def _store_key(self, job_id: str) -> str:
+        return f'{self.name}:{job_id}'
+
+    def _publish(self, execution: TaskExecution) -> None:
+        """Copy a job's current state to the cross-process store."""
+        if self.store is not None:
+            self.store.set(self._store_key(execution.execution_id), execution, self.result_ttl)
+
+    def _purge(self) -> None:
+        """Drop expired finished jobs (and the oldest finished beyond max_retained)."""
+        now = time.monotonic()
+        # _finished_at is in completion order, so stop at the first keeper
+        for job_id, finished in list(self._finished_at.items()):
+            if now - finished <= self.result_ttl and len(self._jobs) < self.max_retained:
+                break
+            del self._finished_at[job_id]
+            self._jobs.pop(job_id, None)
+
+
+def execution_to_dict(execution: TaskExecution) -> Dict[str, Any]:
+    """
+    Convert a job's TaskExecution to a JSON-serialisable dictionary
+
+    Args:
+        execution: Job record from JobQueue.get()
+
+    Returns:
+        dict: Job ID, status, timestamps, error and result
+    """
+    return {
+        'job_id': execution.execution_id,
+        'status': execution.status.value,
+        'started_at': execution.started_at.isoformat() if execution.started_at else None,
+        'completed_at': execution.completed_at.isoformat() if execution.completed_at else None,
+        'duration_seconds': execution.duration_seconds(),
+        'error': execution.error,
+        'result': execution.result,
+    }
+
+
+# Global queue for asynchronous /analyze requests. Job status is shared
+# between worker processes through SHARED_CACHE_DIR; without it, run a
+# single worker process so polls reach the process that owns the job
+analysis_queue = JobQueue(
+    name='analysis_jobs',
+    max_workers=config.JOB_QUEUE_WORKERS,
+    max_depth=config.JOB_QUEUE_MAX_DEPTH,
+    result_ttl=config.JOB_RESULT_TTL,
+    store=SharedCache(
+        config.SHARED_CACHE_DIR,
+        default_ttl=config.JOB_RESULT_TTL
+    ) if config.SHARED_CACHE_DIR else None
+)
@@ -3,24 +3,72 @@ Skill Matcher Module
 Matches resume skills with job description requirements using optimized algorithms
 """
 
-from typing import List, Dict, Tuple, Set
+from numbers import Integral
+from typing import Any, List, Dict, Tuple, Set, FrozenSet, Iterable, Optional
 from functools import lru_cache
 
+from utils.scoring import SkillVectors, get_scoring_strategy
+from utils.skill_extractor import SkillExtractor
+from utils.skill_taxonomy import SkillTaxonomy
+
 
 class SkillMatcher:
     """
     Matches resume skills with job requirements
     """
     
+    @staticmethod
+    def to_skill_ids(skills: Iterable[str],
+                     taxonomy: Optional[SkillTaxonomy] = None) -> FrozenSet[Any]:
+        """
+        Normalise skill names to canonical skill IDs
+        
+        Names and aliases known to the taxonomy become integer IDs;
+        unknown names fall back to their lowercased spelling.
+        
+        Args:
+            skills (Iterable[str]): Skill names
+            taxonomy (SkillTaxonomy): Taxonomy to resolve against (default: active)
+            
+        Returns:
+            FrozenSet: Canonical skill keys
+        """
+        skill_id = (taxonomy or SkillExtractor.get_taxonomy()).skill_id
+        keys = set()
+        for skill in skills:
+            key = skill_id(skill)
+            keys.add(skill.lower() if key is None else key)
+        return frozenset(keys)
+    
+    @staticmethod
+    def to_skill_names(skill_ids: Iterable[Any],
+                       taxonomy: Optional[SkillTaxonomy] = None) -> List[str]:
+        """
+        Convert canonical skill keys back to a sorted list of names
+        
+        Args:
+            skill_ids (Iterable): Keys produced by to_skill_ids
+            taxonomy (SkillTaxonomy): Taxonomy the IDs belong to (default: active)
+            
+        Returns:
+            List[str]: Sorted skill names
+        """
+        names = (taxonomy or SkillExtractor.get_taxonomy()).names
+        return sorted(
+            names[key] if isinstance(key, Integral) else key for key in skill_ids
+        )
+    
     @staticmethod
     def calculate_match_percentage(resume_skills: List[str], 
-                                  job_skills: List[str]) -> float:
+                                  job_skills: List[str],
+                                  method: Optional[str] = None) -> float:
         """
         Calculate match percentage between resume and job skills with optimization
         
         Args:
             resume_skills (List[str]): Skills found in resume
             job_skills (List[str]): Skills required for job
+            method (str): Scoring strategy (default: config.MATCHING_METHOD)
             
         Returns:
             float: Match percentage (0-100)
@@ -31,16 +79,14 @@ class SkillMatcher:
         if not resume_skills:
             return 0.0
         
-        # Convert to sets for O(1) lookup - more efficient
-        resume_set = {skill.lower() for skill in resume_skills}
-        job_set = {skill.lower() for skill in job_skills}
+        # Compare canonical skill IDs so aliases count as the same skill
+        taxonomy = SkillExtractor.get_taxonomy()
+        resume_set = SkillMatcher.to_skill_ids(resume_skills, taxonomy)
+        job_set = SkillMatcher.to_skill_ids(job_skills, taxonomy)
         
-        # Calculate intersection (matched skills)
+        # Same scoring as match_skill_sets and score_many
         matched = len(resume_set & job_set)
-        total_required = len(job_set)
-        
-        # Calculate percentage
-        match_percentage = (matched / total_required) * 100
+        match_percentage = get_scoring_strategy(method).score(matched, len(resume_set), len(job_set))
         
         return round(match_percentage, 2)
     
@@ -57,12 +103,12 @@ class SkillMatcher:
         Returns:
             List[str]: Sorted list of matched skills
         """
-        resume_set = {skill.lower() for skill in resume_skills}
-        job_set = {skill.lower() for skill in job_skills}
+        resume_set = SkillMatcher.to_skill_ids(resume_skills)
+        job_set = SkillMatcher.to_skill_ids(job_skills)
         
         # Use & operator for intersection (more Pythonic)
         matched = resume_set & job_set
-        return sorted(matched)
+        return SkillMatcher.to_skill_names(matched)
     
     @staticmethod
     def get_missing_skills(resume_skills: List[str], 
@@ -77,12 +123,12 @@ class SkillMatcher:
         Returns:
             List[str]: Sorted list of missing skills
         """
-        resume_set = {skill.lower() for skill in resume_skills}
-        job_set = {skill.lower() for skill in job_skills}
+        resume_set = SkillMatcher.to_skill_ids(resume_skills)
+        job_set = SkillMatcher.to_skill_ids(job_skills)
         
         # Use - operator for difference (more Pythonic)
         missing = job_set - resume_set
-        return sorted(missing)
+        return SkillMatcher.to_skill_names(missing)
     
     @staticmethod
     def match_resume(resume_skills: List[str], 
@@ -97,22 +143,90 @@ class SkillMatcher:
         Returns:
             Dict: Complete matching analysis
         """
-        matched_skills = SkillMatcher.get_matched_skills(resume_skills, job_skills)
-        missing_skills = SkillMatcher.get_missing_skills(resume_skills, job_skills)
-        match_percentage = SkillMatcher.calculate_match_percentage(
-            resume_skills, job_skills
+        taxonomy = SkillExtractor.get_taxonomy()
+        return SkillMatcher.match_skill_sets(
+            SkillMatcher.to_skill_ids(resume_skills, taxonomy),
+            SkillMatcher.to_skill_ids(job_skills, taxonomy),
+            taxonomy
+        )
+    
+    @staticmethod
+    def match_skill_sets(resume_ids: FrozenSet[Any],
+                         job_ids: FrozenSet[Any],
+                         taxonomy: Optional[SkillTaxonomy] = None,
+                         method: Optional[str] = None) -> Dict:
+        """
+        Complete matching analysis over pre-normalised skill sets
+        
+        Computes the intersection, difference, counts and percentage in one
+        pass. Use this when the skill sets already come from
+        SkillExtractor.extract_skill_ids or SkillMatcher.to_skill_ids.
+        
+        Args:
+            resume_ids (FrozenSet): Canonical skill keys from the resume
+            job_ids (FrozenSet): Canonical skill keys required for the job
+            taxonomy (SkillTaxonomy): Taxonomy the IDs belong to (default: active)
+            method (str): Scoring strategy (default: config.MATCHING_METHOD)
+            
+        Returns:
+            Dict: Complete matching analysis
+        """
+        matched = resume_ids & job_ids
+        missing = job_ids - matched
+        required_count = len(job_ids)
+        
+        match_percentage = round(
+            get_scoring_strategy(method).score(len(matched), len(resume_ids), required_count),
+            2
         )
         
         return {
             'match_percentage': match_percentage,
-            'matched_skills': matched_skills,
-            'missing_skills': missing_skills,
-            'resume_skills_count': len(resume_skills),
-            'required_skills_count': len(job_skills),
-            'matched_count': len(matched_skills),
-            'missing_count': len(missing_skills)
+            'matched_skills': SkillMatcher.to_skill_names(matched, taxonomy),
+            'missing_skills': SkillMatcher.to_skill_names(missing, taxonomy),
+            'resume_skills_count': len(resume_ids),
+            'required_skills_count': required_count,
+            'matched_count': len(matched),
+            'missing_count': len(missing)
         }
     
+    @staticmethod
+    def score_many(resume_id_sets: List[FrozenSet[Any]],
+                   job_ids: FrozenSet[Any],
+                   taxonomy: Optional[SkillTaxonomy] = None,
+                   method: Optional[str] = None) -> List[float]:
+        """
+        Score many resumes against one job with a single vectorised call
+        
+        For repeated ranking against the same resumes, build SkillVectors
+        once and call its score method directly.
+        
+        Args:
+            resume_id_sets (List[FrozenSet]): Canonical skill keys per resume
+            job_ids (FrozenSet): Canonical skill keys required for the job
+            taxonomy (SkillTaxonomy): Taxonomy the IDs belong to (default: active)
+            method (str): Scoring strategy (default: config.MATCHING_METHOD)
+            
+        Returns:
+            List[float]: Match percentage per resume, in input order
+        """
+        vocab_size = len((taxonomy or SkillExtractor.get_taxonomy()).names)
+        
+        # Names unknown to the taxonomy count in match_skill_sets, so they
+        # get vector slots past the taxonomy's own
+        extra_ids: Dict[str, int] = {}
+        
+        def encode(keys: Iterable[Any]) -> List[int]:
+            return [
+                int(key) if isinstance(key, Integral) else extra_ids.setdefault(key, vocab_size + len(extra_ids))
+                for key in keys
+            ]
+        
+        resume_id_sets = [encode(skill_ids) for skill_ids in resume_id_sets]
+        job_ids = encode(job_ids)
+        vectors = SkillVectors.from_skill_sets(resume_id_sets, vocab_size + len(extra_ids))
+        return [round(score, 2) for score in vectors.score(job_ids, method).tolist()]
+    
     @staticmethod
     def get_match_level(percentage: float) -> str:
         """
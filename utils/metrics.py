@@ -8,17 +8,25 @@ API response times, resource usage, and throughput analysis.
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from collections import defaultdict
+import threading
 import time
 
 
 class PerformanceMetrics:
-    """Track and analyze application performance metrics."""
+    """
+    Track and analyze application performance metrics.
+    
+    Safe to share between request and worker threads: updates and reads of
+    the counters and recorded timings are serialised by one lock.
+    """
     
     def __init__(self):
         self.metrics: Dict[str, List[float]] = defaultdict(list)
         self.start_times: Dict[str, float] = {}
         self.request_count = 0
         self.error_count = 0
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
         
     def start_timer(self, operation: str) -> None:
         """Start timing an operation."""
@@ -26,30 +34,45 @@ class PerformanceMetrics:
         
     def end_timer(self, operation: str) -> float:
         """End timing and record duration."""
-        if operation in self.start_times:
-            duration = time.time() - self.start_times[operation]
+        with self._lock:
+            started = self.start_times.pop(operation, None)
+            if started is None:
+                return 0.0
+            duration = time.time() - started
             self.metrics[operation].append(duration)
-            del self.start_times[operation]
             return duration
-        return 0.0
         
     def get_average(self, operation: str) -> float:
         """Get average duration for operation."""
-        values = self.metrics.get(operation, [])
+        with self._lock:
+            values = list(self.metrics.get(operation, []))
         return sum(values) / len(values) if values else 0.0
         
     def get_percentile(self, operation: str, percentile: int = 95) -> float:
         """Get percentile for operation."""
-        values = sorted(self.metrics.get(operation, []))
+        with self._lock:
+            values = sorted(self.metrics.get(operation, []))
         if not values:
             return 0.0
         index = int(len(values) * percentile / 100)
         return values[min(index, len(values) - 1)]
         
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a named event counter (e.g. cache hits)."""
+        with self._lock:
+            self.counters[counter] += amount
+        
+    def get_counters(self) -> Dict[str, int]:
+        """Get all event counters."""
+        with self._lock:
+            return dict(self.counters)
+        
     def get_summary(self) -> Dict:
         """Get performance summary."""
+        with self._lock:
+            operations = {operation: list(values) for operation, values in self.metrics.items()}
         summary = {}
-        for operation, values in self.metrics.items():
+        for operation, values in operations.items():
             summary[operation] = {
                 'count': len(values),
                 'avg': self.get_average(operation),
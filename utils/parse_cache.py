@@ -0,0 +1,252 @@
+"""
+Parse Cache Module
+Content-addressed cache of parsed resumes, keyed by the SHA-256 of the upload
+"""
+
+import hashlib
+import json
+import os
+import threading
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import BinaryIO, FrozenSet, List, Optional, Tuple, Union
+
+import config
+from utils.metrics import performance_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParsedResume:
+    """Cleaned text and extracted skills of one resume file"""
+    cleaned_text: str
+    skill_ids: FrozenSet[int]
+    taxonomy: str
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serialisable dictionary"""
+        return {
+            'cleaned_text': self.cleaned_text,
+            'skill_ids': sorted(self.skill_ids),
+            'taxonomy': self.taxonomy,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ParsedResume':
+        """Create from a dictionary produced by to_dict"""
+        return cls(
+            cleaned_text=data['cleaned_text'],
+            skill_ids=frozenset(data['skill_ids']),
+            taxonomy=data['taxonomy'],
+        )
+
+
+def content_digest(data: Union[bytes, BinaryIO], chunk_size: int = 64 * 1024) -> str:
+    """
+    SHA-256 hex digest of uploaded file content
+
+    Args:
+        data: File bytes, or a seekable binary stream which is hashed in
+            chunks and rewound to where it started
+        chunk_size: Read size for streams
+
+    Returns:
+        str: Hex digest
+    """
+    if not hasattr(data, 'read'):
+        return hashlib.sha256(data).hexdigest()
+
+    start = data.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: data.read(chunk_size), b''):
+        digest.update(chunk)
+    data.seek(start)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    Two-tier parse cache: an in-memory LRU backed by an optional directory
+
+    Entries are immutable, so a hit can be shared between requests. The
+    stored skill IDs are tagged with the taxonomy fingerprint they were
+    extracted with; callers re-extract from the cached text when it differs.
+    Hits and misses are counted in ``performance_metrics`` as
+    ``parse_cache.hits``, ``parse_cache.disk_hits`` and ``parse_cache.misses``.
+
+    The on-disk tier is capped at ``max_disk_bytes``: once a write takes it
+    over the cap, the least recently used files (by modification time,
+    refreshed on disk hits) are deleted until it is back under
+    ``DISK_TRIM_RATIO`` of the cap. Usage is tracked per process and
+    re-measured on every trim, so several processes can share a directory.
+    """
+
+    # Fraction of max_disk_bytes left after a trim, so trims are infrequent
+    DISK_TRIM_RATIO = 0.9
+
+    def __init__(self, max_entries: int = 256, directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        """
+        Initialize parse cache
+
+        Args:
+            max_entries: Maximum entries kept in memory
+            directory: Directory for the on-disk tier (None = memory only)
+            max_disk_bytes: Size cap of the on-disk tier (None = no limit)
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: 'OrderedDict[str, ParsedResume]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], f'{digest}.json')
+
+    def get(self, digest: str) -> Optional[ParsedResume]:
+        """
+        Look up a parsed resume by content digest
+
+        Args:
+            digest: SHA-256 hex digest of the file content
+
+        Returns:
+            ParsedResume or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                performance_metrics.increment('parse_cache.hits')
+                return entry
+
+        entry = self._read_disk(digest)
+        if entry is not None:
+            self._remember(digest, entry)
+            performance_metrics.increment('parse_cache.disk_hits')
+            return entry
+
+        performance_metrics.increment('parse_cache.misses')
+        return None
+
+    def put(self, digest: str, entry: ParsedResume) -> None:
+        """
+        Store a parsed resume
+
+        Args:
+            digest: SHA-256 hex digest of the file content
+            entry: Parsed resume
+        """
+        self._remember(digest, entry)
+        self._write_disk(digest, entry)
+
+    def _remember(self, digest: str, entry: ParsedResume) -> None:
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                performance_metrics.increment('parse_cache.evictions')
+
+    def _read_disk(self, digest: str) -> Optional[ParsedResume]:
+        if not self.directory:
+            return None
+        path = self._disk_path(digest)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = ParsedResume.from_dict(json.load(f))
+            if self.max_disk_bytes is not None:
+                # Mark as recently used so trims keep it
+                os.utime(path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {digest}: {str(e)}")
+            return None
+
+    def _write_disk(self, digest: str, entry: ParsedResume) -> None:
+        if not self.directory:
+            return
+        path = self._disk_path(digest)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry.to_dict(), f)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache entry {digest}: {str(e)}")
+            return
+
+        if self.max_disk_bytes is not None:
+            with self._disk_lock:
+                if self._disk_bytes is None:
+                    self._disk_bytes = sum(size for _, _, size in self._scan_disk())
+                else:
+                    self._disk_bytes += size
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._trim_disk()
+
+    def _scan_disk(self) -> List[Tuple[float, str, int]]:
+        """(mtime, path, size) of every entry file in the on-disk tier."""
+        files = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if not item.name.endswith('.json'):
+                    continue
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, item.path, stat.st_size))
+        return files
+
+    def _trim_disk(self) -> None:
+        """Delete the oldest entry files until the tier is under its trim target (disk lock held)."""
+        files = self._scan_disk()
+        total = sum(size for _, _, size in files)
+        target = self.max_disk_bytes * self.DISK_TRIM_RATIO
+        files.sort()
+        removed = 0
+        for _, path, size in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove parse cache entry {path}: {str(e)}")
+                continue
+            total -= size
+            removed += 1
+        self._disk_bytes = total
+        if removed:
+            performance_metrics.increment('parse_cache.disk_evictions', removed)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global parse cache
+parse_cache = ParseCache(
+    max_entries=config.PARSE_CACHE_SIZE,
+    directory=config.PARSE_CACHE_DIR,
+    max_disk_bytes=config.PARSE_CACHE_DISK_MAX_BYTES
+)
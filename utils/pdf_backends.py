@@ -0,0 +1,236 @@
+"""
+PDF Backends Module
+Pluggable PDF text extraction backends selected by config.PDF_EXTRACTION_METHOD
+"""
+
+import importlib.util
+import io
+import threading
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+import config
+from utils.exceptions import ResumeParsError
+
+# A path, raw PDF bytes, or a readable and seekable binary stream
+PdfSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+# Backends tried by the 'auto' method, fastest first
+# (measure with: python -m benchmarks.bench_pdf_backends)
+AUTO_BACKEND_ORDER = ('pypdfium2', 'pypdf2', 'pdfminer')
+
+# Earlier values of config.PDF_EXTRACTION_METHOD
+PDF_BACKEND_ALIASES = {'text': 'pypdf2'}
+
+
+def _as_stream(source: PdfSource) -> Union[str, BinaryIO]:
+    """Wrap in-memory PDF bytes in a stream; paths and streams pass through."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+
+class PdfBackend:
+    """
+    Base class for PDF text extraction backends
+
+    A backend opens a document once and extracts page text by index, so the
+    parser can stream pages and stop early. Documents are only used by the
+    thread that opened them.
+    """
+
+    name = ''
+    # Importable module the backend needs (checked without importing it)
+    module = ''
+
+    _available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        """Whether the backend's library is installed"""
+        if self._available is None:
+            self._available = importlib.util.find_spec(self.module) is not None
+        return self._available
+
+    def open(self, source: PdfSource) -> Any:
+        """
+        Open a PDF document
+
+        Args:
+            source: Path, bytes or file-like object of the PDF
+
+        Returns:
+            Backend-specific document handle
+        """
+        raise NotImplementedError
+
+    def page_count(self, document: Any) -> int:
+        """Number of pages in an open document"""
+        raise NotImplementedError
+
+    def page_text(self, document: Any, index: int) -> str:
+        """Text of one page ('' if the page has none)"""
+        raise NotImplementedError
+
+    def close(self, document: Any) -> None:
+        """Release resources held by an open document"""
+        pass
+
+
+class PyPDF2Backend(PdfBackend):
+    """Pure-Python extraction with PyPDF2 (always installed)"""
+
+    name = 'pypdf2'
+    module = 'PyPDF2'
+
+    def open(self, source):
+        from PyPDF2 import PdfReader
+        return PdfReader(_as_stream(source))
+
+    def page_count(self, document):
+        return len(document.pages)
+
+    def page_text(self, document, index):
+        return document.pages[index].extract_text() or ''
+
+
+class Pypdfium2Backend(PdfBackend):
+    """
+    Extraction with Google's PDFium engine via pypdfium2 (optional)
+
+    PDFium is not thread-safe, so calls into it are serialised in-process;
+    use the process pool (PDF_PARALLEL_*) for parallelism.
+    """
+
+    name = 'pypdfium2'
+    module = 'pypdfium2'
+
+    _lock = threading.RLock()
+
+    def open(self, source):
+        import pypdfium2
+        if isinstance(source, (bytearray, memoryview)):
+            source = bytes(source)
+        with self._lock:
+            return pypdfium2.PdfDocument(source)
+
+    def page_count(self, document):
+        with self._lock:
+            return len(document)
+
+    def page_text(self, document, index):
+        with self._lock:
+            page = document[index]
+            try:
+                text_page = page.get_textpage()
+                try:
+                    return text_page.get_text_range() or ''
+                finally:
+                    text_page.close()
+            finally:
+                page.close()
+
+    def close(self, document):
+        with self._lock:
+            document.close()
+
+
+class PdfMinerBackend(PdfBackend):
+    """Layout-aware extraction with pdfminer.six (optional)"""
+
+    name = 'pdfminer'
+    module = 'pdfminer'
+
+    def open(self, source):
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        stream = _as_stream(source)
+        owned = isinstance(stream, str)
+        if owned:
+            stream = open(stream, 'rb')
+        try:
+            pages = list(PDFPage.create_pages(PDFDocument(PDFParser(stream))))
+        except Exception:
+            if owned:
+                stream.close()
+            raise
+        return {
+            'stream': stream if owned else None,
+            'pages': pages,
+            'resources': PDFResourceManager(caching=True),
+        }
+
+    def page_count(self, document):
+        return len(document['pages'])
+
+    def page_text(self, document, index):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter
+
+        output = io.StringIO()
+        device = TextConverter(document['resources'], output, laparams=LAParams())
+        try:
+            PDFPageInterpreter(document['resources'], device).process_page(document['pages'][index])
+        finally:
+            device.close()
+        return output.getvalue()
+
+    def close(self, document):
+        if document['stream'] is not None:
+            document['stream'].close()
+
+
+PDF_BACKENDS: Dict[str, PdfBackend] = {
+    backend.name: backend
+    for backend in (PyPDF2Backend(), Pypdfium2Backend(), PdfMinerBackend())
+}
+
+
+def register_pdf_backend(backend: PdfBackend) -> None:
+    """Register an additional PDF backend under its name"""
+    PDF_BACKENDS[backend.name] = backend
+
+
+def available_pdf_backends() -> Dict[str, PdfBackend]:
+    """Registered backends whose libraries are installed"""
+    return {name: backend for name, backend in PDF_BACKENDS.items() if backend.is_available()}
+
+
+def get_pdf_backend(method: Optional[str] = None) -> PdfBackend:
+    """
+    Get a PDF backend by name
+
+    'auto' picks the first installed backend in AUTO_BACKEND_ORDER.
+
+    Args:
+        method: Backend name; defaults to config.PDF_EXTRACTION_METHOD
+
+    Returns:
+        PdfBackend instance
+
+    Raises:
+        ResumeParsError: If the backend is unknown or not installed
+    """
+    method = method or config.PDF_EXTRACTION_METHOD
+    method = PDF_BACKEND_ALIASES.get(method, method)
+
+    if method == 'auto':
+        for name in AUTO_BACKEND_ORDER:
+            backend = PDF_BACKENDS.get(name)
+            if backend is not None and backend.is_available():
+                return backend
+        method = PyPDF2Backend.name
+
+    backend = PDF_BACKENDS.get(method)
+    if backend is None:
+        raise ResumeParsError(
+            f"Unknown PDF extraction method '{method}'. "
+            f"Options: auto, {', '.join(sorted(PDF_BACKENDS))}"
+        )
+    if not backend.is_available():
+        raise ResumeParsError(
+            f"PDF extraction method '{method}' requires the '{backend.module}' package"
+        )
+    return backend
@@ -0,0 +1,354 @@
+"""
+Ranking Module
+Scores one job description against a stored corpus of extracted resume
+skill sets and returns the top-K candidates
+"""
+
+import threading
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from numbers import Integral
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.scoring import get_scoring_strategy
+from utils.skill_taxonomy import SkillTaxonomy
+
+
+@dataclass
+class RankedCandidate:
+    """A resume ranked against a job"""
+    resume_id: str
+    score: float
+    matched_count: int
+    resume_skills_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'resume_id': self.resume_id,
+            'score': self.score,
+            'matched_count': self.matched_count,
+            'resume_skills_count': self.resume_skills_count,
+        }
+
+
+@dataclass(frozen=True)
+class _CorpusSnapshot:
+    """Immutable NumPy view of the corpus used for lock-free ranking."""
+    resume_ids: Tuple[Optional[str], ...]
+    counts: np.ndarray
+    postings: Dict[int, np.ndarray]
+
+
+class ResumeCorpus:
+    """
+    In-memory corpus of resume skill sets with an inverted index
+
+    Each resume occupies a row; every canonical skill ID keeps a posting list
+    of the rows that have it. Scoring a job touches only the posting lists of
+    the job's skills, so cost scales with matches rather than corpus size.
+    Skill IDs are stored against the taxonomy the corpus was built with.
+    IDs from an older taxonomy are remapped by name; a newer (hot-reloaded)
+    taxonomy is adopted by remapping the stored posting lists, so skills it
+    adds are never dropped.
+
+    The corpus lives in memory; sync() fills it from the database, which
+    every worker writes analysed resumes to.
+    """
+
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy
+        self._resume_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._counts = array('I')
+        self._postings: Dict[int, array] = {}
+        self._removed = 0
+        self._snapshot: Optional[_CorpusSnapshot] = None
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced_seq = -1
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._rows
+
+    def to_corpus_ids(self, skill_ids: Iterable[Any],
+                      taxonomy: Optional[SkillTaxonomy] = None) -> List[int]:
+        """
+        Translate skill IDs from another taxonomy into corpus IDs
+
+        Args:
+            skill_ids: Canonical skill IDs
+            taxonomy: Taxonomy the IDs belong to (default: the corpus taxonomy)
+
+        Returns:
+            Sorted, de-duplicated corpus skill IDs
+        """
+        ids = {int(skill_id) for skill_id in skill_ids if isinstance(skill_id, Integral)}
+        if taxonomy is None or self.taxonomy is None or taxonomy.fingerprint == self.taxonomy.fingerprint:
+            return sorted(ids)
+        remapped = (self.taxonomy.skill_id(taxonomy.names[skill_id]) for skill_id in ids)
+        return sorted({skill_id for skill_id in remapped if skill_id is not None})
+
+    def add(self, resume_id: str, skill_ids: Iterable[Any],
+            taxonomy: Optional[SkillTaxonomy] = None) -> None:
+        """
+        Add or replace a resume in the corpus
+
+        Args:
+            resume_id: Stable resume identifier (e.g. content hash)
+            skill_ids: Canonical skill IDs extracted from the resume
+            taxonomy: Taxonomy the IDs belong to (default: the corpus taxonomy)
+        """
+        with self._lock:
+            self._adopt(taxonomy)
+            ids = self.to_corpus_ids(skill_ids, taxonomy)
+
+            if resume_id in self._rows:
+                self._remove_row(self._rows.pop(resume_id))
+
+            row = len(self._resume_ids)
+            self._resume_ids.append(resume_id)
+            self._rows[resume_id] = row
+            self._counts.append(len(ids))
+            for skill_id in ids:
+                postings = self._postings.get(skill_id)
+                if postings is None:
+                    postings = self._postings[skill_id] = array('I')
+                postings.append(row)
+            self._snapshot = None
+
+    def add_named(self, resumes: Iterable[Tuple[str, Iterable[str]]],
+                  taxonomy: SkillTaxonomy) -> int:
+        """
+        Add or replace resumes given by skill name (e.g. from storage)
+
+        Args:
+            resumes: (resume_id, canonical skill names) pairs
+            taxonomy: Taxonomy used to resolve the names
+
+        Returns:
+            int: Number of resumes added
+        """
+        added = 0
+        for resume_id, names in resumes:
+            skill_ids = (taxonomy.skill_id(name) for name in names)
+            self.add(resume_id, [skill_id for skill_id in skill_ids if skill_id is not None], taxonomy)
+            added += 1
+        return added
+
+    def sync(self, database: Any, taxonomy: SkillTaxonomy) -> int:
+        """
+        Add resumes stored in the database since the previous sync
+
+        The first call after startup loads every stored resume; later calls
+        pick up resumes stored by other workers, so all workers rank the same
+        corpus.
+
+        Args:
+            database: DatabaseManager holding analysed resumes
+            taxonomy: Active taxonomy, used to resolve stored skill names
+
+        Returns:
+            int: Number of resumes added or refreshed
+        """
+        with self._sync_lock:
+            changed = []
+            for resume_id, change_seq, names in database.get_resume_skills(after_seq=self._synced_seq):
+                changed.append((resume_id, names))
+                self._synced_seq = max(self._synced_seq, change_seq)
+            return self.add_named(changed, taxonomy)
+
+    def rebase(self, taxonomy: SkillTaxonomy) -> None:
+        """
+        Switch to a newer taxonomy, remapping stored skill IDs by name
+
+        Args:
+            taxonomy: Taxonomy to adopt (ignored unless newer than the corpus taxonomy)
+        """
+        if self.taxonomy is not None and taxonomy.fingerprint == self.taxonomy.fingerprint:
+            return
+        with self._lock:
+            self._adopt(taxonomy)
+
+    def _adopt(self, taxonomy: Optional[SkillTaxonomy]) -> None:
+        """Make a newer taxonomy the corpus taxonomy (lock held)."""
+        current = self.taxonomy
+        if taxonomy is None or taxonomy is current:
+            return
+        if current is None or taxonomy.fingerprint == current.fingerprint:
+            self.taxonomy = taxonomy
+            return
+        if (taxonomy.loaded_at or datetime.min) <= (current.loaded_at or datetime.min):
+            # Older taxonomy (e.g. a request that started before a reload):
+            # its IDs are remapped on the way in instead
+            return
+
+        if self._removed:
+            self._compact()
+        merged: Dict[int, List[array]] = {}
+        for skill_id, rows in self._postings.items():
+            new_id = taxonomy.skill_id(current.names[skill_id])
+            if new_id is not None:
+                merged.setdefault(new_id, []).append(rows)
+
+        postings = {}
+        for new_id, lists in merged.items():
+            # Two old skills may now be aliases of one canonical skill
+            postings[new_id] = lists[0] if len(lists) == 1 else array('I', sorted(set().union(*lists)))
+
+        counts = np.zeros(len(self._resume_ids), dtype=np.uint32)
+        for rows in postings.values():
+            counts[np.frombuffer(rows, dtype=np.uint32)] += 1
+
+        self.taxonomy = taxonomy
+        self._postings = postings
+        self._counts = array('I', counts.tobytes())
+        self._snapshot = None
+
+    def remove(self, resume_id: str) -> bool:
+        """
+        Remove a resume from the corpus
+
+        Args:
+            resume_id: Resume identifier
+
+        Returns:
+            True if removed, False if it was not in the corpus
+        """
+        with self._lock:
+            row = self._rows.pop(resume_id, None)
+            if row is None:
+                return False
+            self._remove_row(row)
+            self._snapshot = None
+            return True
+
+    def _remove_row(self, row: int) -> None:
+        """Tombstone a row; posting lists are filtered on the next compaction."""
+        self._resume_ids[row] = None
+        self._counts[row] = 0
+        self._removed += 1
+        if self._removed * 2 > len(self._resume_ids):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows and renumber posting lists."""
+        mapping = {}
+        resume_ids: List[Optional[str]] = []
+        counts = array('I')
+        for old_row, resume_id in enumerate(self._resume_ids):
+            if resume_id is not None:
+                mapping[old_row] = len(resume_ids)
+                resume_ids.append(resume_id)
+                counts.append(self._counts[old_row])
+
+        postings = {}
+        for skill_id, rows in self._postings.items():
+            kept = array('I', (mapping[row] for row in rows if row in mapping))
+            if kept:
+                postings[skill_id] = kept
+
+        self._resume_ids = resume_ids
+        self._rows = {resume_id: row for row, resume_id in enumerate(resume_ids)}
+        self._counts = counts
+        self._postings = postings
+        self._removed = 0
+
+    def snapshot(self) -> _CorpusSnapshot:
+        """Get an immutable NumPy view of the corpus (rebuilt after changes)."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = _CorpusSnapshot(
+                        resume_ids=tuple(self._resume_ids),
+                        counts=np.array(self._counts, dtype=np.int64),
+                        postings={
+                            skill_id: np.array(rows, dtype=np.intp)
+                            for skill_id, rows in self._postings.items()
+                        }
+                    )
+                snapshot = self._snapshot
+        return snapshot
+
+
+class RankingEngine:
+    """Rank a corpus of resumes against a job description"""
+
+    def __init__(self, corpus: ResumeCorpus):
+        self.corpus = corpus
+
+    def rank(self,
+             job_ids: Iterable[Any],
+             top_k: int = 10,
+             method: Optional[str] = None,
+             taxonomy: Optional[SkillTaxonomy] = None) -> List[RankedCandidate]:
+        """
+        Get the top-K resumes for a job
+
+        Only resumes sharing at least one skill with the job are candidates.
+        Ties are broken by insertion order.
+
+        Args:
+            job_ids: Canonical skill IDs required by the job
+            top_k: Number of candidates to return
+            method: Scoring strategy (default: config.MATCHING_METHOD)
+            taxonomy: Taxonomy the job IDs belong to (default: corpus taxonomy)
+
+        Returns:
+            List[RankedCandidate]: Best candidates, highest score first
+        """
+        strategy = get_scoring_strategy(method)
+        if taxonomy is not None:
+            self.corpus.rebase(taxonomy)
+        if self.corpus.taxonomy is None or top_k <= 0:
+            return []
+
+        job_ids = self.corpus.to_corpus_ids(job_ids, taxonomy)
+        snapshot = self.corpus.snapshot()
+
+        postings = [snapshot.postings[i] for i in job_ids if i in snapshot.postings]
+        if not postings:
+            return []
+        matched = np.bincount(np.concatenate(postings), minlength=len(snapshot.counts))
+
+        # Removed rows keep their postings until compaction but have a zero count
+        candidates = np.flatnonzero((matched > 0) & (snapshot.counts > 0))
+        if not len(candidates):
+            return []
+
+        scores = strategy.score_many(
+            matched[candidates], snapshot.counts[candidates], len(job_ids)
+        )
+
+        # Partial selection of the best K (earliest rows win ties at the
+        # cut-off), then order only those
+        if len(candidates) > top_k:
+            cutoff = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            above = np.flatnonzero(scores > cutoff)
+            ties = np.flatnonzero(scores == cutoff)[:top_k - len(above)]
+            best = np.concatenate((above, ties))
+        else:
+            best = np.arange(len(candidates))
+        best = best[np.lexsort((candidates[best], -scores[best]))]
+
+        return [
+            RankedCandidate(
+                resume_id=snapshot.resume_ids[candidates[i]],
+                score=round(float(scores[i]), 2),
+                matched_count=int(matched[candidates[i]]),
+                resume_skills_count=int(snapshot.counts[candidates[i]])
+            )
+            for i in best
+        ]
+
+
+# Global corpus of analysed resumes and its ranking engine
+resume_corpus = ResumeCorpus()
+ranking_engine = RankingEngine(resume_corpus)
@@ -3,26 +3,248 @@ Resume Parser Module
 Extracts text from PDF resume files with optimized performance
 """
 
-import re
-from typing import Dict, Any, List
-from PyPDF2 import PdfReader
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 import logging
 
+import config
+from utils.pdf_backends import PdfBackend, PdfSource, get_pdf_backend
+
 logger = logging.getLogger(__name__)
 
 
+def _extract_page_range(method: str, data: bytes, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) - runs in a worker process."""
+    backend = get_pdf_backend(method)
+    document = backend.open(data)
+    try:
+        return [backend.page_text(document, i) for i in range(start, stop)]
+    finally:
+        backend.close(document)
+
+
+# Symbols kept by clean_text besides letters, digits and whitespace
+_KEPT_SYMBOLS = frozenset('_.-+#@')
+
+
+class _CleanTable(dict):
+    """
+    str.translate table for clean_text, filled lazily per code point
+
+    Each character maps to its lowercase form, with anything that is not a
+    letter, digit or kept symbol (including whitespace) replaced by a space.
+    str.isalnum and str.isspace are the classes behind the regex ``\\w`` and
+    ``\\s`` previously used, so the output is unchanged.
+    """
+
+    def __missing__(self, code_point: int) -> str:
+        mapped = ''.join(
+            char if char.isalnum() or char in _KEPT_SYMBOLS else ' '
+            for char in chr(code_point).lower()
+        )
+        self[code_point] = mapped
+        return mapped
+
+
+# ASCII is filled up front so typical text never reaches __missing__
+_CLEAN_TABLE = _CleanTable()
+for _code_point in range(128):
+    _CLEAN_TABLE.__missing__(_code_point)
+
+
+def _translate(text: str) -> str:
+    """Lowercase text and turn every disallowed character into a space."""
+    # Capital sigma lowercases differently at the end of a word, which a
+    # per-character table cannot see
+    if '\u03a3' in text:
+        text = text.lower()
+    return text.translate(_CLEAN_TABLE)
+
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """
+    Shared process pool for page extraction, created on first use
+
+    Workers are started by a fork server (or spawned where that is not
+    available) rather than forked from the app, which may hold locks,
+    open connections and running threads that a fork would copy.
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _page_pool = ProcessPoolExecutor(
+                max_workers=ResumeParser.parallel_workers(),
+                mp_context=multiprocessing.get_context(start_method)
+            )
+        return _page_pool
+
+
+def _reset_page_pool() -> None:
+    """Discard a broken pool so the next parallel extraction starts a new one."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=False, cancel_futures=True)
+            _page_pool = None
+
+
 class ResumeParser:
     """
     Handles PDF resume file parsing and text extraction
     """
     
     @staticmethod
-    def extract_text(file_path: str) -> str:
+    def get_backend() -> PdfBackend:
+        """
+        Get the PDF backend selected by config.PDF_EXTRACTION_METHOD
+        
+        Returns:
+            PdfBackend: Backend used to open documents and extract page text
+        """
+        return get_pdf_backend()
+    
+    @staticmethod
+    def open_pdf(source: PdfSource, backend: Optional[PdfBackend] = None) -> Any:
+        """
+        Open a PDF from a path, in-memory bytes or a file-like object
+        
+        Bytes and memoryviews are parsed in memory; streams (e.g. a Werkzeug
+        upload) are read in place without being written to disk.
+        
+        Args:
+            source (PdfSource): PDF to open
+            backend (PdfBackend): Backend to open it with (default: configured)
+            
+        Returns:
+            Backend-specific document; release it with backend.close()
+        """
+        return (backend or ResumeParser.get_backend()).open(source)
+    
+    @staticmethod
+    def _describe(source: PdfSource) -> str:
+        """Short description of a PDF source for log messages."""
+        if isinstance(source, str):
+            return source
+        return getattr(source, 'name', None) or f'<{type(source).__name__}>'
+    
+    @staticmethod
+    def parallel_workers() -> int:
+        """Number of worker processes for parallel page extraction"""
+        return config.PDF_PARALLEL_WORKERS or os.cpu_count() or 1
+    
+    @staticmethod
+    def _read_bytes(source: PdfSource) -> bytes:
+        """Whole PDF content as bytes, for shipping to worker processes."""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source)
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                return f.read()
+        source.seek(0)
+        return source.read()
+    
+    @staticmethod
+    def _extract_pages_parallel(backend: PdfBackend, data: bytes,
+                                page_count: int) -> List[str]:
+        """
+        Extract pages in a process pool, returning texts in page order
+        
+        PyPDF2 is pure Python (and PDFium is not thread-safe), so threads would
+        serialise; each worker re-opens the document with the same backend and
+        extracts a contiguous page range.
+        """
+        workers = min(ResumeParser.parallel_workers(), page_count)
+        chunk = -(-page_count // workers)
+        ranges = [(start, min(start + chunk, page_count))
+                  for start in range(0, page_count, chunk)]
+        
+        futures = [
+            _get_page_pool().submit(_extract_page_range, backend.name, data, start, stop)
+            for start, stop in ranges
+        ]
+        text_pages = []
+        for future in futures:
+            text_pages.extend(future.result())
+        return text_pages
+    
+    @staticmethod
+    def iter_pages(source: PdfSource,
+                   max_pages: Optional[int] = None,
+                   parallel: Optional[bool] = None) -> Iterator[str]:
+        """
+        Lazily extract the raw text of each page, in page order
+        
+        Pages are decoded one at a time as the generator is consumed, so a
+        caller that stops early never pays for the rest of the document.
+        Documents with at least config.PDF_PARALLEL_PAGE_THRESHOLD pages
+        (within max_pages) are extracted up front in a process pool instead.
+        
+        Args:
+            source (PdfSource): Path, bytes or file-like object of the PDF
+            max_pages (int): Stop after this many pages (None = all)
+            parallel (bool): Force (True) or disable (False) parallel
+                extraction; None chooses by page count
+            
+        Yields:
+            str: Text of the next page ('' for pages without text)
+        """
+        backend = ResumeParser.get_backend()
+        return ResumeParser._iter_document_pages(
+            backend, backend.open(source), source, max_pages, parallel
+        )
+    
+    @staticmethod
+    def _iter_document_pages(backend: PdfBackend, document: Any, source: PdfSource,
+                             max_pages: Optional[int],
+                             parallel: Optional[bool]) -> Iterator[str]:
+        """Page generator over an opened document, closing it when done (see iter_pages)."""
+        try:
+            page_count = backend.page_count(document)
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+            
+            if parallel is None:
+                parallel = (ResumeParser.parallel_workers() > 1 and
+                            page_count >= config.PDF_PARALLEL_PAGE_THRESHOLD)
+            
+            if parallel and page_count > 1:
+                try:
+                    text_pages = ResumeParser._extract_pages_parallel(
+                        backend, ResumeParser._read_bytes(source), page_count
+                    )
+                except (BrokenProcessPool, OSError) as pool_error:
+                    logger.warning(f"Parallel PDF extraction failed, using sequential: {pool_error}")
+                    _reset_page_pool()
+                else:
+                    yield from text_pages
+                    return
+            
+            for page_number in range(page_count):
+                yield backend.page_text(document, page_number)
+        finally:
+            backend.close(document)
+    
+    @staticmethod
+    def extract_text(source: PdfSource, parallel: Optional[bool] = None) -> str:
         """
         Extract text content from a PDF file with optimized performance
         
+        Documents with at least config.PDF_PARALLEL_PAGE_THRESHOLD pages are
+        split across a process pool; smaller ones are extracted sequentially.
+        
         Args:
-            file_path (str): Path to the PDF file
+            source (PdfSource): Path, bytes or file-like object of the PDF
+            parallel (bool): Force (True) or disable (False) parallel
+                extraction; None chooses by page count
             
         Returns:
             str: Extracted text from the PDF
@@ -31,11 +253,7 @@ class ResumeParser:
             Exception: If file cannot be read or is not a valid PDF
         """
         try:
-            pdf_reader = PdfReader(file_path)
-            
-            # Use list comprehension for better performance
-            text_pages = [page.extract_text() or '' for page in pdf_reader.pages]
-            text = ''.join(text_pages)
+            text = ''.join(ResumeParser.iter_pages(source, parallel=parallel))
             
             if not text.strip():
                 raise Exception("PDF appears to be empty or text extraction failed")
@@ -43,13 +261,16 @@ class ResumeParser:
             return text
         
         except Exception as e:
-            logger.error(f"Error reading PDF file {file_path}: {str(e)}")
+            logger.error(f"Error reading PDF file {ResumeParser._describe(source)}: {str(e)}")
             raise Exception(f"Error reading PDF file: {str(e)}")
     
     @staticmethod
     def clean_text(text: str) -> str:
         """
-        Clean and normalize extracted text with optimized regex
+        Clean and normalize extracted text in a single translate pass
+        
+        Lowercases, replaces characters other than letters, digits, whitespace
+        and ``_ . - + # @`` with spaces, collapses whitespace and strips.
         
         Args:
             text (str): Raw extracted text
@@ -60,33 +281,62 @@ class ResumeParser:
         if not text:
             return ""
         
-        # Convert to lowercase first
-        text = text.lower()
-        
-        # Remove extra whitespace (optimized)
-        text = re.sub(r'\s+', ' ', text)
+        return ' '.join(_translate(text).split())
+    
+    @staticmethod
+    def iter_clean_text(pages: Iterable[str],
+                        max_chars: Optional[int] = None) -> Iterator[str]:
+        """
+        Clean page texts one at a time
         
-        # Remove special characters but keep alphanumeric and common symbols
-        text = re.sub(r'[^\w\s\.\-\+\#\@]', ' ', text)
+        Joining the yielded chunks gives exactly
+        ``clean_text(''.join(pages))``: whitespace spanning a page boundary
+        collapses to one space and the result is stripped at both ends.
         
-        # Remove extra spaces created by character removal
-        text = re.sub(r'\s+', ' ', text)
+        Args:
+            pages: Raw page texts, in order
+            max_chars (int): Stop once this many cleaned characters have been
+                yielded (None = no limit); the last chunk is cut to fit
+            
+        Yields:
+            str: Next chunk of cleaned text
+        """
+        emitted = 0
+        space_pending = False
         
-        return text.strip()
+        for page in pages:
+            if not page:
+                continue
+            text = _translate(page)
+            body = ' '.join(text.split())
+            if not body:
+                space_pending = True
+                continue
+            
+            if emitted and (space_pending or text[0] == ' '):
+                body = ' ' + body
+            # A trailing space is only emitted if more text follows
+            space_pending = text[-1] == ' '
+            
+            if max_chars is not None and emitted + len(body) >= max_chars:
+                yield body[:max_chars - emitted]
+                return
+            emitted += len(body)
+            yield body
     
     @staticmethod
-    def parse_resume(file_path: str) -> Dict[str, Any]:
+    def parse_resume(source: PdfSource) -> Dict[str, Any]:
         """
         Complete resume parsing pipeline
         
         Args:
-            file_path (str): Path to the PDF file
+            source (PdfSource): Path, bytes or file-like object of the PDF
             
         Returns:
             dict: Dictionary with raw and cleaned text
         """
         try:
-            raw_text = ResumeParser.extract_text(file_path)
+            raw_text = ResumeParser.extract_text(source)
             cleaned_text = ResumeParser.clean_text(raw_text)
             
             return {
@@ -103,3 +353,81 @@ class ResumeParser:
                 'cleaned_text': '',
                 'error': str(e)
             }
+    
+    @staticmethod
+    def parse_resume_stream(source: PdfSource,
+                            extractor: Optional[Any] = None,
+                            max_pages: Optional[int] = None,
+                            max_chars: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Streaming parse: pages are extracted, cleaned and handed to an
+        incremental skill extractor one at a time
+        
+        Extraction stops as soon as the page or character budget is reached,
+        so the rest of an oversized document is never decoded. The raw text
+        is not kept.
+        
+        Args:
+            source (PdfSource): Path, bytes or file-like object of the PDF
+            extractor: Object with a ``feed(chunk)`` method (e.g.
+                IncrementalSkillExtractor) receiving each cleaned chunk
+            max_pages (int): Page budget (None = no limit)
+            max_chars (int): Cleaned-character budget (None = no limit)
+            
+        Returns:
+            dict: Cleaned text, pages read, page count and whether the
+            document was cut short by a budget
+        """
+        pages_read = 0
+        page_count = 0
+        
+        def counted(pages: Iterator[str]) -> Iterator[str]:
+            nonlocal pages_read
+            for page in pages:
+                pages_read += 1
+                yield page
+        
+        try:
+            backend = ResumeParser.get_backend()
+            document = backend.open(source)
+            pages = ResumeParser._iter_document_pages(backend, document, source, max_pages, None)
+            page_count = backend.page_count(document)
+            
+            chunks = []
+            for chunk in ResumeParser.iter_clean_text(counted(pages), max_chars):
+                chunks.append(chunk)
+                if extractor is not None:
+                    extractor.feed(chunk)
+            cleaned_text = ''.join(chunks)
+            
+            if not cleaned_text:
+                raise Exception("PDF appears to be empty or text extraction failed")
+            
+            truncated = pages_read < page_count or (
+                max_chars is not None and len(cleaned_text) >= max_chars
+            )
+            if truncated:
+                logger.info(
+                    f"Stopped parsing {ResumeParser._describe(source)} after "
+                    f"{pages_read}/{page_count} pages, {len(cleaned_text)} characters"
+                )
+            
+            return {
+                'success': True,
+                'cleaned_text': cleaned_text,
+                'pages_read': pages_read,
+                'page_count': page_count,
+                'truncated': truncated,
+                'error': None
+            }
+        
+        except Exception as e:
+            logger.error(f"Error reading PDF file {ResumeParser._describe(source)}: {str(e)}")
+            return {
+                'success': False,
+                'cleaned_text': '',
+                'pages_read': pages_read,
+                'page_count': page_count,
+                'truncated': False,
+                'error': f"Error reading PDF file: {str(e)}"
+            }
@@ -0,0 +1,239 @@
+"""
+Scoring Module
+Pluggable match scoring strategies over skill sets and NumPy bitset vectors
+"""
+
+import math
+from numbers import Integral
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+import config
+from utils.exceptions import MatchingError
+
+# Bits per word in the packed skill vectors
+WORD_BITS = 64
+
+if hasattr(np, 'bitwise_count'):
+    def popcount_rows(bitsets: np.ndarray) -> np.ndarray:
+        """Number of set bits in each row of a uint64 bitset matrix"""
+        return np.bitwise_count(bitsets).sum(axis=1, dtype=np.int64)
+else:
+    _POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def popcount_rows(bitsets: np.ndarray) -> np.ndarray:
+        """Number of set bits in each row of a uint64 bitset matrix"""
+        as_bytes = np.ascontiguousarray(bitsets).view(np.uint8)
+        return _POPCOUNT_TABLE[as_bytes].sum(axis=1, dtype=np.int64)
+
+
+class ScoringStrategy:
+    """
+    Base class for match scoring strategies
+
+    Scores are percentages (0-100) computed from the number of matched skills
+    and the sizes of the resume and job skill sets.
+    """
+
+    name = ''
+
+    def score(self, matched: int, resume_count: int, job_count: int) -> float:
+        """
+        Score a single resume against a job
+
+        Args:
+            matched: Number of skills in both sets
+            resume_count: Number of resume skills
+            job_count: Number of job skills
+
+        Returns:
+            float: Match percentage (0-100)
+        """
+        if not job_count or not resume_count:
+            return 0.0
+        return self._ratio(matched, resume_count, job_count) * 100
+
+    def score_many(self, matched: np.ndarray, resume_counts: np.ndarray,
+                   job_count: int) -> np.ndarray:
+        """
+        Score many resumes against one job in a single vectorised call
+
+        Args:
+            matched: Matched skill count per resume
+            resume_counts: Skill count per resume
+            job_count: Number of job skills
+
+        Returns:
+            np.ndarray: Match percentage per resume
+        """
+        scores = np.zeros(len(matched), dtype=np.float64)
+        if not job_count:
+            return scores
+        numerator, denominator = self._fraction(
+            matched.astype(np.float64), resume_counts.astype(np.float64), float(job_count)
+        )
+        np.divide(numerator, denominator, out=scores,
+                  where=(denominator > 0) & (resume_counts > 0))
+        return scores * 100
+
+    def _ratio(self, matched: int, resume_count: int, job_count: int) -> float:
+        numerator, denominator = self._fraction(matched, resume_count, job_count)
+        return numerator / denominator if denominator else 0.0
+
+    def _fraction(self, matched: Any, resume_count: Any, job_count: Any):
+        """Return (numerator, denominator) of the score ratio."""
+        raise NotImplementedError
+
+
+class IntersectionScoring(ScoringStrategy):
+    """Share of the job's required skills found in the resume"""
+
+    name = 'intersection'
+
+    def _fraction(self, matched, resume_count, job_count):
+        return matched, job_count
+
+
+class JaccardScoring(ScoringStrategy):
+    """Size of the intersection over the size of the union"""
+
+    name = 'jaccard'
+
+    def _fraction(self, matched, resume_count, job_count):
+        return matched, resume_count + job_count - matched
+
+
+class CosineScoring(ScoringStrategy):
+    """Cosine similarity of the binary skill vectors"""
+
+    name = 'cosine'
+
+    def _fraction(self, matched, resume_count, job_count):
+        if isinstance(resume_count, np.ndarray):
+            return matched, np.sqrt(resume_count * job_count)
+        return matched, math.sqrt(resume_count * job_count)
+
+
+SCORING_STRATEGIES: Dict[str, ScoringStrategy] = {
+    strategy.name: strategy
+    for strategy in (IntersectionScoring(), JaccardScoring(), CosineScoring())
+}
+
+
+def register_scoring_strategy(strategy: ScoringStrategy) -> None:
+    """Register an additional scoring strategy under its name"""
+    SCORING_STRATEGIES[strategy.name] = strategy
+
+
+def get_scoring_strategy(method: Optional[str] = None) -> ScoringStrategy:
+    """
+    Get a scoring strategy by name
+
+    Args:
+        method: Strategy name; defaults to config.MATCHING_METHOD
+
+    Returns:
+        ScoringStrategy instance
+
+    Raises:
+        MatchingError: If the method is unknown
+    """
+    method = method or config.MATCHING_METHOD
+    strategy = SCORING_STRATEGIES.get(method)
+    if strategy is None:
+        raise MatchingError(
+            f"Unknown matching method '{method}'. "
+            f"Options: {', '.join(sorted(SCORING_STRATEGIES))}"
+        )
+    return strategy
+
+
+def encode_skill_sets(skill_sets: Sequence[Iterable[Any]], vocab_size: int) -> np.ndarray:
+    """
+    Encode skill-ID sets as packed uint64 bitsets over the skill vocabulary
+
+    Every key needs a slot in the vocabulary. Names that
+    SkillMatcher.to_skill_ids could not resolve stay strings; give them IDs
+    past the taxonomy first (as SkillMatcher.score_many does) so they are
+    scored the way match_skill_sets scores them.
+
+    Args:
+        skill_sets: One iterable of canonical skill IDs per row
+        vocab_size: Number of skills in the taxonomy
+
+    Returns:
+        np.ndarray: Matrix of shape (len(skill_sets), ceil(vocab_size / 64))
+
+    Raises:
+        ValueError: If a key is not an integer in [0, vocab_size)
+    """
+    words = max(1, -(-vocab_size // WORD_BITS))
+    bitsets = np.zeros((len(skill_sets), words), dtype=np.uint64)
+
+    rows = []
+    ids = []
+    for row, skill_ids in enumerate(skill_sets):
+        for skill_id in skill_ids:
+            if not isinstance(skill_id, Integral) or not 0 <= skill_id < vocab_size:
+                raise ValueError(f"Skill key {skill_id!r} is not an ID below {vocab_size}")
+            rows.append(row)
+            ids.append(skill_id)
+
+    if ids:
+        ids = np.asarray(ids, dtype=np.uint64)
+        bits = np.left_shift(np.uint64(1), ids % np.uint64(WORD_BITS))
+        np.bitwise_or.at(bitsets, (np.asarray(rows), (ids // np.uint64(WORD_BITS)).astype(np.intp)), bits)
+    return bitsets
+
+
+class SkillVectors:
+    """
+    Bitset-encoded skill sets for vectorised scoring
+
+    Encode a corpus of resumes once, then score any job against all of them
+    with one AND + popcount over the packed matrix.
+    """
+
+    def __init__(self, bitsets: np.ndarray, vocab_size: int):
+        self.bitsets = bitsets
+        self.vocab_size = vocab_size
+        self.counts = popcount_rows(bitsets)
+
+    @classmethod
+    def from_skill_sets(cls, skill_sets: Sequence[Iterable[Any]],
+                        vocab_size: int) -> 'SkillVectors':
+        """
+        Build vectors from canonical skill-ID sets
+
+        Args:
+            skill_sets: One iterable of canonical skill IDs per resume
+            vocab_size: Number of skills in the taxonomy
+
+        Returns:
+            SkillVectors instance
+        """
+        return cls(encode_skill_sets(skill_sets, vocab_size), vocab_size)
+
+    def __len__(self) -> int:
+        return len(self.bitsets)
+
+    def matched_counts(self, job_ids: Iterable[Any]) -> np.ndarray:
+        """Number of job skills present in each encoded set"""
+        job_bits = encode_skill_sets([job_ids], self.vocab_size)[0]
+        return popcount_rows(self.bitsets & job_bits)
+
+    def score(self, job_ids: Iterable[Any], method: Optional[str] = None) -> np.ndarray:
+        """
+        Score every encoded resume against a job
+
+        Args:
+            job_ids: Canonical skill IDs required by the job
+            method: Scoring strategy name (default: config.MATCHING_METHOD)
+
+        Returns:
+            np.ndarray: Match percentage per resume, in row order
+        """
+        job_ids = list(job_ids)
+        strategy = get_scoring_strategy(method)
+        return strategy.score_many(self.matched_counts(job_ids), self.counts, len(job_ids))
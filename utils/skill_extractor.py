@@ -3,9 +3,12 @@ Skill Extractor Module
 Extracts technical skills from text using optimized keyword matching
 """
 
-import re
-from typing import List, Set
-from functools import lru_cache
+import hashlib
+from typing import Any, FrozenSet, List, Optional, Set, Union
+
+import config
+from utils.cache import SharedCache, SimpleCache, TieredCache
+from utils.skill_taxonomy import SkillTaxonomy, TaxonomyEntry, TaxonomyManager
 
 
 class SkillExtractor:
@@ -18,11 +21,11 @@ class SkillExtractor:
         # Programming Languages
         'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby',
         'go', 'rust', 'kotlin', 'swift', 'r', 'matlab', 'perl', 'scala', 'groovy',
-        'objective-c', 'dart', 'elixir', 'haskell', 'clojure', 'lua', 'vb', 'visual basic',
+        'objective-c', 'dart', 'elixir', 'haskell', 'clojure', 'lua', 'visual basic',
         
         # Web Development
         'html', 'css', 'react', 'vue', 'angular', 'flask', 'django', 'fastapi',
-        'express', 'nodejs', 'node.js', 'asp.net', 'laravel', 'spring', 'spring boot',
+        'express', 'node.js', 'asp.net', 'laravel', 'spring', 'spring boot',
         'wordpress', 'shopify', 'next.js', 'nuxt', 'svelte', 'jquery', 'bootstrap',
         'tailwind', 'material ui', 'webpack', 'gulp', 'grunt', 'npm', 'yarn', 'pnpm',
         
@@ -40,7 +43,7 @@ class SkillExtractor:
         'aws lambda', 'ec2', 's3', 'rds', 'cloudwatch', 'cloudformation',
         
         # Data Science & ML
-        'machine learning', 'ml', 'deep learning', 'tensorflow', 'pytorch', 'keras',
+        'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras',
         'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter',
         'nltk', 'spacy', 'computer vision', 'nlp', 'neural networks', 'opencv',
         'xgboost', 'lightgbm', 'catboost',
@@ -57,7 +60,7 @@ class SkillExtractor:
         'testng', 'rspec', 'qunit', 'karma', 'robotframework',
         
         # APIs & Services
-        'rest', 'restful', 'graphql', 'soap', 'microservices', 'api',
+        'rest', 'graphql', 'soap', 'microservices', 'api',
         'grpc', 'websocket', 'openapi', 'swagger',
         
         # Agile & Collaboration
@@ -71,11 +74,47 @@ class SkillExtractor:
         'security', 'ssl', 'oauth', 'jwt', 'authentication', 'encryption'
     }
     
+    # Alternate spellings mapped to their canonical entry in TECHNICAL_SKILLS.
+    # Abbreviations common outside tech are left out ('ts' matches TS/SCI
+    # clearances and time-series work far more often than TypeScript)
+    SKILL_ALIASES = {
+        'nodejs': 'node.js',
+        'postgres': 'postgresql', 'psql': 'postgresql',
+        'k8s': 'kubernetes',
+        'golang': 'go',
+        'js': 'javascript',
+        'reactjs': 'react', 'react.js': 'react',
+        'vuejs': 'vue', 'vue.js': 'vue',
+        'nextjs': 'next.js', 'nuxtjs': 'nuxt', 'nuxt.js': 'nuxt',
+        'expressjs': 'express', 'express.js': 'express',
+        'mongo': 'mongodb',
+        'amazon web services': 'aws', 'google cloud': 'gcp',
+        'google cloud platform': 'gcp', 'microsoft azure': 'azure',
+        'ci cd': 'ci/cd', 'cicd': 'ci/cd',
+        'sklearn': 'scikit-learn', 'scikit learn': 'scikit-learn',
+        'ml': 'machine learning', 'natural language processing': 'nlp',
+        'restful': 'rest', 'rest api': 'rest', 'restful api': 'rest',
+        'vb': 'visual basic', 'tailwindcss': 'tailwind',
+        'elastic search': 'elasticsearch', 'rabbit mq': 'rabbitmq',
+    }
+    
+    @staticmethod
+    def get_taxonomy() -> SkillTaxonomy:
+        """
+        Get the active compiled skill taxonomy
+        
+        Returns:
+            SkillTaxonomy: Current matching index
+        """
+        return taxonomy_manager.current
+    
     @staticmethod
-    @lru_cache(maxsize=128)
     def extract_keywords(text: str) -> Set[str]:
         """
-        Extract skills from text using optimized keyword matching with caching
+        Extract canonical skills from text in a single pass with caching
+        
+        A skill matches only when delimited by spaces or the start/end of
+        the text; aliases are reported under their canonical name.
         
         Args:
             text (str): Cleaned text to extract skills from
@@ -83,20 +122,40 @@ class SkillExtractor:
         Returns:
             Set[str]: Set of extracted skills
         """
-        text_lower = text.lower()
-        extracted_skills = set()
+        taxonomy = taxonomy_manager.current
+        return taxonomy.to_names(SkillExtractor._extract_with(text, taxonomy))
+    
+    @staticmethod
+    def extract_skill_ids(text: str,
+                          taxonomy: Optional[SkillTaxonomy] = None) -> FrozenSet[int]:
+        """
+        Extract canonical skill IDs from text
         
-        # Optimized: compile pattern once and search
-        for skill in SkillExtractor.TECHNICAL_SKILLS:
-            # Use word boundaries to match whole skills only
-            if f' {skill} ' in f' {text_lower} ' or text_lower.startswith(f'{skill} ') or text_lower.endswith(f' {skill}'):
-                extracted_skills.add(skill)
-            elif '\\b' in skill:  # For regex special cases
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    extracted_skills.add(skill)
+        Args:
+            text (str): Cleaned text to extract skills from
+            taxonomy (SkillTaxonomy): Taxonomy the IDs belong to; defaults to
+                the active one. Pass the same instance to SkillMatcher.
+            
+        Returns:
+            FrozenSet[int]: Canonical skill IDs found in the text
+        """
+        return SkillExtractor._extract_with(text, taxonomy or taxonomy_manager.current)
+    
+    @staticmethod
+    def _extract_with(text: str, taxonomy: SkillTaxonomy) -> FrozenSet[int]:
+        """
+        Cached extraction; keyed on the taxonomy so reloads are never stale
         
-        return extracted_skills
+        The key is a digest of the text, so cached entries do not keep
+        resume texts alive, and the cached frozenset cannot be mutated.
+        """
+        text_digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+        cache_key = f'{taxonomy.fingerprint}:{text_digest}'
+        skill_ids = skill_cache.get(cache_key)
+        if skill_ids is None:
+            skill_ids = frozenset(taxonomy.extract_ids(text.lower()))
+            skill_cache.set(cache_key, skill_ids)
+        return skill_ids
     
     @staticmethod
     def extract_skills(text: str) -> List[str]:
@@ -141,3 +200,83 @@ class SkillExtractor:
             List[str]: List of required skills for the job
         """
         return SkillExtractor.extract_skills(job_text)
+
+
+
+class IncrementalSkillExtractor:
+    """
+    Extracts skill IDs from text that arrives in chunks (e.g. page by page)
+    
+    Chunks are concatenated as-is, so a word split across two chunks is
+    rejoined before matching. The result equals extracting from the joined
+    text, without ever holding it in memory.
+    """
+    
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None):
+        """
+        Initialize incremental extractor
+        
+        Args:
+            taxonomy (SkillTaxonomy): Taxonomy the IDs belong to; defaults to
+                the active one
+        """
+        self.taxonomy = taxonomy or taxonomy_manager.current
+        self._found: Set[Any] = set()
+        self._state = 0
+        self._pending = ''
+    
+    def feed(self, chunk: str) -> None:
+        """
+        Scan the next chunk of cleaned text
+        
+        Args:
+            chunk (str): Text continuing directly after the previous chunk
+        """
+        words = (self._pending + chunk.lower()).split(' ')
+        # The last word may continue in the next chunk
+        self._pending = words.pop()
+        self._state = self.taxonomy.automaton.scan(words, self._found, self._state)
+    
+    def finish(self) -> FrozenSet[int]:
+        """
+        Flush the trailing word and get the skills found
+        
+        Returns:
+            FrozenSet[int]: Canonical skill IDs found in all chunks
+        """
+        if self._pending:
+            self._state = self.taxonomy.automaton.scan(
+                (self._pending,), self._found, self._state
+            )
+            self._pending = ''
+        return frozenset(self._found)
+
+
+# Active skill taxonomy, hot-reloaded from config.SKILL_TAXONOMY_PATH when set
+taxonomy_manager = TaxonomyManager(
+    path=config.SKILL_TAXONOMY_PATH,
+    default_entries=(
+        TaxonomyEntry(
+            name=skill,
+            aliases=tuple(
+                alias for alias, canonical in SkillExtractor.SKILL_ALIASES.items()
+                if canonical == skill
+            )
+        )
+        for skill in SkillExtractor.TECHNICAL_SKILLS | config.CUSTOM_SKILLS
+    ),
+    reload_interval=config.SKILL_TAXONOMY_RELOAD_INTERVAL
+)
+
+# Extracted skill IDs keyed by taxonomy fingerprint and text digest (shared
+# between workers when SHARED_CACHE_DIR is set)
+skill_cache: Union[SimpleCache, TieredCache] = SimpleCache(
+    default_ttl=config.SKILL_CACHE_TTL,
+    max_entries=config.SKILL_CACHE_SIZE
+)
+if config.SHARED_CACHE_DIR:
+    skill_cache = TieredCache(skill_cache, SharedCache(
+        config.SHARED_CACHE_DIR,
+        default_ttl=config.SKILL_CACHE_TTL,
+        max_bytes=config.SHARED_CACHE_MAX_BYTES
+    ))
@@ -0,0 +1,392 @@
+"""
+Skill Taxonomy Module
+Loads skills, categories and aliases from JSON/YAML/CSV files and compiles
+them into an immutable matching index that can be hot-swapped at runtime
+"""
+
+import csv
+import hashlib
+import json
+import os
+import threading
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from utils.aho_corasick import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+# Separator for multiple aliases in a single CSV cell
+CSV_ALIAS_SEPARATOR = '|'
+
+
+class TaxonomyError(Exception):
+    """Raised when a taxonomy file cannot be loaded"""
+    pass
+
+
+@dataclass(frozen=True)
+class TaxonomyEntry:
+    """A single canonical skill with its category and surface-form aliases"""
+    name: str
+    category: Optional[str] = None
+    aliases: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, eq=False)
+class SkillTaxonomy:
+    """
+    Immutable, precompiled skill matching index
+
+    Every canonical skill gets a compact integer ID (its position in the
+    sorted ``names`` tuple). Canonical names and aliases are compiled into
+    one automaton that emits IDs directly, so surface forms such as "k8s"
+    and "kubernetes" are unified during the extraction pass. IDs are only
+    meaningful for the taxonomy instance that produced them.
+
+    Instances are never modified after construction; a reload builds a new
+    instance and swaps the reference, so requests holding the old one finish
+    against a consistent index.
+    """
+    names: Tuple[str, ...]
+    ids: Mapping[str, int]
+    categories: Mapping[str, str]
+    aliases: Mapping[str, str]
+    automaton: AhoCorasick
+    fingerprint: str = ''
+    source: Optional[str] = None
+    loaded_at: Optional[datetime] = None
+
+    @classmethod
+    def compile(cls, entries: Iterable[TaxonomyEntry],
+                source: Optional[str] = None) -> 'SkillTaxonomy':
+        """
+        Compile taxonomy entries into a matching index
+
+        Args:
+            entries: Canonical skills with optional category and aliases
+            source: Where the entries came from (file path), for reporting
+
+        Returns:
+            SkillTaxonomy: Compiled index
+
+        Raises:
+            TaxonomyError: If an alias is given for two different skills
+        """
+        skills: Set[str] = set()
+        categories: Dict[str, str] = {}
+        aliases: Dict[str, str] = {}
+
+        for entry in entries:
+            name = _normalise(entry.name)
+            if not name:
+                continue
+            skills.add(name)
+            if entry.category:
+                categories[name] = entry.category
+            for alias in entry.aliases:
+                alias = _normalise(alias)
+                if alias and alias != name:
+                    if aliases.get(alias, name) != name:
+                        raise TaxonomyError(
+                            f"Alias '{alias}' maps to both '{aliases[alias]}' and '{name}'"
+                        )
+                    aliases[alias] = name
+
+        # A canonical name always wins over an alias with the same spelling,
+        # and aliases must point at a known skill
+        aliases = {
+            alias: name for alias, name in aliases.items()
+            if alias not in skills and name in skills
+        }
+
+        names = tuple(sorted(skills))
+        ids = {name: skill_id for skill_id, name in enumerate(names)}
+        ids.update((alias, ids[name]) for alias, name in aliases.items())
+
+        # Identifies the name -> ID mapping, so IDs stored elsewhere (caches,
+        # other processes) can be checked against the active taxonomy
+        fingerprint = hashlib.sha256(
+            json.dumps(sorted(ids.items())).encode('utf-8')
+        ).hexdigest()
+
+        return cls(
+            names=names,
+            ids=MappingProxyType(ids),
+            categories=MappingProxyType(categories),
+            aliases=MappingProxyType(aliases),
+            automaton=AhoCorasick(ids.items()),
+            fingerprint=fingerprint,
+            source=source,
+            loaded_at=datetime.now()
+        )
+
+    @property
+    def skills(self) -> FrozenSet[str]:
+        """All canonical skill names"""
+        return frozenset(self.names)
+
+    def extract_ids(self, text: str) -> FrozenSet[int]:
+        """
+        Find canonical skill IDs in lowercased text
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Frozen set of canonical skill IDs
+        """
+        return frozenset(self.automaton.search(text))
+
+    def extract(self, text: str) -> Set[str]:
+        """
+        Find canonical skills in lowercased text
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Set of canonical skill names
+        """
+        return self.to_names(self.automaton.search(text))
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """
+        Resolve a skill name or alias to its canonical ID
+
+        Args:
+            skill: Skill name in any case
+
+        Returns:
+            Canonical ID, or None if the skill is unknown
+        """
+        skill_id = self.ids.get(skill)
+        if skill_id is None:
+            skill_id = self.ids.get(_normalise(skill))
+        return skill_id
+
+    def canonical_name(self, skill: str) -> str:
+        """Get the canonical spelling of a skill (lowercased input if unknown)"""
+        skill_id = self.skill_id(skill)
+        return self.names[skill_id] if skill_id is not None else _normalise(skill)
+
+    def to_names(self, skill_ids: Iterable[int]) -> Set[str]:
+        """Convert canonical IDs back into skill names"""
+        names = self.names
+        return {names[skill_id] for skill_id in skill_ids}
+
+    def get_category(self, skill: str) -> Optional[str]:
+        """Get the category of a canonical skill"""
+        return self.categories.get(self.canonical_name(skill))
+
+
+def _normalise(value: Any) -> str:
+    """Lowercase and collapse whitespace in a skill or alias name."""
+    return ' '.join(str(value).lower().split()) if value is not None else ''
+
+
+def _entries_from_records(records: Any) -> List[TaxonomyEntry]:
+    """Convert parsed JSON/YAML records into taxonomy entries."""
+    if isinstance(records, dict):
+        records = records.get('skills', [])
+    if not isinstance(records, list):
+        raise TaxonomyError("Taxonomy must be a list of skills or an object with a 'skills' list")
+
+    entries = []
+    for record in records:
+        if isinstance(record, str):
+            entries.append(TaxonomyEntry(name=record))
+        elif isinstance(record, dict) and record.get('name'):
+            aliases = record.get('aliases') or ()
+            if isinstance(aliases, str):
+                aliases = (aliases,)
+            entries.append(TaxonomyEntry(
+                name=record['name'],
+                category=record.get('category'),
+                aliases=tuple(aliases)
+            ))
+        else:
+            raise TaxonomyError(f"Invalid taxonomy record: {record!r}")
+    return entries
+
+
+def _read_json(path: str) -> List[TaxonomyEntry]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return _entries_from_records(json.load(f))
+
+
+def _read_yaml(path: str) -> List[TaxonomyEntry]:
+    try:
+        import yaml
+    except ImportError:
+        raise TaxonomyError("PyYAML is required to load YAML taxonomies (pip install pyyaml)")
+    with open(path, 'r', encoding='utf-8') as f:
+        return _entries_from_records(yaml.safe_load(f))
+
+
+def _read_csv(path: str) -> List[TaxonomyEntry]:
+    entries = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            name = row.get('name') or row.get('skill')
+            if not name:
+                continue
+            aliases = row.get('aliases') or ''
+            entries.append(TaxonomyEntry(
+                name=name,
+                category=row.get('category') or None,
+                aliases=tuple(a for a in aliases.split(CSV_ALIAS_SEPARATOR) if a.strip())
+            ))
+    return entries
+
+
+TAXONOMY_READERS = {
+    '.json': _read_json,
+    '.yaml': _read_yaml,
+    '.yml': _read_yaml,
+    '.csv': _read_csv,
+}
+
+
+def load_taxonomy(path: str) -> SkillTaxonomy:
+    """
+    Load and compile a taxonomy file
+
+    Supported formats (chosen by extension):
+        - JSON/YAML: ``{"skills": [{"name": ..., "category": ..., "aliases": [...]}]}``
+          or a bare list of such records / skill names
+        - CSV: header ``name,category,aliases`` with aliases separated by ``|``
+
+    Args:
+        path: Path to the taxonomy file
+
+    Returns:
+        SkillTaxonomy: Compiled index
+
+    Raises:
+        TaxonomyError: If the file is missing, malformed or of unknown type
+    """
+    extension = os.path.splitext(path)[1].lower()
+    reader = TAXONOMY_READERS.get(extension)
+    if reader is None:
+        raise TaxonomyError(f"Unsupported taxonomy format: {extension or path}")
+
+    try:
+        entries = reader(path)
+    except TaxonomyError:
+        raise
+    except (OSError, ValueError) as e:
+        raise TaxonomyError(f"Failed to load taxonomy {path}: {str(e)}")
+
+    return SkillTaxonomy.compile(entries, source=path)
+
+
+class TaxonomyManager:
+    """
+    Holds the active taxonomy and swaps in a rebuilt index when its file changes
+
+    Readers take ``manager.current`` once per request; reloads compile the new
+    index off to the side and replace the reference in a single assignment.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 default_entries: Iterable[TaxonomyEntry] = (),
+                 reload_interval: float = 5.0):
+        """
+        Initialize taxonomy manager
+
+        Args:
+            path: Taxonomy file; if None the default entries are used
+            default_entries: Entries compiled when no file is configured
+            reload_interval: Seconds between file change checks
+        """
+        self.path = path
+        self.default_entries = tuple(default_entries)
+        self.reload_interval = reload_interval
+        self._taxonomy: Optional[SkillTaxonomy] = None
+        self._signature: Optional[Tuple[float, int]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    @property
+    def current(self) -> SkillTaxonomy:
+        """Get the active taxonomy, compiling it on first use"""
+        taxonomy = self._taxonomy
+        if taxonomy is None:
+            with self._lock:
+                if self._taxonomy is None:
+                    self._taxonomy = self._build()
+                taxonomy = self._taxonomy
+        return taxonomy
+
+    def _file_signature(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def _build(self) -> SkillTaxonomy:
+        if not self.path:
+            return SkillTaxonomy.compile(self.default_entries)
+        # Taken before loading so a change made during the load is seen by
+        # the next check, but only recorded once the file loaded cleanly:
+        # a failed load is retried until it succeeds
+        signature = self._file_signature()
+        taxonomy = load_taxonomy(self.path)
+        self._signature = signature
+        logger.info(f"Loaded skill taxonomy from {self.path} ({len(taxonomy.skills)} skills)")
+        return taxonomy
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Rebuild the index if the taxonomy file changed
+
+        A file that fails to load is logged and the previous index stays active.
+
+        Args:
+            force: Rebuild even if the file appears unchanged
+
+        Returns:
+            True if a new index was swapped in
+        """
+        if not self.path:
+            return False
+
+        with self._lock:
+            if not force and self._taxonomy is not None and self._file_signature() == self._signature:
+                return False
+            try:
+                taxonomy = self._build()
+            except TaxonomyError as e:
+                logger.error(f"Skill taxonomy reload failed, keeping previous index: {str(e)}")
+                return False
+            self._taxonomy = taxonomy
+            return True
+
+    def start_watching(self) -> None:
+        """Start a daemon thread that reloads the taxonomy when the file changes"""
+        if not self.path or (self._watcher and self._watcher.is_alive()):
+            return
+
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, name='skill-taxonomy-watcher', daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the file watcher thread"""
+        self._stop.set()
+        if self._watcher:
+            self._watcher.join(timeout=self.reload_interval + 1)
+            self._watcher = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.reload_interval):
+            self.reload()